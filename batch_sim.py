@@ -0,0 +1,214 @@
+import sys
+import time
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # Only this tool needs NumPy; the game and simulate.py run without it
+    np = None
+
+from board import ISLAND, OCTOPUS
+from engine import Rules, build_player_routes
+from simulate import (build_parser, settings_from_args, chunk_plan, iter_chunk_stats, new_stats, merge_stats,
+                      summarize, write_report)
+
+DEFAULT_BATCH_SIZE = 100000  # Games advanced together; memory is about rows * cols bytes per game
+REFLECTION = 0  # Card type columns of the card count arrays
+COPING = 1
+CROSS_CHECK_KS = 1.63  # Kolmogorov-Smirnov coefficient for a 1% false alarm rate
+CROSS_CHECK_HISTOGRAMS = ('turns_to_win', 'exchanges', 'reflection_cards', 'coping_cards')
+
+def random_cell_table(rng, games, cells, islands, octopuses, reserved=()):
+    """One board per row as a games x cells byte table, placed like generate_board with min_spacing 1"""
+    count = islands + octopuses
+    if count > cells - len(reserved):
+        raise ValueError(f"Cannot place {count} pieces on {cells} cells with {len(reserved)} start cells")
+    # Every game draws a random key per cell; its lowest keys pick the pieces, start cells never win
+    keys = rng.random((games, cells))
+    keys[:, list(reserved)] = 2.0
+    picks = np.argpartition(keys, count - 1, axis=1)[:, :count] if count else np.empty((games, 0), np.intp)
+    table = np.zeros((games, cells), dtype=np.uint8)
+    rows = np.arange(games)[:, None]
+    table[rows, picks[:, :islands]] = ISLAND
+    table[rows, picks[:, islands:]] = OCTOPUS
+    return table
+
+def board_cell_table(boards):
+    """Byte table of existing boards' cells, one board per row"""
+    return np.stack([np.frombuffer(bytes(board.cells), dtype=np.uint8) for board in boards])
+
+def route_table(rows, cols):
+    """Flat cell index of each player's route position, as a 2 x cells table (row 0 is player 1)"""
+    routes = build_player_routes(rows, cols)
+    return np.stack([np.fromiter(routes[player].cells, dtype=np.intp, count=routes[player].length)
+                     for player in (1, 2)])
+
+def play_batch(rng, cell_table, routes, players, rules, max_turns):
+    """Play every game of a cell table to the end at once, one turn for all running games per step
+
+    Follows GameState with simulate.py's automatic policy: boats meeting comes before the cell,
+    islands give reflection cards and octopuses coping cards, full piles discard, and the mover wins
+    at the rules' thresholds. Returns (turns, exchanges, winner, cards) arrays, winner 0 for stalled games.
+    """
+    games, cells = cell_table.shape
+    positions = np.zeros((games, 2), dtype=np.intp)  # Route positions by player
+    cards = np.zeros((games, 2, 2), dtype=np.int32)  # Card counts by player and card type
+    current = np.zeros(games, dtype=np.intp)  # 0 for player 1, 1 for player 2
+    turns = np.zeros(games, dtype=np.int32)
+    exchanges = np.zeros(games, dtype=np.int32)
+    winner = np.zeros(games, dtype=np.int8)
+    running = np.arange(games)
+
+    limits = np.array([rules.card_limits['reflection'], rules.card_limits['coping']])
+    win_reflection = rules.win_reflection_cards
+    win_coping = rules.win_coping_cards
+    unlock = rules.coping_unlock_reflection
+
+    while running.size:
+        running = running[turns[running] < max_turns]
+        if not running.size:
+            break
+        player = current[running]
+        turns[running] += 1
+        position = (positions[running, player] + rng.integers(1, rules.dice_sides + 1, running.size)) % cells
+        positions[running, player] = position
+        cell = routes[player, position]
+        mine = cards[running, player]  # Copy taken before this turn's card changes
+        everyone = np.arange(running.size)
+
+        if players == 2:
+            other = 1 - player
+            met = cell == routes[other, positions[running, other]]
+        else:
+            met = np.zeros(running.size, dtype=bool)
+
+        if met.any():
+            # Take what the mover still lacks to win from the other boat, reflection first
+            meeting = everyone[met]
+            theirs = cards[running[meeting], other[meeting]]
+            own = mine[meeting]
+            want_reflection = (own[:, REFLECTION] < win_reflection) & (theirs[:, REFLECTION] > 0)
+            want_coping = ~want_reflection & (own[:, COPING] < win_coping) & (theirs[:, COPING] > 0)
+            card_type = np.where(want_reflection, REFLECTION, COPING)
+            taken = ((want_reflection | want_coping)
+                     & (own[np.arange(meeting.size), card_type] < limits[card_type]))
+            game = running[meeting[taken]]
+            cards[game, player[meeting[taken]], card_type[taken]] += 1
+            cards[game, other[meeting[taken]], card_type[taken]] -= 1
+            exchanges[running[meeting]] += 1
+
+        kind = cell_table[running, cell]
+        reflection = mine[:, REFLECTION]
+        drawn_reflection = ~met & (kind == ISLAND) & (reflection < unlock)
+        drawn_coping = ~met & (kind == OCTOPUS) & (reflection >= unlock)
+        card_type = np.where(drawn_coping, COPING, REFLECTION)
+        collected = (drawn_reflection | drawn_coping) & (mine[everyone, card_type] < limits[card_type])
+        cards[running[collected], player[collected], card_type[collected]] += 1
+
+        # Only the mover's cards can have grown, so only the mover can have just won
+        after = cards[running, player]
+        won = (after[:, REFLECTION] >= win_reflection) & (after[:, COPING] >= win_coping)
+        winner[running[won]] = player[won] + 1
+        if players == 2:
+            current[running] = 1 - player
+        running = running[~won]
+
+    return turns, exchanges, winner, cards
+
+def value_counts(values):
+    """Counter of the values in an array"""
+    found, counts = np.unique(values, return_counts=True)
+    return Counter(dict(zip(found.tolist(), counts.tolist())))
+
+def batch_stats(turns, exchanges, winner, cards, players):
+    """simulate.py statistics counted from play_batch's arrays"""
+    stats = new_stats()
+    finished = winner > 0
+    stats['games'] = int(winner.size)
+    stats['finished'] = int(finished.sum())
+    stats['wins'] = value_counts(winner[finished])
+    stats['turns_to_win'] = value_counts(turns[finished])
+    stats['exchanges'] = value_counts(exchanges)
+    stats['reflection_cards'] = value_counts(cards[:, :players, REFLECTION])
+    stats['coping_cards'] = value_counts(cards[:, :players, COPING])
+    return stats
+
+def run_batches(settings, batch_size, quiet=True):
+    """Play settings['games'] games in batches and count up the results"""
+    rng = np.random.default_rng(settings['seed'])
+    rows, cols = settings['rows'], settings['cols']
+    routes = route_table(rows, cols)
+    reserved = {int(routes[0, 0]), int(routes[1, 0])}
+    rules = Rules(**settings['rules'])
+    stats = new_stats()
+    left = settings['games']
+    while left > 0:
+        games = min(batch_size, left)
+        table = random_cell_table(rng, games, rows * cols, settings['islands'], settings['octopuses'], reserved)
+        results = play_batch(rng, table, routes, settings['players'], rules, settings['max_turns'])
+        merge_stats(stats, batch_stats(*results, settings['players']))
+        left -= games
+        if not quiet:
+            print(f"\r{stats['games']}/{settings['games']} games, {stats['finished']} won", end='', file=sys.stderr)
+    if not quiet:
+        print(file=sys.stderr)
+    return stats
+
+def ks_statistic(first, second):
+    """Largest gap between the cumulative distributions of two histograms"""
+    first_total = sum(first.values())
+    second_total = sum(second.values())
+    if not first_total or not second_total:
+        return 0.0 if first_total == second_total else 1.0
+    gap = 0.0
+    first_seen = second_seen = 0
+    for value in sorted(set(first) | set(second)):
+        first_seen += first[value]
+        second_seen += second[value]
+        gap = max(gap, abs(first_seen / first_total - second_seen / second_total))
+    return gap
+
+def cross_check(batch, scalar):
+    """Compare the batch and scalar engines' histograms; returns whether they all agree"""
+    agree = True
+    print(f"{'histogram':<18}{'batch mean':>12}{'engine mean':>13}{'KS':>8}{'limit':>8}", file=sys.stderr)
+    for key in CROSS_CHECK_HISTOGRAMS:
+        first, second = batch[key], scalar[key]
+        n, m = sum(first.values()), sum(second.values())
+        limit = CROSS_CHECK_KS * ((n + m) / (n * m)) ** 0.5 if n and m else 0.0
+        statistic = ks_statistic(first, second)
+        means = [sum(value * count for value, count in h.items()) / max(1, sum(h.values())) for h in (first, second)]
+        ok = statistic <= limit
+        agree = agree and ok
+        print(f"{key:<18}{means[0]:>12.3f}{means[1]:>13.3f}{statistic:>8.4f}{limit:>8.4f}{'' if ok else '  MISMATCH'}",
+              file=sys.stderr)
+    win_rates = [stats['finished'] / stats['games'] for stats in (batch, scalar)]
+    print(f"{'win rate':<18}{win_rates[0]:>12.3f}{win_rates[1]:>13.3f}", file=sys.stderr)
+    return agree
+
+def main(argv=None):
+    parser = build_parser("Play many games at once as NumPy arrays and report card and turn statistics")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="games advanced together")
+    parser.add_argument('--cross-check', action='store_true',
+                        help="also play the games on the scalar engine (with --workers) and compare the distributions")
+    args = parser.parse_args(argv)
+    if np is None:
+        print("batch_sim.py needs NumPy: pip install numpy")
+        sys.exit(1)
+    settings = settings_from_args(args)
+
+    start = time.perf_counter()
+    stats = run_batches(settings, max(1, args.batch_size), args.quiet)
+    report = summarize(stats, settings, time.perf_counter() - start)
+    write_report(report, args.output, args.format)
+
+    if args.cross_check:
+        scalar = new_stats()
+        for part in iter_chunk_stats(chunk_plan(settings['seed'], args.games, max(1, args.chunk_size)),
+                                     settings, args.workers):
+            merge_stats(scalar, part)
+        if not cross_check(stats, scalar):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+import random
+
+try:
+    import mmap
+except ImportError:  # Not every platform build ships it; boards then always use a bytearray
+    mmap = None
+
+# Cell types, stored one byte per cell
+EMPTY = 0
+ISLAND = 1
+OCTOPUS = 2
+CELL_NAMES = {EMPTY: None, ISLAND: 'island', OCTOPUS: 'octopus'}
+LAZY_CELLS_MIN = 1 << 22  # Boards with this many cells get zero pages mapped on use instead of zero-filled up front
+SPACED_ATTEMPTS_PER_CELL = 100  # Draws allowed per piece before spaced placement gives up
+
+def allocate_cells(size):
+    """Zeroed, writable cell storage of a given size"""
+    if mmap is not None and size >= LAZY_CELLS_MIN:
+        return mmap.mmap(-1, size)
+    return bytearray(size)
+
+def hex_distance(a, b):
+    """Steps between two (row, col) cells of the grid, whose odd rows are shifted right"""
+    (row1, col1), (row2, col2) = a, b
+    dx = (col1 - (row1 - (row1 & 1)) // 2) - (col2 - (row2 - (row2 & 1)) // 2)
+    dz = row1 - row2
+    return max(abs(dx), abs(dz), abs(dx + dz))
+
+class Board:
+    """Hex board of cell types kept in one flat row-major byte buffer"""
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.cells = allocate_cells(rows * cols)
+        # Occupied cells by type, in placement order (dicts give O(1) removal)
+        self.occupied = {ISLAND: {}, OCTOPUS: {}}
+        self.version = 0  # Bumped on every change so renderers can key their caches on it
+        self.seed = None  # Seed the layout was generated from, if any
+
+    def index(self, row, col):
+        """Flat index of a cell"""
+        return row * self.cols + col
+
+    def position(self, index):
+        """(row, col) of a flat index"""
+        return divmod(index, self.cols)
+
+    def cell_at(self, row, col):
+        """Cell type at a position"""
+        return self.cells[row * self.cols + col]
+
+    def cell_at_index(self, index):
+        """Cell type at a flat index"""
+        return self.cells[index]
+
+    def is_empty(self, row, col):
+        """Whether nothing has been placed on a cell"""
+        return self.cells[row * self.cols + col] == EMPTY
+
+    def set_cell(self, row, col, cell_type):
+        """Place a cell type (EMPTY clears the cell)"""
+        index = row * self.cols + col
+        old = self.cells[index]
+        if old == cell_type:
+            return
+        if old != EMPTY:
+            del self.occupied[old][index]
+        if cell_type != EMPTY:
+            self.occupied[cell_type][index] = None
+        self.cells[index] = cell_type
+        self.version += 1
+
+    def count(self, cell_type):
+        """Number of cells of a type"""
+        return len(self.occupied[cell_type])
+
+    def occupied_cells(self, cell_type=None):
+        """Yield (row, col, cell_type) for every placed cell, or only those of one type"""
+        types = self.occupied if cell_type is None else (cell_type,)
+        for kind in types:
+            for index in self.occupied[kind]:
+                row, col = divmod(index, self.cols)
+                yield row, col, kind
+
+class Route:
+    """A fixed path over the board as a table of flat cell indices, walked cyclically"""
+    def __init__(self, cells):
+        self.cells = cells  # Any indexable sequence; a range costs no memory on huge boards
+        self.length = len(cells)
+
+    def cell(self, position):
+        """Flat cell index at a position along the route"""
+        return self.cells[position]
+
+    def advance(self, position, steps):
+        """Route position reached after moving some steps, wrapping at the end"""
+        return (position + steps) % self.length
+
+    def landing_cell(self, position, steps):
+        """Flat cell index a move of some steps ends on"""
+        return self.cells[(position + steps) % self.length]
+
+def reading_order_route(rows, cols, reverse=False):
+    """Route along each row in turn, from the top-left (or backwards from the bottom-right)"""
+    if reverse:
+        return Route(range(rows * cols - 1, -1, -1))
+    return Route(range(rows * cols))
+
+def sample_spaced_cells(rng, rows, cols, count, reserved, min_spacing):
+    """Draw cells at random, keeping each one at least min_spacing from those already kept"""
+    # Kept cells bucketed by min_spacing-sized blocks; closer cells are always in neighbouring blocks
+    buckets = {}
+    picks = []
+    attempts = SPACED_ATTEMPTS_PER_CELL * count
+    while len(picks) < count:
+        if attempts == 0:
+            raise ValueError(f"Could only place {len(picks)} of {count} cells {min_spacing} apart")
+        attempts -= 1
+        index = rng.randrange(rows * cols)
+        if index in reserved:
+            continue
+        cell = divmod(index, cols)
+        block_row, block_col = cell[0] // min_spacing, cell[1] // min_spacing
+        if any(hex_distance(cell, other) < min_spacing
+               for near_row in range(block_row - 1, block_row + 2)
+               for near_col in range(block_col - 1, block_col + 2)
+               for other in buckets.get((near_row, near_col), ())):
+            continue
+        buckets.setdefault((block_row, block_col), []).append(cell)
+        picks.append(index)
+    return picks
+
+def generate_board(rows, cols, islands, octopuses, seed=None, start_cells=(), min_spacing=1):
+    """Place islands and octopuses on random distinct cells; the same arguments rebuild the same board"""
+    rng = random.Random(seed)
+    board = Board(rows, cols)
+    board.seed = seed
+    reserved = {board.index(row, col) for row, col in start_cells}
+    count = islands + octopuses
+    if count > rows * cols - len(reserved):
+        raise ValueError(f"Cannot place {count} pieces on a {rows}x{cols} board with {len(reserved)} start cells")
+    
+    if min_spacing <= 1:
+        # Sample the cell indices directly; enough extra are drawn to drop any start cells
+        picks = [index for index in rng.sample(range(rows * cols), count + len(reserved))
+                 if index not in reserved][:count]
+    else:
+        picks = sample_spaced_cells(rng, rows, cols, count, reserved, min_spacing)
+    
+    for number, index in enumerate(picks):
+        row, col = divmod(index, cols)
+        board.set_cell(row, col, ISLAND if number < islands else OCTOPUS)
+    return board
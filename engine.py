@@ -0,0 +1,413 @@
+import random
+
+from board import ISLAND, OCTOPUS, generate_board, reading_order_route
+
+# Card symbols
+CARD_SYMBOLS = ['wheel', 'sea currents', 'fishing rode', 'passangers of the boat', 'the holes',
+                'waves', 'light house', 'compass', 'stars', 'other boats', 'diver',
+                'clouds and weather', 'anchor', 'telescope', 'bell', 'sea storm', 'pirats', 'main sail']  # Reflection card symbols
+COPING_SYMBOLS = ['stormy clouds', 'tornedo', 'black clouds', 'mutiny', 'stack on the rocks',
+                 'sea battle', 'counter winds', 'horricane', 'bombs away', 'no wind',
+                 'turbulance', 'mermaids', 'wheel broken', 'changing rout']  # Coping card symbols
+
+# Card rules
+MAX_REFLECTION_CARDS = 6
+MAX_COPING_CARDS = 6
+COPING_UNLOCK_REFLECTION = 3  # Islands give reflection cards below this many, octopuses give coping cards from it on
+WIN_REFLECTION_CARDS = 4  # A player needs this many reflection cards...
+WIN_COPING_CARDS = 4  # ...and this many coping cards to win
+DICE_SIDES = 6
+
+# Turn phases
+PHASE_ROLL = 'roll'  # The current player may roll
+PHASE_MOVE = 'move'  # Rolled; the boat has yet to sail
+PHASE_CARD = 'card'  # A drawn card waits to be flipped and resolved
+PHASE_EXCHANGE = 'exchange'  # The boats met; the current player may take a card from the other one
+PHASE_OVER = 'over'  # Somebody won
+
+# Events sent to subscribers as listener(event, details)
+EVENT_ROLLED = 'rolled'  # player, roll
+EVENT_MOVED = 'moved'  # player, cell
+EVENT_CARD_DRAWN = 'card_drawn'  # player, card_type, symbol
+EVENT_CARD_FLIPPED = 'card_flipped'  # player, card_type, symbol
+EVENT_CARD_COLLECTED = 'card_collected'  # player, card_type
+EVENT_CARD_DISCARDED = 'card_discarded'  # player, card_type (the player's pile was full)
+EVENT_BOATS_MET = 'boats_met'  # player, other_player
+EVENT_CARD_EXCHANGED = 'card_exchanged'  # player, other_player, card_type, taken
+EVENT_TURN = 'turn'  # player
+EVENT_WON = 'won'  # player
+EVENT_BATTLE_STARTED = 'battle_started'  # player
+EVENT_BATTLE_WON = 'battle_won'  # player
+EVENT_BATTLE_LOST = 'battle_lost'  # player
+
+# Battle settings (distances in pixels, times in fixed steps)
+BATTLE_STATE_INTRO = 'intro'
+BATTLE_STATE_FIGHTING = 'fighting'
+BATTLE_STATE_WIN = 'win'
+BATTLE_STATE_LOSE = 'lose'
+BATTLE_INTRO_STEPS = 180  # 3 seconds at 60 steps per second
+BOAT_BATTLE_SPEED = 5
+ROCK_SPEED = 4
+ROCK_SIZE = 30
+FLOWER_SPEED = 7
+FLOWER_SIZE = 20
+MONSTER_START_SIZE = 200
+MONSTER_MIN_SIZE = 40
+MONSTER_SHRINK_PER_HIT = 8
+MONSTER_MOVE_CHANCE = 0.02  # Chance per step that the monster dives to a new spot
+MONSTER_HIDDEN_STEPS = 60  # Steps the monster stays under water when it moves
+MONSTER_HITS_TO_WIN = 20  # Increased from 10 to 20 hits
+BOAT_STARTING_HEALTH = 3
+
+def boxes_overlap(a, b):
+    """Whether two (x, y, width, height) boxes overlap"""
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+class Projectile:
+    """A rock or compassion flower travelling straight up or down"""
+    def __init__(self, x, y, size, speed):
+        self.x = x
+        self.y = y
+        self.width = size
+        self.height = size
+        self.speed = speed  # Positive falls, negative rises
+        self.previous_y = y
+
+    def update(self):
+        self.previous_y = self.y
+        self.y += self.speed
+
+    def box(self):
+        return (int(self.x), int(self.y), self.width, self.height)
+
+class Battle:
+    """The fight against the inner voice monster, advanced one fixed step per tick"""
+    def __init__(self, width, height, boat_size, rng=random):
+        self.width = width
+        self.height = height
+        self.boat_size = boat_size
+        self.rng = rng
+        self.state = BATTLE_STATE_INTRO
+        self.boat_x = width * 0.2
+        self.boat_y = height * 0.8
+        self.monster_x = width * 0.8
+        self.monster_y = height * 0.3
+        self.monster_size = MONSTER_START_SIZE
+        self.monster_health = MONSTER_HITS_TO_WIN
+        self.boat_health = BOAT_STARTING_HEALTH
+        self.rocks = []
+        self.flowers = []
+        self.rock_spawn_timer = 0
+        self.monster_move_timer = 0
+        self.intro_timer = 0
+        self.monster_visible = True
+        self.monster_moving = False
+        self.monster_target_x = self.monster_x
+        self.previous_boat_x = self.boat_x
+        self.previous_monster_x = self.monster_x
+
+    def boat_box(self):
+        return (int(self.boat_x - self.boat_size // 2), int(self.boat_y - self.boat_size // 2),
+                self.boat_size, self.boat_size)
+
+    def monster_box(self):
+        # The hit box keeps the starting size as the monster shrinks
+        return (int(self.monster_x - self.monster_size // 2), int(self.monster_y - self.monster_size // 2),
+                MONSTER_START_SIZE, MONSTER_START_SIZE)
+
+    def launch_flower(self):
+        """Send a compassion flower up from the boat"""
+        if self.state != BATTLE_STATE_FIGHTING:
+            return False
+        self.flowers.append(Projectile(self.boat_x, self.boat_y - self.boat_size // 2, FLOWER_SIZE, -FLOWER_SPEED))
+        return True
+
+    def tick(self, steer=0):
+        """Advance the battle by one step; steer is -1 to sail left, 1 to sail right"""
+        self.previous_boat_x = self.boat_x
+        self.previous_monster_x = self.monster_x
+
+        if self.state == BATTLE_STATE_INTRO:
+            self.intro_timer += 1
+            if self.intro_timer > BATTLE_INTRO_STEPS:
+                self.state = BATTLE_STATE_FIGHTING
+
+        elif self.state == BATTLE_STATE_FIGHTING:
+            if steer < 0:
+                self.boat_x = max(self.boat_size // 2, self.boat_x - BOAT_BATTLE_SPEED)
+            elif steer > 0:
+                self.boat_x = min(self.width - self.boat_size // 2, self.boat_x + BOAT_BATTLE_SPEED)
+
+            # Monster movement
+            if not self.monster_moving and self.rng.random() < MONSTER_MOVE_CHANCE:
+                self.monster_moving = True
+                self.monster_visible = False
+                self.monster_target_x = self.rng.randint(int(self.width * 0.6), int(self.width * 0.9))
+                self.monster_y = self.height * 0.3  # Reset height when moving
+
+            if self.monster_moving:
+                self.monster_move_timer += 1
+                if self.monster_move_timer > MONSTER_HIDDEN_STEPS:
+                    self.monster_visible = True
+                    # Move towards target
+                    dx = self.monster_target_x - self.monster_x
+                    if abs(dx) < 2:
+                        self.monster_moving = False
+                        self.monster_move_timer = 0
+                    else:
+                        self.monster_x += dx * 0.1
+
+            # Spawn rocks with increasing frequency as monster gets smaller
+            damage = MONSTER_HITS_TO_WIN - self.monster_health
+            spawn_rate = max(15, 45 - damage)
+            self.rock_spawn_timer += 1
+            if self.rock_spawn_timer > spawn_rate and self.monster_visible:
+                self.rock_spawn_timer = 0
+                for _ in range(min(5, 2 + damage // 4)):  # More rocks as the monster takes damage
+                    rock_x = self.monster_x + self.rng.randint(-50, 50)
+                    self.rocks.append(Projectile(rock_x, self.monster_y + self.monster_size // 2, ROCK_SIZE, ROCK_SPEED))
+
+            # Update and check rocks
+            boat_box = self.boat_box()
+            for rock in self.rocks[:]:
+                rock.update()
+                if rock.y > self.height:
+                    self.rocks.remove(rock)
+                elif boxes_overlap(rock.box(), boat_box):
+                    self.rocks.remove(rock)
+                    self.boat_health -= 1
+                    if self.boat_health <= 0:
+                        self.state = BATTLE_STATE_LOSE
+
+            # Update and check flowers
+            monster_box = self.monster_box()
+            for flower in self.flowers[:]:
+                flower.update()
+                if flower.y < 0:
+                    self.flowers.remove(flower)
+                elif self.monster_visible and boxes_overlap(flower.box(), monster_box):
+                    self.flowers.remove(flower)
+                    self.monster_health -= 1
+                    # Make monster smaller but increase attack frequency
+                    damage = MONSTER_HITS_TO_WIN - self.monster_health
+                    self.monster_size = max(MONSTER_MIN_SIZE, MONSTER_START_SIZE - damage * MONSTER_SHRINK_PER_HIT)
+                    if self.monster_health <= 0:
+                        self.state = BATTLE_STATE_WIN
+
+class Rules:
+    """Tunable card rules of a game; the defaults are the game's own"""
+    def __init__(self, max_reflection_cards=MAX_REFLECTION_CARDS, max_coping_cards=MAX_COPING_CARDS,
+                 win_reflection_cards=WIN_REFLECTION_CARDS, win_coping_cards=WIN_COPING_CARDS,
+                 coping_unlock_reflection=COPING_UNLOCK_REFLECTION, dice_sides=DICE_SIDES):
+        self.card_limits = {'reflection': max_reflection_cards, 'coping': max_coping_cards}
+        self.win_reflection_cards = win_reflection_cards
+        self.win_coping_cards = win_coping_cards
+        self.coping_unlock_reflection = coping_unlock_reflection
+        self.dice_sides = dice_sides
+
+def build_player_routes(rows, cols):
+    """Player 1 sails right and down from the top-left corner, player 2 left and up from the bottom-right one"""
+    return {1: reading_order_route(rows, cols), 2: reading_order_route(rows, cols, reverse=True)}
+
+class GameState:
+    """Board game rules and state, changed through action methods and reported as events"""
+    def __init__(self, board, num_players=1, rng=None, routes=None, rules=None):
+        self.board = board
+        self.num_players = num_players
+        self.rng = rng if rng is not None else random.Random()
+        self.rules = rules or Rules()
+        self.routes = routes or build_player_routes(board.rows, board.cols)
+        self.positions = {1: 0, 2: 0}  # Index of each boat along its route
+        self.cards = {
+            1: {'reflection': 0, 'coping': 0},
+            2: {'reflection': 0, 'coping': 0}
+        }
+        self.current_player = 1
+        self.phase = PHASE_ROLL
+        self.roll_value = 0
+        self.card = None  # Drawn card waiting to be resolved: type, symbol and the face shown
+        self.winner = None
+        self.battle = None
+        self.turns = 0  # Rolls taken so far
+        self.exchanges = 0  # Times the boats met
+        self.listeners = []
+
+    def subscribe(self, listener):
+        """Call listener(event, details) for every event from now on"""
+        self.listeners.append(listener)
+
+    def emit(self, event, **details):
+        for listener in self.listeners:
+            listener(event, details)
+
+    def other_player(self):
+        return 2 if self.current_player == 1 else 1
+
+    def player_cell(self, player):
+        """Flat board index of a player's boat"""
+        return self.routes[player].cell(self.positions[player])
+
+    def landing_cell(self, player, roll):
+        """Flat board index a player's boat would land on with a given roll"""
+        return self.routes[player].landing_cell(self.positions[player], roll)
+
+    def landing_card_type(self, player, index=None):
+        """Card the player's current cell (or the given flat index) gives them, if any"""
+        cell = self.board.cell_at_index(self.player_cell(player) if index is None else index)
+        reflection_cards = self.cards[player]['reflection']
+        if cell == ISLAND and reflection_cards < self.rules.coping_unlock_reflection:
+            return 'reflection'
+        if cell == OCTOPUS and reflection_cards >= self.rules.coping_unlock_reflection:
+            return 'coping'
+        return None
+
+    def check_winner(self):
+        """First player holding enough reflection and coping cards to win, if any"""
+        rules = self.rules
+        for player in (1, 2):
+            cards = self.cards[player]
+            if cards['reflection'] >= rules.win_reflection_cards and cards['coping'] >= rules.win_coping_cards:
+                return player
+        return None
+
+    def roll(self):
+        """Roll the dice for the current player; None when it isn't their time to roll"""
+        if self.phase != PHASE_ROLL:
+            return None
+        self.roll_value = self.rng.randint(1, self.rules.dice_sides)
+        self.turns += 1
+        self.phase = PHASE_MOVE
+        self.emit(EVENT_ROLLED, player=self.current_player, roll=self.roll_value)
+        return self.roll_value
+
+    def move(self):
+        """Sail the current boat by the rolled value and resolve where it lands"""
+        if self.phase != PHASE_MOVE:
+            return False
+        player = self.current_player
+        route = self.routes[player]
+        self.positions[player] = position = route.advance(self.positions[player], self.roll_value)
+        cell = route.cell(position)
+        self.emit(EVENT_MOVED, player=player, cell=cell)
+
+        # Boats meeting comes before whatever is on the cell
+        if self.num_players == 2 and cell == self.player_cell(self.other_player()):
+            self.phase = PHASE_EXCHANGE
+            self.exchanges += 1
+            self.emit(EVENT_BOATS_MET, player=player, other_player=self.other_player())
+            return True
+
+        card_type = self.landing_card_type(player, cell)
+        if card_type:
+            symbol = self.rng.choice(CARD_SYMBOLS if card_type == 'reflection' else COPING_SYMBOLS)
+            self.card = {'type': card_type, 'symbol': symbol, 'face': 'symbol'}
+            self.phase = PHASE_CARD
+            self.emit(EVENT_CARD_DRAWN, player=player, card_type=card_type, symbol=symbol)
+            return True
+
+        self.next_turn()
+        return True
+
+    def flip_card(self):
+        """Turn the drawn card over to its instructions"""
+        if self.phase != PHASE_CARD or self.card['face'] != 'symbol':
+            return False
+        self.card['face'] = 'instructions'
+        self.emit(EVENT_CARD_FLIPPED, player=self.current_player, card_type=self.card['type'],
+                  symbol=self.card['symbol'])
+        return True
+
+    def resolve_card(self):
+        """Add the drawn card to the player's pile, or let it go when the pile is full"""
+        if self.phase != PHASE_CARD:
+            return False
+        player = self.current_player
+        card_type = self.card['type']
+        self.card = None
+
+        if self.cards[player][card_type] >= self.rules.card_limits[card_type]:
+            self.emit(EVENT_CARD_DISCARDED, player=player, card_type=card_type)
+            self.next_turn()
+            return True
+
+        self.cards[player][card_type] += 1
+        self.emit(EVENT_CARD_COLLECTED, player=player, card_type=card_type)
+        self.finish_turn()
+        return True
+
+    def exchange(self, card_type=None):
+        """Take a card of a type from the other player after the boats meet; None just passes"""
+        if self.phase != PHASE_EXCHANGE:
+            return False
+        player = self.current_player
+        other_player = self.other_player()
+        taken = (card_type is not None
+                 and self.cards[player][card_type] < self.rules.card_limits[card_type]
+                 and self.cards[other_player][card_type] > 0)
+        if taken:
+            self.cards[other_player][card_type] -= 1
+            self.cards[player][card_type] += 1
+        self.emit(EVENT_CARD_EXCHANGED, player=player, other_player=other_player, card_type=card_type, taken=taken)
+        self.finish_turn()
+        return True
+
+    def finish_turn(self):
+        """End the game if somebody has won, otherwise pass the turn"""
+        winner = self.check_winner()
+        if winner:
+            self.declare_winner(winner)
+        else:
+            self.next_turn()
+
+    def next_turn(self):
+        if self.num_players == 2:
+            self.current_player = self.other_player()
+        self.phase = PHASE_ROLL
+        self.emit(EVENT_TURN, player=self.current_player)
+
+    def declare_winner(self, player):
+        self.winner = player
+        self.card = None
+        self.phase = PHASE_OVER
+        self.emit(EVENT_WON, player=player)
+
+    def start_battle(self, width, height, boat_size):
+        """Start a battle against the inner voice monster in an arena of the given size"""
+        self.battle = Battle(width, height, boat_size, self.rng)
+        self.emit(EVENT_BATTLE_STARTED, player=self.current_player)
+        return self.battle
+
+    def battle_tick(self, steer=0):
+        """Advance the battle by one step and settle it once it is won or lost"""
+        battle = self.battle
+        if battle is None:
+            return
+        state = battle.state
+        battle.tick(steer)
+        if battle.state == state:
+            return
+        player = self.current_player
+        if battle.state == BATTLE_STATE_WIN:
+            self.emit(EVENT_BATTLE_WON, player=player)
+            self.declare_winner(player)
+        elif battle.state == BATTLE_STATE_LOSE:
+            # Losing costs the player every card they had collected
+            self.cards[player]['reflection'] = 0
+            self.cards[player]['coping'] = 0
+            self.emit(EVENT_BATTLE_LOST, player=player)
+
+    def launch_flower(self):
+        return self.battle is not None and self.battle.launch_flower()
+
+    def end_battle(self):
+        """Leave the battle, whatever its state"""
+        self.battle = None
+
+def create_game(rows, cols, islands, octopuses, seed=None, num_players=1, min_spacing=1, rules=None):
+    """New game on a freshly generated board; the same seed replays the same board and dice"""
+    rng = random.Random(seed)
+    routes = build_player_routes(rows, cols)
+    start_cells = [divmod(route.cell(0), cols) for route in routes.values()]
+    board = generate_board(rows, cols, islands, octopuses, seed=rng.getrandbits(32),
+                           start_cells=start_cells, min_spacing=min_spacing)
+    return GameState(board, num_players, rng, routes, rules)
@@ -0,0 +1,22 @@
+import pygame
+
+# Fonts loaded once per (face, size), shared by every screen of the game
+font_registry = {}
+
+def get_font(face, size):
+    """Get a font from the registry, loading it on first use"""
+    key = (face, size)
+    font = font_registry.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(face, size)
+        except Exception:
+            print(f"Font {face} not found, using system font")
+            font = pygame.font.SysFont('arial', size)
+        font_registry[key] = font
+    return font
+
+def preload_fonts(fonts):
+    """Load the given (face, size) fonts up front so the first frame doesn't stall"""
+    for face, size in fonts:
+        get_font(face, size)
@@ -8,10 +8,13 @@ import sys
 from pygame import mixer
 from pathlib import Path
 import asyncio
+from board import CELL_NAMES, ISLAND, OCTOPUS, generate_board
+from fonts import get_font, preload_fonts
 
 # Basic settings
 WIDTH, HEIGHT = 900, 700
 ROWS, COLS = 9, 9
+BOARD_SEED = None  # Set to a printed board seed to rebuild that board exactly; None picks a new board each run
 HEX_SIZE = 40
 BOARD_WIDTH = COLS * HEX_SIZE * 1.5
 BOARD_HEIGHT = ROWS * HEX_SIZE * 1.732
@@ -50,6 +53,16 @@ FLOWER_SPEED = 4
 MONSTER_HITS_TO_WIN = 3
 BOAT_HITS_TO_LOSE = 3
 
+# Font sizes, all drawn with the default font
+TITLE_FONT_SIZE = 74  # Menu title
+BANNER_FONT_SIZE = 48  # Battle result banners
+TEXT_FONT_SIZE = 36  # Buttons, dice value, turn indicator and battle messages
+SYMBOL_FONT_SIZE = 40  # Symbol on a drawn card
+INSTRUCTION_FONT_SIZE = 24  # Menu and battle instructions
+LABEL_FONT_SIZE = 20  # Card text and moving cards
+GAME_FONTS = [(None, size) for size in (TITLE_FONT_SIZE, BANNER_FONT_SIZE, TEXT_FONT_SIZE, SYMBOL_FONT_SIZE,
+                                        INSTRUCTION_FONT_SIZE, LABEL_FONT_SIZE)]
+
 # Card sizes
 CARD_WIDTH = 60
 CARD_HEIGHT = 80
@@ -112,26 +125,13 @@ player_card_counts = [
     {'reflection': 0, 'coping': 0}
 ]
 
-# Initialize board
-board = [[None for _ in range(COLS)] for _ in range(ROWS)]
-island_positions = []
-octopus_positions = []
-
-# Generate island positions
-while len(island_positions) < 10:
-    row = random.randint(0, ROWS-1)
-    col = random.randint(0, COLS-1)
-    if (row, col) not in island_positions and (row, col) not in player_positions:
-        island_positions.append((row, col))
-        board[row][col] = 'island'
-
-# Generate octopus positions
-while len(octopus_positions) < 10:
-    row = random.randint(0, ROWS-1)
-    col = random.randint(0, COLS-1)
-    if (row, col) not in island_positions and (row, col) not in player_positions and (row, col) not in octopus_positions:
-        octopus_positions.append((row, col))
-        board[row][col] = 'octopus'
+# Initialize board, keeping the player starting positions free
+board_seed = BOARD_SEED if BOARD_SEED is not None else random.randrange(2 ** 32)
+board_layout = generate_board(ROWS, COLS, 10, 10, seed=board_seed, start_cells=player_positions)
+print(f"Board seed: {board_seed}")
+board = [[CELL_NAMES[board_layout.cell_at(row, col)] for col in range(COLS)] for row in range(ROWS)]
+island_positions = [(row, col) for row, col, _ in board_layout.occupied_cells(ISLAND)]
+octopus_positions = [(row, col) for row, col, _ in board_layout.occupied_cells(OCTOPUS)]
 
 # Helper functions
 def get_hex_center(row, col):
@@ -166,14 +166,14 @@ def draw_card(surface, rect, color, symbol=None, text=None, selected=False):
     
     if symbol:
         # Draw symbol
-        symbol_font = pygame.font.Font(None, 40)
+        symbol_font = get_font(None, SYMBOL_FONT_SIZE)
         symbol_text = symbol_font.render(symbol, True, (255, 255, 255))
         symbol_rect = symbol_text.get_rect(center=rect.center)
         surface.blit(symbol_text, symbol_rect)
     
     if text:
         # Draw text
-        text_font = pygame.font.Font(None, 20)
+        text_font = get_font(None, LABEL_FONT_SIZE)
         text_surface = text_font.render(text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(rect.centerx, rect.bottom - 20))
         surface.blit(text_surface, text_rect)
@@ -187,7 +187,7 @@ def draw_button(surface, rect, text, color, hover=False):
     pygame.draw.rect(surface, border_color, rect, 2, border_radius=10)
     
     # Draw text
-    font = pygame.font.Font(None, 36)
+    font = get_font(None, TEXT_FONT_SIZE)
     text_surface = font.render(text, True, (255, 255, 255))
     text_rect = text_surface.get_rect(center=rect.center)
     surface.blit(text_surface, text_rect)
@@ -199,7 +199,7 @@ def draw_dice(value):
         screen.blit(scaled_dice, (WIDTH - dice_size - 20, 20))
         
         # Draw value
-        font = pygame.font.Font(None, 36)
+        font = get_font(None, TEXT_FONT_SIZE)
         text = font.render(str(value), True, (255, 255, 255))
         text_rect = text.get_rect(center=(WIDTH - dice_size//2, 20 + dice_size//2))
         screen.blit(text, text_rect)
@@ -227,13 +227,13 @@ def check_collisions():
     row, col = player_positions[current_player]
     
     # Check for island collision
-    if (row, col) in island_positions:
+    if board[row][col] == 'island':
         current_card_symbol = "🏝️"
         waiting_for_card_interaction = True
         return True
     
     # Check for octopus collision
-    if (row, col) in octopus_positions:
+    if board[row][col] == 'octopus':
         current_card_symbol = "🐙"
         waiting_for_card_interaction = True
         return True
@@ -280,7 +280,7 @@ def draw_game_state():
     for row in range(ROWS):
         for col in range(COLS):
             x, y = get_hex_center(row, col)
-            color = LIGHT_GREEN if (row, col) in island_positions else SEA_BLUE
+            color = LIGHT_GREEN if board[row][col] == 'island' else SEA_BLUE
             draw_hexagon(x, y, HEX_SIZE, color)
     
     # Draw islands and octopuses
@@ -311,7 +311,7 @@ def draw_game_state():
     draw_card_stacks(screen)
     
     # Draw current player indicator
-    font = pygame.font.Font(None, 36)
+    font = get_font(None, TEXT_FONT_SIZE)
     text = font.render(f"Player {current_player + 1}'s Turn", True, WHITE)
     screen.blit(text, (20, 20))
 
@@ -320,13 +320,13 @@ def draw_menu():
     screen.fill(PARCHMENT)
     
     # Draw title
-    font = pygame.font.Font(None, 74)
+    font = get_font(None, TITLE_FONT_SIZE)
     title = font.render("Sea Journey", True, DARK_BLUE)
     title_rect = title.get_rect(center=(WIDTH//2, HEIGHT//3))
     screen.blit(title, title_rect)
     
     # Draw subtitle
-    subtitle_font = pygame.font.Font(None, 36)
+    subtitle_font = get_font(None, TEXT_FONT_SIZE)
     subtitle = subtitle_font.render("Inner Voice Battle", True, DARK_BLUE)
     subtitle_rect = subtitle.get_rect(center=(WIDTH//2, HEIGHT//3 + 50))
     screen.blit(subtitle, subtitle_rect)
@@ -345,7 +345,7 @@ def draw_menu():
     draw_button(screen, two_player_rect, "2 Players", BLUE)
     
     # Draw instructions
-    instructions_font = pygame.font.Font(None, 24)
+    instructions_font = get_font(None, INSTRUCTION_FONT_SIZE)
     instructions = [
         "Press 1 for One Player",
         "Press 2 for Two Players",
@@ -515,17 +515,17 @@ def draw_battle_screen():
         
         # Draw battle messages
         if battle_state.state == BATTLE_STATE_INTRO:
-            font = pygame.font.Font(None, 36)
+            font = get_font(None, TEXT_FONT_SIZE)
             text = font.render("The battle begins!", True, WHITE)
             screen.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2))
         elif battle_state.state == BATTLE_STATE_WON:
-            font = pygame.font.Font(None, 48)
+            font = get_font(None, BANNER_FONT_SIZE)
             text = font.render("You won the battle!", True, WHITE)
             screen.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2))
             text = font.render("Press ESC to continue", True, WHITE)
             screen.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2 + 50))
         elif battle_state.state == BATTLE_STATE_LOST:
-            font = pygame.font.Font(None, 48)
+            font = get_font(None, BANNER_FONT_SIZE)
             text = font.render("You lost the battle!", True, WHITE)
             screen.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2))
             text = font.render("Press ESC to continue", True, WHITE)
@@ -564,7 +564,7 @@ def draw_battle_ui(battle_state):
     pygame.draw.rect(screen, GREEN, (20, bar_y + 30, bar_width * (battle_state.boat_health / BOAT_HITS_TO_LOSE), bar_height))
     
     # Draw instructions
-    font = pygame.font.Font(None, 24)
+    font = get_font(None, INSTRUCTION_FONT_SIZE)
     instructions = [
         "Use LEFT/RIGHT arrows to move",
         "Press SPACE to shoot flowers",
@@ -584,6 +584,7 @@ async def main():
     # Initialize Pygame
     pygame.init()
     print("Pygame initialized successfully")
+    preload_fonts(GAME_FONTS)
     
     # Set up the display
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -714,7 +715,7 @@ async def main():
                 if animation_cards:
                     for card in animation_cards[:]:
                         card.update()
-                        card.draw(screen, pygame.font.Font(None, 20))
+                        card.draw(screen, get_font(None, LABEL_FONT_SIZE))
                         if not card.moving:
                             animation_cards.remove(card)
             
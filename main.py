@@ -8,14 +8,37 @@ import sys
 from pygame import mixer
 from pathlib import Path
 import asyncio
+from collections import OrderedDict
+from board import ISLAND
+from fonts import get_font, preload_fonts
+from engine import (
+    create_game, PHASE_ROLL, BATTLE_STATE_INTRO, BATTLE_STATE_FIGHTING, BATTLE_STATE_WIN, BATTLE_STATE_LOSE,
+    BATTLE_INTRO_STEPS, MONSTER_HITS_TO_WIN, BOAT_STARTING_HEALTH, EVENT_ROLLED, EVENT_CARD_DRAWN,
+    EVENT_CARD_FLIPPED, EVENT_CARD_COLLECTED, EVENT_CARD_DISCARDED, EVENT_BOATS_MET, EVENT_CARD_EXCHANGED,
+    EVENT_WON, EVENT_BATTLE_LOST
+)
 
 # Basic settings
-WIDTH, HEIGHT = 900, 700  # Smaller window size
+LAYOUT_WIDTH, LAYOUT_HEIGHT = 900, 700  # Size the layout is designed at; the window opens at this size
+RENDER_SCALE = 1.0  # Share of the layout size frames are drawn at; 0.5-0.75 cuts the pixels weak devices fill
+
+def px(value):
+    """Layout pixels in render pixels; non-zero lengths never round away to nothing"""
+    scaled = round(value * RENDER_SCALE)
+    if scaled == 0 and value:
+        return 1 if value > 0 else -1
+    return scaled
+
+WIDTH, HEIGHT = px(LAYOUT_WIDTH), px(LAYOUT_HEIGHT)  # Render target size every frame is drawn at
 ROWS, COLS = 9, 9
-HEX_SIZE = 35  # Slightly smaller hexagons to fit in new window size
+BOARD_SEED = None  # Set to a printed board seed to rebuild that board exactly; None picks a new board each run
+ISLAND_COUNT = 10  # Reduced from 12 to 10 for 9x9 grid
+OCTOPUS_COUNT = 10
+PIECE_MIN_SPACING = 1  # Smallest hex distance between two islands/octopuses (1 only keeps them on separate cells)
+HEX_SIZE = px(35)  # Slightly smaller hexagons to fit in new window size
 BOARD_WIDTH = COLS * HEX_SIZE * math.sqrt(3)  # Calculate total board width
 BOARD_HEIGHT = ROWS * HEX_SIZE * 1.5  # Calculate total board height
-BOARD_OFFSET_X = (WIDTH - BOARD_WIDTH) // 2 + 100  # Move board right to make space for card stacks
+BOARD_OFFSET_X = (WIDTH - BOARD_WIDTH) // 2 + px(100)  # Move board right to make space for card stacks
 BOARD_OFFSET_Y = (HEIGHT - BOARD_HEIGHT) // 2  # Center vertically
 
 # Enhanced colors
@@ -34,10 +57,13 @@ BG_COLOR = (240, 248, 255)  # Light blue background
 
 # Animation settings
 WAVE_SPEED = 0.02
-WAVE_AMPLITUDE = 5
-BOAT_ROCK_AMPLITUDE = 3
+WAVE_AMPLITUDE = px(5)
+BOAT_ROCK_AMPLITUDE = px(3)
 BOAT_ROCK_SPEED = 0.05
-CARD_SPEED = 10
+BOAT_ROCK_ANGLE = 5  # Boats rock by up to this many degrees either way
+BOAT_ROTATION_STEP = 0.25  # Degrees between pre-rotated boat frames
+BOAT_ROTATION_SMOOTH = True  # Filter the pre-rotated frames; False uses plain nearest-pixel rotation
+CARD_SPEED = px(10)
 
 # Game states
 GAME_STATE_MENU = 'menu'
@@ -45,24 +71,20 @@ GAME_STATE_PLAYING = 'playing'
 GAME_STATE_WINNER = 'winner'  # New game state for when someone wins
 GAME_STATE_BATTLE = 'battle'
 
-# Card symbols and states
-CARD_SYMBOLS = ['wheel', 'sea currents', 'fishing rode', 'passangers of the boat', 'the holes', 
-                'waves', 'light house', 'compass', 'stars', 'other boats', 'diver', 
-                'clouds and weather', 'anchor', 'telescope', 'bell', 'sea storm', 'pirats', 'main sail']  # Reflection card symbols
-COPING_SYMBOLS = ['stormy clouds', 'tornedo', 'black clouds', 'mutiny', 'stack on the rocks',
-                 'sea battle', 'counter winds', 'horricane', 'bombs away', 'no wind',
-                 'turbulance', 'mermaids', 'wheel broken', 'changing rout']  # Coping card symbols
-CARD_WIDTH = 200  # Standard card width
-CARD_HEIGHT = 300  # Standard card height
-LARGE_CARD_SIZE = 300  # Smaller centered card size
-CARD_FONT_SIZE = 24  # Smaller font size
-INSTRUCTION_FONT_SIZE = 18  # Smaller instruction font
+# Card layout
+CARD_WIDTH = px(200)  # Standard card width
+CARD_HEIGHT = px(300)  # Standard card height
+LARGE_CARD_SIZE = px(300)  # Smaller centered card size
+CARD_FONT_SIZE = px(24)  # Smaller font size
+INSTRUCTION_FONT_SIZE = px(18)  # Smaller instruction font
 
 # Add these variables after the other global variables
 wave_offset = 0
 boat1_offset = {'x': 0, 'y': 0, 'angle': 0}
 boat2_offset = {'x': 0, 'y': 0, 'angle': 0}
 animation_time = 0
+previous_wave_offset = 0  # Values at the previous fixed step, for render interpolation
+previous_animation_time = 0
 
 # Enhanced colors for treasure map theme
 PARCHMENT_COLOR = (255, 248, 220)  # Antique white
@@ -81,28 +103,64 @@ WATER_GRADIENT_END = (64, 164, 223)  # Light blue
 
 # Animation settings
 WAVE_COUNT = 3  # Number of wave layers
-WAVE_SPEEDS = [0.03, 0.05, 0.07]  # Different speeds for each wave layer
-WAVE_AMPLITUDES = [2, 3, 4]  # Different amplitudes for each wave layer
+WAVE_PERIODS = [4.0, 2.0, 4 / 3]  # Seconds each wave layer takes to roll by one wave length
+WAVE_AMPLITUDES = [px(2), px(3), px(4)]  # Different amplitudes for each wave layer
 WAVE_FREQUENCIES = [4, 6, 8]  # Different frequencies for each wave layer
+WAVE_FRAME_RATE = 30  # Frames per second of wave motion in the precomputed loop
+WAVE_LOOP_MAX_SECONDS = 4  # Longest wave loop; layers that don't fit it exactly are rounded to whole waves
+WAVE_FRAME_MEMORY_LIMIT = 4 * 1024 * 1024  # Upper bound in bytes for one wave loop
+
+# Render cache settings
+GRADIENT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # Memory cap for cached gradient surfaces
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024  # Memory cap for cached text surfaces
+TEXT_CACHE_MAX_ENTRIES = 512  # Most distinct strings kept at once
+GLOW_TEXT_CACHE_MAX_BYTES = 2 * 1024 * 1024  # Memory cap for text rasterized with its glow
+
+# Frame pacing
+SIMULATION_HZ = 60  # Fixed rate of game logic and animation updates
+MAX_FPS = 60  # Render frame cap
+MAX_FRAME_TIME = 0.25  # Longest frame, in seconds, the simulation catches up on
+
+# Adaptive quality settings, tiers from best to cheapest
+QUALITY_TIERS = [
+    {'wave_layers': WAVE_COUNT, 'octopus_detail': True, 'shadows': True, 'menu_noise': True},
+    {'wave_layers': 2, 'octopus_detail': True, 'shadows': True, 'menu_noise': True},
+    {'wave_layers': 1, 'octopus_detail': False, 'shadows': True, 'menu_noise': True},
+    {'wave_layers': 1, 'octopus_detail': False, 'shadows': False, 'menu_noise': False},
+]
+ADAPTIVE_QUALITY = True  # Step through the tiers from measured frame time; False stays on the best tier
+QUALITY_WINDOW = 60  # Frames averaged for each decision
+QUALITY_DOWNGRADE_LOAD = 0.9  # Step down when the median frame work exceeds this share of the frame budget
+QUALITY_UPGRADE_LOAD = 0.5  # Step back up when it stays under this share...
+QUALITY_UPGRADE_WINDOWS = 5  # ...for this many windows in a row
+
+# Display update settings
+DIRTY_RECT_MODE = True  # Upload only the changed screen regions; False flips the full frame
+DIRTY_RECT_MERGE_LIMIT = 32  # Above this many regions, upload their bounding box instead
+LAYER_TILE_SIZE = 128  # Cached layers are blitted per tile of this many pixels, and only where they have content
+RENDER_SIZE = (WIDTH, HEIGHT)  # Internal resolution every frame is drawn at (set through RENDER_SCALE)
+DISPLAY_SIZE = (LAYOUT_WIDTH, LAYOUT_HEIGHT)  # Window / web canvas size the finished frame is shown at
+DISPLAY_SCALE_MODE = 'explicit'  # 'scaled' lets SDL scale on present (pygame.SCALED); 'explicit' does one transform.scale per frame
+DISPLAY_SMOOTH_SCALE = False  # Filter the explicit final scale (slower, softer edges)
+
+# Parchment noise settings
+NOISE_VARIANTS = 4  # Pre-generated grain textures the menu cycles through
+MENU_NOISE_ANIMATED = False  # Cycle the grain every frame; this redraws the menu constantly instead of idling
 
 # Add these colors after the other color definitions
 CLOSE_BUTTON_COLOR = (220, 53, 69)  # Red color for close button
 CLOSE_BUTTON_HOVER = (241, 82, 97)  # Lighter red for hover effect
 
 # Card display settings
-CARD_STACK_WIDTH = 120  # Smaller card stack width
-CARD_DISPLAY_HEIGHT = HEIGHT - 80
-CARD_STACK_OFFSET = 20  # Smaller spacing between stacked cards
+CARD_STACK_WIDTH = px(120)  # Smaller card stack width
+CARD_DISPLAY_HEIGHT = HEIGHT - px(80)
+CARD_STACK_OFFSET = px(20)  # Smaller spacing between stacked cards
 
 # UI Layout
-DICE_SIZE = 60  # Dice size
-DICE_MARGIN = 20
-INFO_BOX_WIDTH = 120  # Info box width
-INFO_BOX_HEIGHT = 100
-
-# Add card limit constants after the CARD_SYMBOLS section
-MAX_REFLECTION_CARDS = 6
-MAX_COPING_CARDS = 6
+DICE_SIZE = px(60)  # Dice size
+DICE_MARGIN = px(20)
+INFO_BOX_WIDTH = px(120)  # Info box width
+INFO_BOX_HEIGHT = px(100)
 
 # Initialize mixer
 print("\nInitializing sound system...")
@@ -200,21 +258,71 @@ def get_hex_center(row, col):
 
 # Initialize Pygame
 pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+display_surface = None
+screen = None
+
+def open_display():
+    """Open the window and return the surface frames are rendered into"""
+    global display_surface, screen
+    if DISPLAY_SCALE_MODE == 'scaled':
+        # SDL owns the final scale, so the window surface is the render target
+        display_surface = pygame.display.set_mode(RENDER_SIZE, pygame.SCALED)
+        screen = display_surface
+    else:
+        display_surface = pygame.display.set_mode(DISPLAY_SIZE)
+        if DISPLAY_SIZE == RENDER_SIZE:
+            screen = display_surface
+        elif screen is None or screen is display_surface:
+            screen = pygame.Surface(RENDER_SIZE).convert()
+    return screen
+
+def to_render_pos(pos):
+    """Map a window position to internal render coordinates"""
+    if screen is display_surface:
+        return pos
+    return (pos[0] * RENDER_SIZE[0] // DISPLAY_SIZE[0], pos[1] * RENDER_SIZE[1] // DISPLAY_SIZE[1])
+
+def get_mouse_pos():
+    """Mouse position in internal render coordinates"""
+    return to_render_pos(pygame.mouse.get_pos())
+
+def present_display(rects=None):
+    """Scale the rendered frame to the window once and push it out"""
+    if screen is not display_surface:
+        scale = pygame.transform.smoothscale if DISPLAY_SMOOTH_SCALE else pygame.transform.scale
+        scale(screen, display_surface.get_size(), display_surface)
+        if rects:
+            sx = DISPLAY_SIZE[0] / RENDER_SIZE[0]
+            sy = DISPLAY_SIZE[1] / RENDER_SIZE[1]
+            rects = [pygame.Rect(int(r.x * sx), int(r.y * sy), math.ceil(r.width * sx) + 1, math.ceil(r.height * sy) + 1)
+                     for r in rects]
+    if rects is None:
+        pygame.display.flip()
+    elif rects:
+        pygame.display.update(rects)
+
+screen = open_display()
 pygame.display.set_caption("Sea Journey - Reflection Game")
 
+# Font files, falling back to a system font when missing
+TITLE_FONT_FILE = 'assets/fonts/PlayfairDisplay-Bold.ttf'
+GAME_FONT_FILE = 'assets/fonts/Roboto-Regular.ttf'
+CARD_FONT_FILE = 'assets/fonts/PlayfairDisplay-Regular.ttf'
+INSTRUCTION_FONT_FILE = 'assets/fonts/Roboto-Regular.ttf'
+TITLE_FONT_SIZE = px(48)
+GAME_FONT_SIZE = px(32)
+LABEL_FONT_SIZE = px(20)  # Default font used for small labels
+EXPLANATION_FONT_SIZE = px(24)  # Default font used for the menu explanation
+GAME_FONTS = [(TITLE_FONT_FILE, TITLE_FONT_SIZE), (GAME_FONT_FILE, GAME_FONT_SIZE),
+              (CARD_FONT_FILE, CARD_FONT_SIZE), (INSTRUCTION_FONT_FILE, INSTRUCTION_FONT_SIZE),
+              (None, LABEL_FONT_SIZE), (None, EXPLANATION_FONT_SIZE)]  # Every (face, size) the game draws with
+
 # Load custom fonts
-try:
-    title_font = pygame.font.Font('assets/fonts/PlayfairDisplay-Bold.ttf', 48)
-    game_font = pygame.font.Font('assets/fonts/Roboto-Regular.ttf', 32)
-    card_font = pygame.font.Font('assets/fonts/PlayfairDisplay-Regular.ttf', CARD_FONT_SIZE)
-    instruction_font = pygame.font.Font('assets/fonts/Roboto-Regular.ttf', INSTRUCTION_FONT_SIZE)
-except:
-    print("Custom fonts not found, using system fonts")
-    title_font = pygame.font.SysFont('arial', 48)
-    game_font = pygame.font.SysFont('arial', 32)
-    card_font = pygame.font.SysFont('arial', CARD_FONT_SIZE)
-    instruction_font = pygame.font.SysFont('arial', INSTRUCTION_FONT_SIZE)
+preload_fonts(GAME_FONTS)
+title_font = get_font(TITLE_FONT_FILE, TITLE_FONT_SIZE)
+game_font = get_font(GAME_FONT_FILE, GAME_FONT_SIZE)
+card_font = get_font(CARD_FONT_FILE, CARD_FONT_SIZE)
+instruction_font = get_font(INSTRUCTION_FONT_FILE, INSTRUCTION_FONT_SIZE)
 
 # Load and scale boat image
 try:
@@ -308,13 +416,13 @@ try:
             else:
                 print(f"Sign image file not found: {image_path}")
                 # Create a placeholder colored rectangle
-                placeholder = pygame.Surface((100, 100))
+                placeholder = pygame.Surface((px(100), px(100)))
                 placeholder.fill((random.randint(100, 255), random.randint(100, 255), random.randint(100, 255)))
                 sign_images[symbol] = placeholder
         except Exception as e:
             print(f"Error loading sign image {filename}: {e}")
             # Create a placeholder colored rectangle
-            placeholder = pygame.Surface((100, 100))
+            placeholder = pygame.Surface((px(100), px(100)))
             placeholder.fill((random.randint(100, 255), random.randint(100, 255), random.randint(100, 255)))
             sign_images[symbol] = placeholder
 except Exception as e:
@@ -323,26 +431,22 @@ except Exception as e:
 
 # Initialize game state
 game_state = GAME_STATE_MENU
-num_players = 1
-current_player = 1
-can_roll = True
-current_roll = 0
-move_delay = 100  # Reduced from 200 to 100 milliseconds
-waiting_for_card_interaction = False
-centered_card = None
-card_display_state = None
-current_card_symbol = None
+move_delay = 100  # Milliseconds the boat takes to sail one cell
+boat_move = None  # Boat currently sailing along its route, if any
+centered_card = None  # Card or exchange on display
 BOATS_MET = False
 EXCHANGE_STATE = None
 SELECTED_CARD = None
 
-# Player positions and card tracking
-player1_pos = {'row': 0, 'col': 0}  # Start at top-left corner
-player2_pos = {'row': ROWS - 1, 'col': COLS - 1}  # Start at bottom-right corner
-player_card_counts = {
-    1: {'reflection': 0, 'coping': 0},
-    2: {'reflection': 0, 'coping': 0}
-}
+# The game itself (board, boats, cards and turns) lives in the rules engine; this module draws
+# it and plays the sounds for the events it sends. The same seed rebuilds the same board.
+board_seed = BOARD_SEED if BOARD_SEED is not None else random.randrange(2 ** 32)
+game = create_game(ROWS, COLS, ISLAND_COUNT, OCTOPUS_COUNT, seed=board_seed, min_spacing=PIECE_MIN_SPACING)
+board = game.board
+print(f"Board seed: {board_seed}")
+
+# Card tracking (the counts are the engine's own)
+player_card_counts = game.cards
 collected_cards = {
     1: {'reflection': [], 'coping': []},
     2: {'reflection': [], 'coping': []}
@@ -351,21 +455,13 @@ animation_cards = []
 collected_reflection_cards = []
 collected_coping_cards = []
 
-# Generate island and octopus positions
-island_positions = []
-while len(island_positions) < 10:  # Reduced from 12 to 10 for 9x9 grid
-    pos = {'row': random.randint(0, ROWS-1), 'col': random.randint(0, COLS-1)}
-    # Don't place islands at player starting positions
-    if pos not in island_positions and pos != player1_pos and pos != player2_pos:
-        island_positions.append(pos)
-
-octopus_positions = []
-while len(octopus_positions) < 10:  # Reduced from 12 to 10 for 9x9 grid
-    pos = {'row': random.randint(0, ROWS-1), 'col': random.randint(0, COLS-1)}
-    # Don't place octopuses where there are islands, other octopuses, or at player starting positions
-    if (pos not in island_positions and pos not in octopus_positions and 
-        pos != player1_pos and pos != player2_pos):
-        octopus_positions.append(pos)
+def get_player_cell(player):
+    """(row, col) of a player's boat"""
+    return board.position(game.player_cell(player))
+
+def get_landing_cell(player, roll):
+    """(row, col) a player's boat would land on with a given roll"""
+    return board.position(game.landing_cell(player, roll))
 
 # Add this new class for card animations
 class MovingCard:
@@ -373,10 +469,13 @@ class MovingCard:
         self.card_type = card_type
         self.x, self.y = start_pos
         self.end_x, self.end_y = end_pos
-        self.size = 70
+        self.size = px(70)
         self.moving = True
+        self.previous_x, self.previous_y = self.x, self.y
         
     def update(self):
+        self.previous_x, self.previous_y = self.x, self.y
+        
         # Move towards target position
         dx = self.end_x - self.x
         dy = self.end_y - self.y
@@ -397,29 +496,103 @@ class MovingCard:
 
     def draw(self, screen, label_font):
         # Draw card
-        card_rect = pygame.Rect(self.x, self.y, self.size, self.size)
-        draw_rounded_rect(screen, card_rect, WHITE, 10)
-        pygame.draw.rect(screen, BLACK, card_rect, 2, border_radius=10)
+        card_rect = pygame.Rect(interpolate(self.previous_x, self.x), interpolate(self.previous_y, self.y),
+                                self.size, self.size)
+        draw_rounded_rect(screen, card_rect, WHITE, px(10))
+        pygame.draw.rect(screen, BLACK, card_rect, px(2), border_radius=px(10))
+        dirty.mark(card_rect)
         
         # Draw text
         if self.card_type == 'reflection':
-            text1 = label_font.render("Self", True, BLACK)
-            text2 = label_font.render("Reflection", True, BLACK)
-            text1_rect = text1.get_rect(centerx=card_rect.centerx, centery=card_rect.centery - 10)
-            text2_rect = text2.get_rect(centerx=card_rect.centerx, centery=card_rect.centery + 10)
+            text1 = render_text(label_font, "Self", BLACK)
+            text2 = render_text(label_font, "Reflection", BLACK)
+            text1_rect = text1.get_rect(centerx=card_rect.centerx, centery=card_rect.centery - px(10))
+            text2_rect = text2.get_rect(centerx=card_rect.centerx, centery=card_rect.centery + px(10))
             screen.blit(text1, text1_rect)
             screen.blit(text2, text2_rect)
         else:
-            text = label_font.render("Coping", True, BLACK)
+            text = render_text(label_font, "Coping", BLACK)
             text_rect = text.get_rect(center=card_rect.center)
             screen.blit(text, text_rect)
 
+# Card instruction texts, shown on the back of the centered card
+REFLECTION_INSTRUCTIONS = {
+    'wheel': "Your choice point, how do you deal with complex situation, do you face them, run, or something else?",
+    'sea currents': "Are you noticing your inner world? Stop and notice what is here and now.",
+    'fishing rode': "How do you handle your urges? Can you master them and have patience?",
+    'passangers of the boat': "Do I know my inner sides, the child, the adult, the critic?",
+    'the holes': "Do I know my downfalls, my challenges?",
+    'waves': "Do I know my emotions, am I connected to them?",
+    'light house': "Do I make short term goals? What helps me to reach them?",
+    'compass': "Where do I aim my energy and focus? How do I spend my time?",
+    'stars': "What are my values? What are the qualities in me I wish to emphasize?",
+    'other boats': "How do I communicate with others? Can I listen? Forgive? Ask for help? Trust?",
+    'diver': "Do I avoid any feelings or sense of discomfort? For what reason?",
+    'clouds and weather': "How do you deal with your thoughts? How do you organize which is valuable and which to ignore?",
+    'anchor': "What is my safe place? What makes me grounded?",
+    'telescope': "Where is my attention going? Can I manage it better?",
+    'bell': "Do I pay attention to danger and risk triggers?",
+    'sea storm': "How do you cope in time of high stress and pressure?",
+    'pirats': "How do I deal with very negative connections in my life?",
+    'main sail': "What is my motivation for change? What is my responsibility? What am I willing to do?"
+}
+COPING_INSTRUCTIONS = {
+    'stormy clouds': "You have a lot of negative thoughts, what do you do?",
+    'tornedo': "You have obsessive thoughts, how do you handle and manage them?",
+    'black clouds': "You have what if thoughts, how do you handle?",
+    'mutiny': "You are in a conflict within yourself, how do you resolve it?",
+    'stack on the rocks': "How do you make decisions?",
+    'sea battle': "Do you know how to argue and fight on matters that are important?",
+    'counter winds': "Can you handle criticism? Can you give constructive criticism to others?",
+    'horricane': "How do you handle high stress risk situations?",
+    'bombs away': "How do you handle anger?",
+    'no wind': "How do you handle sadness?",
+    'turbulance': "How do you handle stress?",
+    'mermaids': "How do you handle urges?",
+    'wheel broken': "What happens when you lose control?",
+    'changing rout': "Can you adapt and make changes on the way?"
+}
+
+# Wrapped instruction layouts keyed by (symbol, card type, card width)
+instruction_layout_cache = {}
+
+def wrap_text(font, text, max_width):
+    """Split text into lines that fit max_width, measuring with font metrics"""
+    lines = []
+    current_line = []
+    for word in text.split():
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+    if current_line:
+        lines.append(' '.join(current_line))
+    return lines
+
+def get_instruction_block(symbol, card_type, width):
+    """Get the wrapped instructions of a card pre-composited into one text block surface"""
+    key = (symbol, card_type, width)
+    block = instruction_layout_cache.get(key)
+    if block is None:
+        instructions = REFLECTION_INSTRUCTIONS if card_type == 'reflection' else COPING_INSTRUCTIONS
+        lines = wrap_text(instruction_font, instructions.get(symbol, "Reflect on this moment."), width - px(40))
+        line_height = INSTRUCTION_FONT_SIZE + px(10)
+        block = pygame.Surface((width - px(40), max(1, len(lines)) * line_height), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            text = instruction_font.render(line, True, BLACK)
+            block.blit(text, text.get_rect(centerx=block.get_width() // 2, top=i * line_height))
+        instruction_layout_cache[key] = block
+    return block
+
 # Add this new class for the centered card display
 class CenteredCard:
     def __init__(self, symbol, card_type, size=LARGE_CARD_SIZE):
         self.symbol = symbol
         self.card_type = card_type
-        self.width = min(size, WIDTH - 400)  # Ensure card doesn't overflow
+        self.width = min(size, WIDTH - px(400))  # Ensure card doesn't overflow
         self.height = int(self.width * 1.5)
         self.x = (WIDTH - self.width) // 2
         self.y = (HEIGHT - self.height) // 2
@@ -431,44 +604,7 @@ class CenteredCard:
     
     def get_instruction_text(self):
         """Get the instruction text based on card type and symbol"""
-        if self.card_type == 'reflection':
-            instructions = {
-                'wheel': "Your choice point, how do you deal with complex situation, do you face them, run, or something else?",
-                'sea currents': "Are you noticing your inner world? Stop and notice what is here and now.",
-                'fishing rode': "How do you handle your urges? Can you master them and have patience?",
-                'passangers of the boat': "Do I know my inner sides, the child, the adult, the critic?",
-                'the holes': "Do I know my downfalls, my challenges?",
-                'waves': "Do I know my emotions, am I connected to them?",
-                'light house': "Do I make short term goals? What helps me to reach them?",
-                'compass': "Where do I aim my energy and focus? How do I spend my time?",
-                'stars': "What are my values? What are the qualities in me I wish to emphasize?",
-                'other boats': "How do I communicate with others? Can I listen? Forgive? Ask for help? Trust?",
-                'diver': "Do I avoid any feelings or sense of discomfort? For what reason?",
-                'clouds and weather': "How do you deal with your thoughts? How do you organize which is valuable and which to ignore?",
-                'anchor': "What is my safe place? What makes me grounded?",
-                'telescope': "Where is my attention going? Can I manage it better?",
-                'bell': "Do I pay attention to danger and risk triggers?",
-                'sea storm': "How do you cope in time of high stress and pressure?",
-                'pirats': "How do I deal with very negative connections in my life?",
-                'main sail': "What is my motivation for change? What is my responsibility? What am I willing to do?"
-            }
-        else:  # coping
-            instructions = {
-                'stormy clouds': "You have a lot of negative thoughts, what do you do?",
-                'tornedo': "You have obsessive thoughts, how do you handle and manage them?",
-                'black clouds': "You have what if thoughts, how do you handle?",
-                'mutiny': "You are in a conflict within yourself, how do you resolve it?",
-                'stack on the rocks': "How do you make decisions?",
-                'sea battle': "Do you know how to argue and fight on matters that are important?",
-                'counter winds': "Can you handle criticism? Can you give constructive criticism to others?",
-                'horricane': "How do you handle high stress risk situations?",
-                'bombs away': "How do you handle anger?",
-                'no wind': "How do you handle sadness?",
-                'turbulance': "How do you handle stress?",
-                'mermaids': "How do you handle urges?",
-                'wheel broken': "What happens when you lose control?",
-                'changing rout': "Can you adapt and make changes on the way?"
-            }
+        instructions = REFLECTION_INSTRUCTIONS if self.card_type == 'reflection' else COPING_INSTRUCTIONS
         return instructions.get(self.symbol, "Reflect on this moment.")
 
     def update(self):
@@ -479,90 +615,73 @@ class CenteredCard:
                 self.flip_progress = 0
                 self.flipping = False
 
-    def draw(self, screen):
-        try:
-            card_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-            
-            # Draw shadow
-            shadow_rect = card_rect.copy()
-            shadow_rect.x += 5
-            shadow_rect.y += 5
-            draw_rounded_rect(screen, shadow_rect, SHADOW_COLOR, 15)
-            
-            # Draw card
-            color = LIGHT_BLUE if self.card_type == 'reflection' else GOLD
-            draw_rounded_rect(screen, card_rect, color, 15)
-            pygame.draw.rect(screen, BLACK, card_rect, 2, border_radius=15)
-            
-            if self.state == 'symbol':
-                # For reflection cards, show sign image on front
-                if self.card_type == 'reflection' and self.symbol in sign_images:
-                    sign_img = sign_images[self.symbol]
-                    img_rect = sign_img.get_rect(center=(self.x + self.width//2, 
-                                                       self.y + self.height//2 - 30))
-                    screen.blit(sign_img, img_rect)
-                    
-                    # Draw symbol text below image
-                    symbol_text = card_font.render(self.symbol, True, BLACK)
-                    symbol_rect = symbol_text.get_rect(centerx=self.x + self.width//2,
-                                                     centery=self.y + self.height//2 + 80)
-                    screen.blit(symbol_text, symbol_rect)
-                else:
-                    # Draw symbol text in center if no image
-                    symbol_text = card_font.render(self.symbol, True, BLACK)
-                    symbol_rect = symbol_text.get_rect(centerx=self.x + self.width//2,
-                                                     centery=self.y + self.height//2)
-                    screen.blit(symbol_text, symbol_rect)
+    def build_face(self):
+        """Compose the current side of the card, including its shadow"""
+        shadow_offset = px(5)
+        face = pygame.Surface((self.width + shadow_offset, self.height + shadow_offset), pygame.SRCALPHA)
+        card_rect = pygame.Rect(0, 0, self.width, self.height)
+        center_x = self.width // 2
+        
+        # Draw shadow
+        shadow_rect = card_rect.copy()
+        shadow_rect.x += shadow_offset
+        shadow_rect.y += shadow_offset
+        draw_rounded_rect(face, shadow_rect, SHADOW_COLOR, px(15))
+        
+        # Draw card
+        color = LIGHT_BLUE if self.card_type == 'reflection' else GOLD
+        draw_rounded_rect(face, card_rect, color, px(15))
+        pygame.draw.rect(face, BLACK, card_rect, px(2), border_radius=px(15))
+        
+        if self.state == 'symbol':
+            # For reflection cards, show sign image on front
+            if self.card_type == 'reflection' and self.symbol in sign_images:
+                sign_img = sign_images[self.symbol]
+                img_rect = sign_img.get_rect(center=(center_x, self.height//2 - px(30)))
+                face.blit(sign_img, img_rect)
                 
-                # Draw card type at bottom
-                type_text = instruction_font.render(self.card_type.capitalize(), True, BLACK)
-                type_rect = type_text.get_rect(centerx=self.x + self.width//2,
-                                             bottom=self.y + self.height - 20)
-                screen.blit(type_text, type_rect)
+                # Draw symbol text below image
+                symbol_text = render_text(card_font, self.symbol, BLACK)
+                symbol_rect = symbol_text.get_rect(centerx=center_x, centery=self.height//2 + px(80))
+                face.blit(symbol_text, symbol_rect)
             else:
-                # For reflection cards, show sign image at the top
-                if self.card_type == 'reflection' and self.symbol in sign_images:
-                    sign_img = sign_images[self.symbol]
-                    img_rect = sign_img.get_rect(centerx=self.x + self.width//2, 
-                                               top=self.y + 20)
-                    screen.blit(sign_img, img_rect)
-                    
-                    # Adjust starting position for text to be below the image
-                    text_start_y = img_rect.bottom + 20
-                else:
-                    # For coping cards or if no image, start text higher
-                    text_start_y = self.y + 50
-                
-                # Draw instructions with proper wrapping
-                instructions = self.get_instruction_text()
-                words = instructions.split()
-                lines = []
-                current_line = []
-                
-                for word in words:
-                    test_line = ' '.join(current_line + [word])
-                    test_surface = instruction_font.render(test_line, True, BLACK)
-                    if test_surface.get_width() <= self.width - 40:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                        current_line = [word]
-                if current_line:
-                    lines.append(' '.join(current_line))
-                
-                y_offset = text_start_y
-                for line in lines:
-                    text = instruction_font.render(line, True, BLACK)
-                    text_rect = text.get_rect(centerx=self.x + self.width//2, top=y_offset)
-                    screen.blit(text, text_rect)
-                    y_offset += INSTRUCTION_FONT_SIZE + 10
+                # Draw symbol text in center if no image
+                symbol_text = render_text(card_font, self.symbol, BLACK)
+                symbol_rect = symbol_text.get_rect(centerx=center_x, centery=self.height//2)
+                face.blit(symbol_text, symbol_rect)
+            
+            # Draw card type at bottom
+            type_text = render_text(instruction_font, self.card_type.capitalize(), BLACK)
+            type_rect = type_text.get_rect(centerx=center_x, bottom=self.height - px(20))
+            face.blit(type_text, type_rect)
+        else:
+            # For reflection cards, show sign image at the top
+            if self.card_type == 'reflection' and self.symbol in sign_images:
+                sign_img = sign_images[self.symbol]
+                img_rect = sign_img.get_rect(centerx=center_x, top=px(20))
+                face.blit(sign_img, img_rect)
                 
-                # Draw continue prompt
-                continue_text = instruction_font.render("Press SPACE to continue", True, BLACK)
-                continue_rect = continue_text.get_rect(centerx=self.x + self.width//2,
-                                                     bottom=self.y + self.height - 20)
-                screen.blit(continue_text, continue_rect)
+                # Adjust starting position for text to be below the image
+                text_start_y = img_rect.bottom + px(20)
+            else:
+                # For coping cards or if no image, start text higher
+                text_start_y = px(50)
+            
+            # Draw the wrapped instructions as one block
+            text_block = get_instruction_block(self.symbol, self.card_type, self.width)
+            face.blit(text_block, text_block.get_rect(centerx=center_x, top=text_start_y))
+            
+            # Draw continue prompt
+            continue_text = render_text(instruction_font, "Press SPACE to continue", BLACK)
+            continue_rect = continue_text.get_rect(centerx=center_x, bottom=self.height - px(20))
+            face.blit(continue_text, continue_rect)
+        
+        return face
+
+    def draw(self, screen):
+        # Drawn only when the modal layer re-renders, so the layer surface is the face cache
+        try:
+            screen.blit(self.build_face(), (self.x, self.y))
         except Exception as e:
             print(f"Error drawing card: {e}")
             self.state = 'symbol'  # Reset to symbol state if there's an error
@@ -570,7 +689,7 @@ class CenteredCard:
 # Add this new class for the exchange interface
 class ExchangeInterface:
     def __init__(self, other_player_cards):
-        self.other_player = 2 if current_player == 1 else 1
+        self.other_player = game.other_player()
         self.cards = []
         
         # Create list of available cards
@@ -580,14 +699,15 @@ class ExchangeInterface:
                 self.cards.append({
                     'type': card_type,
                     'index': i,
-                    'rect': pygame.Rect(0, 0, 60, 80)  # Smaller cards
+                    'rect': pygame.Rect(0, 0, px(60), px(80))  # Smaller cards
                 })
         self.selected_index = None
         
         # Calculate total width needed for cards
-        total_width = len(self.cards) * 80  # 80px spacing between cards
+        self.spacing = px(80)  # 80 layout pixels between cards
+        total_width = len(self.cards) * self.spacing
         self.start_x = (WIDTH - total_width) // 2
-        self.start_y = HEIGHT // 2 - 100  # Move up slightly
+        self.start_y = HEIGHT // 2 - px(100)  # Move up slightly
     
     def draw(self, screen):
         try:
@@ -597,138 +717,425 @@ class ExchangeInterface:
             screen.blit(overlay, (0, 0))
             
             # Draw title
-            text = game_font.render(f"Take a card from Player {self.other_player}", True, WHITE)
-            text_rect = text.get_rect(centerx=WIDTH // 2, y=self.start_y - 50)
+            text = render_text(game_font, f"Take a card from Player {self.other_player}", WHITE)
+            text_rect = text.get_rect(centerx=WIDTH // 2, y=self.start_y - px(50))
             screen.blit(text, text_rect)
             
             # Draw available cards
             for i, card in enumerate(self.cards):
-                card['rect'].x = self.start_x + i * 80
+                card['rect'].x = self.start_x + i * self.spacing
                 card['rect'].y = self.start_y
                 
                 # Draw card background
                 color = LIGHT_BLUE if card['type'] == 'reflection' else GOLD
-                draw_rounded_rect(screen, card['rect'], color, 10)
+                draw_rounded_rect(screen, card['rect'], color, px(10))
                 
                 # Draw border (highlighted if selected)
                 border_color = GOLD if i == self.selected_index else BLACK
-                border_width = 3 if i == self.selected_index else 1
-                pygame.draw.rect(screen, border_color, card['rect'], border_width, border_radius=10)
+                border_width = px(3) if i == self.selected_index else px(1)
+                pygame.draw.rect(screen, border_color, card['rect'], border_width, border_radius=px(10))
                 
                 # Draw card text
                 if card['type'] == 'reflection':
-                    text = card_font.render("R", True, BLACK)
+                    text = render_text(card_font, "R", BLACK)
                 else:
-                    text = card_font.render("C", True, BLACK)
+                    text = render_text(card_font, "C", BLACK)
                 text_rect = text.get_rect(center=card['rect'].center)
                 screen.blit(text, text_rect)
             
             # Draw instruction
             if self.selected_index is not None:
-                text = instruction_font.render("Press SPACE to take card", True, WHITE)
-                text_rect = text.get_rect(centerx=WIDTH // 2, y=self.start_y + 100)
+                text = render_text(instruction_font, "Press SPACE to take card", WHITE)
+                text_rect = text.get_rect(centerx=WIDTH // 2, y=self.start_y + px(100))
                 screen.blit(text, text_rect)
         
         except Exception as e:
             print(f"Error drawing exchange interface: {e}")
             return
 
-def draw_rounded_rect(surface, rect, color, corner_radius):
-    """Draw a rounded rectangle with a gradient effect"""
-    if corner_radius < 0:
-        corner_radius = 0
-    
-    # Create gradient colors
-    color_top = color
-    color_bottom = (max(0, color[0] - 30), max(0, color[1] - 30), max(0, color[2] - 30))
+class SurfaceCache:
+    """Least-recently-used cache of rendered surfaces with a memory cap"""
+    def __init__(self, max_bytes, max_entries=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, build):
+        """Get the surface for key, calling build() to render it on a miss"""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = build()
+        self.entries[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        
+        # Evict least recently used entries, always keeping the one just built
+        while len(self.entries) > 1 and (self.bytes > self.max_bytes or
+                                         (self.max_entries and len(self.entries) > self.max_entries)):
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return surface
+    
+    def clear(self):
+        """Drop every cached surface (the counters are kept)"""
+        self.entries.clear()
+        self.bytes = 0
+    
+    def stats(self):
+        """Get hit/miss counters and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+class DirtyTracker:
+    """Collects the screen regions changed in a frame and uploads only those"""
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.rects = []
+        self.previous_rects = []
+        self.full = True
+        self.scene = None
+    
+    def mark(self, rect):
+        """Report a screen region drawn this frame"""
+        if rect is not None:
+            self.rects.append(pygame.Rect(rect))
+        return rect
+    
+    def mark_all(self):
+        """Upload the whole frame on the next present"""
+        self.full = True
+    
+    def set_scene(self, scene):
+        """Fall back to a full frame whenever the scene changes"""
+        if scene != self.scene:
+            self.scene = scene
+            self.full = True
+    
+    def present(self):
+        """Push this frame to the display"""
+        if not self.enabled or self.full:
+            present_display()
+        else:
+            # Last frame's regions are included so moved drawables don't leave trails
+            bounds = screen.get_rect()
+            rects = [rect.clip(bounds) for rect in self.rects + self.previous_rects]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            if len(rects) > DIRTY_RECT_MERGE_LIMIT:
+                rects = [rects[0].unionall(rects[1:])]
+            if rects:
+                present_display(rects)
+        self.previous_rects = self.rects
+        self.rects = []
+        self.full = False
+
+# Screen regions to upload for the current frame
+dirty = DirtyTracker(DIRTY_RECT_MODE)
+
+class FrameClock:
+    """Caps the frame rate and turns measured frame time into fixed simulation steps"""
+    def __init__(self, step_hz=SIMULATION_HZ, max_fps=MAX_FPS):
+        self.clock = pygame.time.Clock()
+        self.step = 1 / step_hz
+        self.max_fps = max_fps
+        self.accumulator = 0.0
+        self.work_time = 0
+    
+    def tick(self):
+        """Wait for the next frame; returns how many fixed steps to simulate"""
+        frame_time = min(self.clock.tick(self.max_fps) / 1000, MAX_FRAME_TIME)
+        self.work_time = self.clock.get_rawtime()  # Milliseconds the last frame took before waiting
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        return steps
+    
+    @property
+    def alpha(self):
+        """How far the frame is between the last fixed step and the next one"""
+        return self.accumulator / self.step
+    
+    def get_fps(self):
+        return self.clock.get_fps()
+
+class QualityGovernor:
+    """Picks a quality tier from the measured frame work time over a rolling window
+
+    The window median is used, so one-off stalls like loading a sound don't drop the tier.
+    """
+    def __init__(self, budget_ms, enabled=ADAPTIVE_QUALITY):
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.tier = 0
+        self.samples = []
+        self.frame_ms = 0.0
+        self.headroom_windows = 0
+    
+    @property
+    def settings(self):
+        """Settings of the current tier"""
+        return QUALITY_TIERS[self.tier]
+    
+    def record(self, work_ms):
+        """Add one frame's work time; returns True if the tier changed"""
+        if not self.enabled:
+            return False
+        self.samples.append(work_ms)
+        if len(self.samples) < QUALITY_WINDOW:
+            return False
+        
+        self.frame_ms = sorted(self.samples)[len(self.samples) // 2]
+        self.samples = []
+        load = self.frame_ms / self.budget_ms
+        if load > QUALITY_DOWNGRADE_LOAD and self.tier < len(QUALITY_TIERS) - 1:
+            self.set_tier(self.tier + 1)
+            return True
+        if load < QUALITY_UPGRADE_LOAD and self.tier > 0:
+            self.headroom_windows += 1
+            if self.headroom_windows >= QUALITY_UPGRADE_WINDOWS:
+                self.set_tier(self.tier - 1)
+                return True
+        else:
+            self.headroom_windows = 0
+        return False
+    
+    def set_tier(self, tier):
+        self.tier = tier
+        self.headroom_windows = 0
+        print(f"Quality tier {tier} (median frame work {self.frame_ms:.1f} ms)")
+    
+    def stats(self):
+        """Get the current tier and the measurements behind it"""
+        return {
+            'tier': self.tier,
+            'settings': self.settings,
+            'frame_ms': self.frame_ms,
+            'budget_ms': self.budget_ms
+        }
+
+# Quality tier in effect, adjusted as frames are measured
+quality = QualityGovernor(1000 / MAX_FPS)
+
+# One clock for the whole session, ticked by whichever loop runs, so the frame cap, the step timing
+# and the interpolation all hold in the desktop and the web build alike
+frame_clock = FrameClock()
+
+def interpolate(previous, current):
+    """Blend a simulated value between its last two fixed steps for drawing"""
+    return previous + (current - previous) * frame_clock.alpha
+
+# Rendered text keyed by (font, text, color, antialias)
+text_cache = SurfaceCache(TEXT_CACHE_MAX_BYTES, TEXT_CACHE_MAX_ENTRIES)
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the text cache"""
+    key = (font, text, tuple(color), antialias)
+    return text_cache.get(key, lambda: font.render(text, antialias, color))
+
+# Glow passes as (x offset, alpha) pairs: a trail fading to the left, and a symmetric halo
+BANNER_GLOW = tuple((-round(i * RENDER_SCALE), int(150 * (1 - i / 10))) for i in range(10))
+TITLE_GLOW = tuple((side * round(offset * RENDER_SCALE), 50) for offset in range(0, 10, 2) for side in (-1, 1))
+
+# Text rasterized together with its glow, keyed by (font, text, color, glow)
+glow_text_cache = SurfaceCache(GLOW_TEXT_CACHE_MAX_BYTES)
+
+def build_glow_text(font, text, color, glow):
+    """Rasterize text on top of its glow passes, padded by the widest glow offset"""
+    pad = max(abs(offset) for offset, _ in glow)
+    text_surface = font.render(text, True, color)
+    surface = pygame.Surface((text_surface.get_width() + 2 * pad, text_surface.get_height()), pygame.SRCALPHA)
+    for offset, alpha in glow:
+        surface.blit(font.render(text, True, (*color[:3], alpha)), (pad + offset, 0))
+    surface.blit(text_surface, (pad, 0))
+    return surface
+
+def draw_glow_text(surface, font, text, color, glow, text_rect):
+    """Draw text with a cached glow, with the text itself placed at text_rect"""
+    pad = max(abs(offset) for offset, _ in glow)
+    glow_text = glow_text_cache.get((font, text, tuple(color), glow),
+                                    lambda: build_glow_text(font, text, color, glow))
+    surface.blit(glow_text, (text_rect.x - pad, text_rect.y))
+
+# Gradient and rounded rectangle surfaces keyed by (size, colors, radius, style)
+gradient_cache = SurfaceCache(GRADIENT_CACHE_MAX_BYTES)
+
+def build_gradient_surface(size, colors, radius, style):
+    """Render a vertical gradient surface in the 'linear', 'rounded' or 'button' style"""
+    width, height = size
+    color_top, color_bottom = colors
+    
+    # Rounded: the draw_rounded_rect look, reaching the bottom color halfway down
+    if style == 'rounded':
+        surface = pygame.Surface((width, height))
+        gradient_step = height // 2
+        for i in range(height):
+            progress = i / gradient_step if i < gradient_step else 1.0
+            current_color = (
+                int(color_top[0] + (color_bottom[0] - color_top[0]) * progress),
+                int(color_top[1] + (color_bottom[1] - color_top[1]) * progress),
+                int(color_top[2] + (color_bottom[2] - color_top[2]) * progress)
+            )
+            pygame.draw.rect(surface, current_color, (0, i, width, 1))
+        
+        # Draw the rounded corners
+        pygame.draw.circle(surface, color_top, (radius, radius), radius)
+        pygame.draw.circle(surface, color_top, (width - radius - 1, radius), radius)
+        pygame.draw.circle(surface, color_bottom, (radius, height - radius - 1), radius)
+        pygame.draw.circle(surface, color_bottom, (width - radius - 1, height - radius - 1), radius)
+        return surface.convert()
     
-    # Draw the main rectangle
-    height = rect.height
-    gradient_step = height // 2
+    # Linear: top to bottom color over the full height
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
     for i in range(height):
-        progress = i / gradient_step if i < gradient_step else 1.0
+        progress = i / height
         current_color = (
             int(color_top[0] + (color_bottom[0] - color_top[0]) * progress),
             int(color_top[1] + (color_bottom[1] - color_top[1]) * progress),
             int(color_top[2] + (color_bottom[2] - color_top[2]) * progress)
         )
-        pygame.draw.rect(surface, current_color, (rect.x, rect.y + i, rect.width, 1))
+        pygame.draw.line(surface, current_color, (0, i), (width, i))
     
-    # Draw the rounded corners
-    pygame.draw.circle(surface, color, (rect.left + corner_radius, rect.top + corner_radius), corner_radius)
-    pygame.draw.circle(surface, color, (rect.right - corner_radius - 1, rect.top + corner_radius), corner_radius)
-    pygame.draw.circle(surface, color_bottom, (rect.left + corner_radius, rect.bottom - corner_radius - 1), corner_radius)
-    pygame.draw.circle(surface, color_bottom, (rect.right - corner_radius - 1, rect.bottom - corner_radius - 1), corner_radius)
+    # Button: covered by a rounded rectangle in the top color
+    if style == 'button':
+        pygame.draw.rect(surface, color_top, (0, 0, width, height), border_radius=radius)
+    return surface.convert_alpha()
+
+def get_gradient_surface(size, colors, radius=0, style='linear'):
+    """Get a cached gradient surface, rendering it on first use"""
+    key = (tuple(size), tuple(tuple(color[:3]) for color in colors), radius, style)
+    return gradient_cache.get(key, lambda: build_gradient_surface(key[0], key[1], radius, style))
+
+def draw_rounded_rect(surface, rect, color, corner_radius):
+    """Draw a rounded rectangle with a gradient effect"""
+    if corner_radius < 0:
+        corner_radius = 0
+    
+    # Create gradient colors
+    color_bottom = (max(0, color[0] - 30), max(0, color[1] - 30), max(0, color[2] - 30))
+    
+    gradient_surface = get_gradient_surface(rect.size, (color, color_bottom), corner_radius, 'rounded')
+    surface.blit(gradient_surface, rect.topleft)
 
 def create_noise_texture(width, height, alpha=30):
     """Create a noise texture for the parchment effect"""
-    texture = pygame.Surface((width, height), pygame.SRCALPHA)
-    for x in range(width):
-        for y in range(height):
-            noise = random.randint(0, alpha)
-            texture.set_at((x, y), (0, 0, 0, noise))
-    return texture
-
-def draw_compass_rose():
+    # Scale random bytes down to 0..alpha and write them into the alpha channel of black pixels
+    scale = bytes(value * (alpha + 1) // 256 for value in range(256))
+    pixels = bytearray(width * height * 4)
+    pixels[3::4] = random.randbytes(width * height).translate(scale)
+    return pygame.image.frombuffer(pixels, (width, height), 'RGBA').convert_alpha()
+
+# Pre-generated noise textures keyed by (width, height, alpha)
+noise_texture_pool = {}
+noise_frame = 0
+
+def get_noise_texture(width, height, alpha=30, animate=MENU_NOISE_ANIMATED):
+    """Get a parchment noise texture from the pool, cycling through the variants if animated"""
+    global noise_frame
+    key = (width, height, alpha)
+    variants = noise_texture_pool.get(key)
+    if variants is None:
+        variants = [create_noise_texture(width, height, alpha) for _ in range(NOISE_VARIANTS)]
+        noise_texture_pool[key] = variants
+    if not animate:
+        return variants[0]
+    noise_frame = (noise_frame + 1) % len(variants)
+    return variants[noise_frame]
+
+def draw_compass_rose(surface=None):
     """Draw a decorative compass rose"""
-    compass_size = 50  # Smaller compass
-    x, y = WIDTH - compass_size - 15, HEIGHT - compass_size - 15
+    if surface is None:
+        surface = screen
+    compass_size = px(50)  # Smaller compass
+    x, y = WIDTH - compass_size - px(15), HEIGHT - compass_size - px(15)
     
     # Draw compass circle
-    pygame.draw.circle(screen, COMPASS_GOLD, (x, y), compass_size//2, 2)
+    pygame.draw.circle(surface, COMPASS_GOLD, (x, y), compass_size//2, px(2))
     
     # Draw compass points
     for angle in range(0, 360, 45):
         rad = math.radians(angle)
-        end_x = x + math.cos(rad) * (compass_size//2 - 5)
-        end_y = y + math.sin(rad) * (compass_size//2 - 5)
-        pygame.draw.line(screen, COMPASS_GOLD, (x, y), (end_x, end_y), 2)
+        end_x = x + math.cos(rad) * (compass_size//2 - px(5))
+        end_y = y + math.sin(rad) * (compass_size//2 - px(5))
+        pygame.draw.line(surface, COMPASS_GOLD, (x, y), (end_x, end_y), px(2))
     
     # Draw N,S,E,W labels with smaller font
     directions = {'N': 0, 'E': 90, 'S': 180, 'W': 270}
-    small_font = pygame.font.Font(None, 20)
+    small_font = get_font(None, LABEL_FONT_SIZE)
     for direction, angle in directions.items():
         rad = math.radians(angle)
-        text_x = x + math.cos(rad) * (compass_size//2 + 8)
-        text_y = y + math.sin(rad) * (compass_size//2 + 8)
-        text = small_font.render(direction, True, COMPASS_GOLD)
+        text_x = x + math.cos(rad) * (compass_size//2 + px(8))
+        text_y = y + math.sin(rad) * (compass_size//2 + px(8))
+        text = render_text(small_font, direction, COMPASS_GOLD)
         text_rect = text.get_rect(center=(text_x, text_y))
-        screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
 
 def draw_map_border():
     """Draw a decorative border around the game area"""
-    border_width = 20
-    margin = 10
+    border_width = px(20)
+    margin = px(10)
     
     # Draw main border
     pygame.draw.rect(screen, MAP_BORDER, (margin, margin, 
                     WIDTH - 2*margin, HEIGHT - 2*margin), border_width)
     
     # Draw corner decorations
-    corner_size = 30
+    corner_size = px(30)
+    inset = px(5)
     corners = [(margin, margin), (WIDTH-margin-corner_size, margin),
               (margin, HEIGHT-margin-corner_size), 
               (WIDTH-margin-corner_size, HEIGHT-margin-corner_size)]
     
     for x, y in corners:
-        pygame.draw.rect(screen, MAP_BORDER, (x, y, corner_size, corner_size), 3)
-        pygame.draw.line(screen, MAP_BORDER, (x+5, y+5), 
-                        (x+corner_size-5, y+corner_size-5), 3)
-        pygame.draw.line(screen, MAP_BORDER, (x+corner_size-5, y+5),
-                        (x+5, y+corner_size-5), 3)
-
-def draw_waves(x, y, size):
-    """Draw animated waves with multiple layers"""
-    global wave_offset
+        pygame.draw.rect(screen, MAP_BORDER, (x, y, corner_size, corner_size), px(3))
+        pygame.draw.line(screen, MAP_BORDER, (x+inset, y+inset), 
+                        (x+corner_size-inset, y+corner_size-inset), px(3))
+        pygame.draw.line(screen, MAP_BORDER, (x+corner_size-inset, y+inset),
+                        (x+inset, y+corner_size-inset), px(3))
+
+# Precomputed wave loops keyed by (size, frame count, wave layers)
+wave_frame_cache = {}
+wave_loop_cache = {}
+
+def get_wave_loop(layers=WAVE_COUNT):
+    """Get the loop length in frames and the whole waves each layer rolls by in it"""
+    loop = wave_loop_cache.get(layers)
+    if loop is None:
+        periods = [max(1, round(period * WAVE_FRAME_RATE)) for period in WAVE_PERIODS[:layers]]
+        frame_count = min(math.lcm(*periods), WAVE_LOOP_MAX_SECONDS * WAVE_FRAME_RATE)
+        loop = (frame_count, [max(1, round(frame_count / period)) for period in periods])
+        wave_loop_cache[layers] = loop
+    return loop
+
+def get_wave_seconds():
+    """Seconds of wave motion so far, interpolated between fixed steps"""
+    return interpolate(previous_wave_offset, wave_offset) / (WAVE_SPEED * SIMULATION_HZ)
+
+def build_wave_frame(size, loop_progress, layers=WAVE_COUNT):
+    """Render the wave overlay of one hexagon at the given share of the wave loop, masked to the hexagon"""
+    cycles = get_wave_loop(layers)[1]
     points = []
-    wave_surfaces = []
     
-    # Create base hexagon points
+    # Create base hexagon points (relative to the wave surface)
     for i in range(6):
         angle_deg = 60 * i + 30
         angle_rad = math.pi / 180 * angle_deg
-        point_x = x + size * math.cos(angle_rad)
-        point_y = y + size * math.sin(angle_rad)
+        point_x = size + size * math.cos(angle_rad)
+        point_y = size + size * math.sin(angle_rad)
         points.append((point_x, point_y))
     
     # Create mask for waves
@@ -736,7 +1143,8 @@ def draw_waves(x, y, size):
     pygame.draw.polygon(mask, WHITE, points)
     
     # Draw multiple wave layers
-    for layer in range(WAVE_COUNT):
+    combined_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    for layer in range(layers):
         wave_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
         wave_points = []
         
@@ -744,186 +1152,265 @@ def draw_waves(x, y, size):
         wave_segments = 30
         for i in range(wave_segments):
             progress = i / wave_segments
-            wave_x = x - size + (size * 2 * progress)
-            wave_y = y + math.sin(progress * WAVE_FREQUENCIES[layer] * math.pi + 
-                                wave_offset * WAVE_SPEEDS[layer]) * WAVE_AMPLITUDES[layer]
+            wave_x = size * 2 * progress
+            wave_y = size + math.sin(progress * WAVE_FREQUENCIES[layer] * math.pi + 
+                                     2 * math.pi * cycles[layer] * loop_progress) * WAVE_AMPLITUDES[layer]
             wave_points.append((wave_x, wave_y))
         
         # Draw waves with fade effect
         for i in range(len(wave_points) - 1):
             alpha = int(255 * (0.3 + layer * 0.2))  # Varying opacity for each layer
             color = (*WAVE_COLOR[:3], alpha)
-            pygame.draw.line(wave_surface, color, wave_points[i], wave_points[i + 1], 2)
+            pygame.draw.line(wave_surface, color, wave_points[i], wave_points[i + 1], px(2))
         
-        wave_surfaces.append(wave_surface)
-    
-    # Combine wave layers
-    combined_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-    for surface in wave_surfaces:
-        combined_surface.blit(surface, (0, 0))
+        combined_surface.blit(wave_surface, (0, 0))
     
     # Apply hexagon mask
     combined_surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-    screen.blit(combined_surface, (x - size, y - size))
+    return combined_surface.convert_alpha()
+
+def get_wave_frames(size, layers=WAVE_COUNT):
+    """Get the ring of wave frames covering one wave loop, building it on first use"""
+    # One frame per WAVE_FRAME_RATE step, unless that would break the memory limit
+    frame_bytes = (size * 2) * (size * 2) * 4
+    frame_count = max(1, min(get_wave_loop(layers)[0], WAVE_FRAME_MEMORY_LIMIT // frame_bytes))
+    
+    key = (size, frame_count, layers)
+    frames = wave_frame_cache.get(key)
+    if frames is None:
+        frames = [build_wave_frame(size, i / frame_count, layers)
+                  for i in range(frame_count)]
+        wave_frame_cache[key] = frames
+    return frames
+
+def get_wave_phase(row, col, frame_count):
+    """Get a fixed per-hexagon frame offset so neighbouring waves are out of step"""
+    return (row * 37 + col * 11) % frame_count
+
+def draw_waves(x, y, size, phase=0, surface=None):
+    """Draw the animated waves of one hexagon from the precomputed wave loop"""
+    if surface is None:
+        surface = screen
+    layers = quality.settings['wave_layers']
+    frames = get_wave_frames(size, layers=layers)
+    loop_seconds = get_wave_loop(layers)[0] / WAVE_FRAME_RATE
+    frame_index = int(get_wave_seconds() / loop_seconds * len(frames)) + phase
+    surface.blit(frames[frame_index % len(frames)], (x - size, y - size))
+
+# Border passes for hexagon tiles: each colour is drawn as a solid and an anti-aliased outline
+HEX_BORDER_STYLES = {
+    'aged': [(255, 255, 255, 100), (0, 0, 0, 100)],
+    'plain': [(0, 0, 0, 100)],
+    'none': []
+}
 
-def draw_hexagon(x, y, size, color):
-    """Draw a hexagon with multi-layered waves and aged effect"""
-    points = []
+# Rasterized hexagon tiles keyed by (size, base color, border style)
+hex_tile_atlas = {}
+
+def build_hex_tile(size, color, border_style, shadow=True):
+    """Rasterize one hexagon tile with its shadow, sea gradient and anti-aliased border"""
+    shadow_offset = px(3)
+    tile_size = size * 2 + shadow_offset + 1  # Room for the shadow offset and the outline
+    local_points = []
     shadow_points = []
     
-    # Create hexagon points
+    # Create hexagon points relative to the tile, centered at (size, size)
     for i in range(6):
         angle_deg = 60 * i + 30
         angle_rad = math.pi / 180 * angle_deg
-        point_x = x + size * math.cos(angle_rad)
-        point_y = y + size * math.sin(angle_rad)
-        points.append((point_x, point_y))
-        shadow_points.append((point_x + 3, point_y + 3))
+        point_x = size + size * math.cos(angle_rad)
+        point_y = size + size * math.sin(angle_rad)
+        local_points.append((point_x, point_y))
+        shadow_points.append((point_x + shadow_offset, point_y + shadow_offset))
     
-    # Draw shadow with gradient
-    shadow_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-    pygame.draw.polygon(shadow_surface, SHADOW_COLOR, shadow_points)
-    screen.blit(shadow_surface, (x - size, y - size))
+    tile = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
     
-    # Draw base hexagon with sea blue gradient
-    gradient_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    # Draw shadow
+    if shadow:
+        pygame.draw.polygon(tile, SHADOW_COLOR, shadow_points)
+    
+    # Draw base hexagon with a gradient from a darker shade down to the base color
+    dark_color = (max(0, color[0] - 30), max(0, color[1] - 30), max(0, color[2] - 30))
+    gradient_surface = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
     for i in range(size * 2):
         progress = i / (size * 2)
         current_color = (
-            int(DARK_BLUE[0] + (BLUE[0] - DARK_BLUE[0]) * progress),
-            int(DARK_BLUE[1] + (BLUE[1] - DARK_BLUE[1]) * progress),
-            int(DARK_BLUE[2] + (BLUE[2] - DARK_BLUE[2]) * progress)
+            int(dark_color[0] + (color[0] - dark_color[0]) * progress),
+            int(dark_color[1] + (color[1] - dark_color[1]) * progress),
+            int(dark_color[2] + (color[2] - dark_color[2]) * progress)
         )
-        pygame.draw.line(gradient_surface, current_color, (0, i), (size * 2, i))
+        pygame.draw.line(gradient_surface, current_color, (0, i), (tile_size, i))
     
     # Apply gradient to hexagon
-    hex_mask = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-    pygame.draw.polygon(hex_mask, (255, 255, 255, 255), points)
+    hex_mask = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+    pygame.draw.polygon(hex_mask, (255, 255, 255, 255), local_points)
     gradient_surface.blit(hex_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-    screen.blit(gradient_surface, (x - size, y - size))
-    
-    # Draw waves with enhanced effect
-    draw_waves(x, y, size - 2)
-    
-    # Draw hexagon border with gradient
-    for i in range(2):
-        border_color = (255, 255, 255, 100) if i == 0 else (0, 0, 0, 100)
-        pygame.draw.polygon(screen, border_color, points, 1)
-        gfxdraw.aapolygon(screen, points, border_color)
-
-def draw_boat_with_animation(x, y, boat_image, offset):
+    tile.blit(gradient_surface, (0, 0))
+    
+    # Bake in the border; the solid pass goes last and opaque, as it was on the screen
+    for border_color in HEX_BORDER_STYLES[border_style]:
+        gfxdraw.aapolygon(tile, local_points, border_color)
+        pygame.draw.polygon(tile, border_color[:3], local_points, 1)
+    
+    return tile.convert_alpha()
+
+def get_hex_tile(size, color, border_style='aged', shadow=True):
+    """Get a hexagon tile from the atlas, rasterizing it on first use"""
+    key = (size, tuple(color[:3]), border_style, shadow)
+    tile = hex_tile_atlas.get(key)
+    if tile is None:
+        tile = build_hex_tile(size, color, border_style, shadow)
+        hex_tile_atlas[key] = tile
+    return tile
+
+def warm_hex_tile_atlas(tiles=((HEX_SIZE, BLUE, 'aged'),)):
+    """Rasterize the given (size, color, border style) tiles ahead of the first frame"""
+    for size, color, border_style in tiles:
+        get_hex_tile(size, color, border_style)
+
+def draw_hexagon(x, y, size, color, surface=None, border_style='aged', shadow=True):
+    """Draw the static part of a hexagon (shadow, sea gradient and aged border) with one blit"""
+    if surface is None:
+        surface = screen
+    surface.blit(get_hex_tile(size, color, border_style, shadow), (x - size, y - size))
+
+# Pre-rotated boat frames over the rocking range, keyed by (image, with shadow)
+boat_rotation_cache = {}
+
+def build_boat_rotations(image, shadow, smooth=BOAT_ROTATION_SMOOTH):
+    """Rotate a boat image once per angle step across the rocking range, optionally over its shadow"""
+    frames = []
+    steps = round(BOAT_ROCK_ANGLE / BOAT_ROTATION_STEP)
+    for i in range(-steps, steps + 1):
+        angle = i * BOAT_ROTATION_STEP
+        if smooth:
+            rotated = pygame.transform.rotozoom(image, angle, 1)
+        else:
+            rotated = pygame.transform.rotate(image, angle)
+        if not shadow:
+            frames.append(rotated)
+            continue
+        
+        # Bake in the shadow, offset 3 layout pixels down and right of the boat centre
+        shadow_offset = px(3)
+        width = max(rotated.get_width(), boat_size + 2 * shadow_offset)
+        height = max(rotated.get_height(), boat_size + 2 * shadow_offset)
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
+        center = (width // 2, height // 2)
+        pygame.draw.circle(frame, SHADOW_COLOR, (center[0] + shadow_offset, center[1] + shadow_offset), boat_size//2)
+        frame.blit(rotated, rotated.get_rect(center=center))
+        frames.append(frame.convert_alpha())
+    return frames
+
+def get_rotated_boat(image, angle, shadow=False):
+    """Get the pre-rotated boat frame nearest to angle"""
+    key = (image, shadow)
+    frames = boat_rotation_cache.get(key)
+    if frames is None:
+        frames = build_boat_rotations(image, shadow)
+        boat_rotation_cache[key] = frames
+    steps = len(frames) // 2
+    index = round(angle / BOAT_ROTATION_STEP) + steps
+    return frames[max(0, min(len(frames) - 1, index))]
+
+def draw_boat_with_animation(x, y, boat_image, offset, surface=None):
     """Draw boat with simple rocking animation"""
+    if surface is None:
+        surface = screen
     # Calculate boat movement
-    boat_y = y + math.sin(animation_time * BOAT_ROCK_SPEED) * BOAT_ROCK_AMPLITUDE
-    boat_angle = math.sin(animation_time * BOAT_ROCK_SPEED) * 5  # Rock by 5 degrees
-    
-    # Draw boat shadow
-    shadow_surface = pygame.Surface((boat_size, boat_size), pygame.SRCALPHA)
-    pygame.draw.circle(shadow_surface, SHADOW_COLOR, (boat_size//2, boat_size//2), boat_size//2)
-    screen.blit(shadow_surface, (x - boat_size//2 + 3, boat_y - boat_size//2 + 3))
+    anim_time = interpolate(previous_animation_time, animation_time)
+    boat_y = y + math.sin(anim_time * BOAT_ROCK_SPEED) * BOAT_ROCK_AMPLITUDE
+    boat_angle = math.sin(anim_time * BOAT_ROCK_SPEED) * BOAT_ROCK_ANGLE
     
-    # Rotate and draw boat
-    rotated_boat = pygame.transform.rotate(boat_image, boat_angle)
+    # Draw the rocked boat together with its shadow
+    rotated_boat = get_rotated_boat(boat_image, boat_angle, shadow=True)
     boat_rect = rotated_boat.get_rect(center=(x, boat_y))
-    screen.blit(rotated_boat, boat_rect)
+    surface.blit(rotated_boat, boat_rect)
+    dirty.mark(boat_rect)
 
 def draw_card(surface, rect, color, symbol=None, text=None, selected=False):
     """Draw a modern-looking card with shadow and gradient effects"""
     # Draw card shadow with blur effect
-    shadow_rect = rect.copy()
-    shadow_rect.x += 5
-    shadow_rect.y += 5
-    shadow_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(shadow_surface, (0, 0, 0, 50), (0, 0, rect.width, rect.height), border_radius=10)
-    surface.blit(shadow_surface, (shadow_rect.x - rect.x, shadow_rect.y - rect.y))
+    if quality.settings['shadows']:
+        shadow_rect = rect.copy()
+        shadow_rect.x += px(5)
+        shadow_rect.y += px(5)
+        shadow_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surface, (0, 0, 0, 50), (0, 0, rect.width, rect.height), border_radius=px(10))
+        surface.blit(shadow_surface, (shadow_rect.x - rect.x, shadow_rect.y - rect.y))
     
     # Draw card background with gradient
-    gradient_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    for i in range(rect.height):
-        progress = i / rect.height
-        current_color = (
-            int(color[0] + (255 - color[0]) * progress),
-            int(color[1] + (255 - color[1]) * progress),
-            int(color[2] + (255 - color[2]) * progress)
-        )
-        pygame.draw.line(gradient_surface, current_color, (0, i), (rect.width, i))
-    
-    # Apply gradient to card
-    surface.blit(gradient_surface, (rect.x, rect.y))
+    surface.blit(get_gradient_surface(rect.size, (color, WHITE)), (rect.x, rect.y))
     
     # Draw border with glow effect if selected
     if selected:
-        glow_surface = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface, (*GOLD[:3], 100), (0, 0, rect.width + 10, rect.height + 10), border_radius=15)
-        surface.blit(glow_surface, (rect.x - 5, rect.y - 5))
+        glow = px(5)
+        glow_surface = pygame.Surface((rect.width + 2 * glow, rect.height + 2 * glow), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surface, (*GOLD[:3], 100), (0, 0, rect.width + 2 * glow, rect.height + 2 * glow),
+                         border_radius=px(15))
+        surface.blit(glow_surface, (rect.x - glow, rect.y - glow))
     
     border_color = GOLD if selected else BLACK
-    border_width = 3 if selected else 1
-    pygame.draw.rect(surface, border_color, rect, border_width, border_radius=10)
+    border_width = px(3) if selected else px(1)
+    pygame.draw.rect(surface, border_color, rect, border_width, border_radius=px(10))
     
     if symbol:
         # Draw symbol with shadow
-        symbol_shadow = card_font.render(symbol, True, (0, 0, 0, 100))
-        symbol_text = card_font.render(symbol, True, BLACK)
+        symbol_shadow = render_text(card_font, symbol, (0, 0, 0, 100))
+        symbol_text = render_text(card_font, symbol, BLACK)
         symbol_rect = symbol_text.get_rect(center=rect.center)
-        surface.blit(symbol_shadow, (symbol_rect.x + 2, symbol_rect.y + 2))
+        surface.blit(symbol_shadow, (symbol_rect.x + px(2), symbol_rect.y + px(2)))
         surface.blit(symbol_text, symbol_rect)
     
     if text:
         # Draw text with shadow
-        text_shadow = instruction_font.render(text, True, (0, 0, 0, 100))
-        text_surface = instruction_font.render(text, True, BLACK)
-        text_rect = text_surface.get_rect(centerx=rect.centerx, bottom=rect.bottom - 10)
-        surface.blit(text_shadow, (text_rect.x + 2, text_rect.y + 2))
+        text_shadow = render_text(instruction_font, text, (0, 0, 0, 100))
+        text_surface = render_text(instruction_font, text, BLACK)
+        text_rect = text_surface.get_rect(centerx=rect.centerx, bottom=rect.bottom - px(10))
+        surface.blit(text_shadow, (text_rect.x + px(2), text_rect.y + px(2)))
         surface.blit(text_surface, text_rect)
 
 def draw_button(surface, rect, text, color, hover=False):
     """Draw a modern button with hover effect and glow"""
     if hover:
         # Create glow effect
-        glow_surface = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface, (*color[:3], 100), (0, 0, rect.width + 10, rect.height + 10), border_radius=15)
-        surface.blit(glow_surface, (rect.x - 5, rect.y - 5))
+        glow = px(5)
+        glow_surface = pygame.Surface((rect.width + 2 * glow, rect.height + 2 * glow), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surface, (*color[:3], 100), (0, 0, rect.width + 2 * glow, rect.height + 2 * glow),
+                         border_radius=px(15))
+        surface.blit(glow_surface, (rect.x - glow, rect.y - glow))
         color = (min(255, color[0] + 30), min(255, color[1] + 30), min(255, color[2] + 30))
     
     # Draw button background with gradient
-    gradient_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    for i in range(rect.height):
-        progress = i / rect.height
-        current_color = (
-            int(color[0] + (255 - color[0]) * progress),
-            int(color[1] + (255 - color[1]) * progress),
-            int(color[2] + (255 - color[2]) * progress)
-        )
-        pygame.draw.line(gradient_surface, current_color, (0, i), (rect.width, i))
-    
-    surface.blit(gradient_surface, (rect.x, rect.y))
+    surface.blit(get_gradient_surface(rect.size, (color, WHITE)), (rect.x, rect.y))
     
     # Draw border
-    pygame.draw.rect(surface, BLACK, rect, 1, border_radius=10)
+    pygame.draw.rect(surface, BLACK, rect, px(1), border_radius=px(10))
     
     # Draw text with shadow
-    text_shadow = game_font.render(text, True, (0, 0, 0, 100))
-    text_surface = game_font.render(text, True, BLACK)
+    text_shadow = render_text(game_font, text, (0, 0, 0, 100))
+    text_surface = render_text(game_font, text, BLACK)
     text_rect = text_surface.get_rect(center=rect.center)
-    surface.blit(text_shadow, (text_rect.x + 2, text_rect.y + 2))
+    surface.blit(text_shadow, (text_rect.x + px(2), text_rect.y + px(2)))
     surface.blit(text_surface, text_rect)
 
-def draw_dice(value):
+def draw_dice(value, surface=None):
     """Draw the dice with dots instead of numbers at the bottom of the screen"""
-    # Position dice at the bottom center of the screen, moved up by 40 pixels
-    dice_rect = pygame.Rect(WIDTH//2 - DICE_SIZE//2, HEIGHT - DICE_SIZE - DICE_MARGIN - 40, 
+    if surface is None:
+        surface = screen
+    # Position dice at the bottom center of the screen, moved up by 40 layout pixels
+    dice_rect = pygame.Rect(WIDTH//2 - DICE_SIZE//2, HEIGHT - DICE_SIZE - DICE_MARGIN - px(40), 
                           DICE_SIZE, DICE_SIZE)
     
     # Draw dice background with shadow
     shadow_rect = dice_rect.copy()
-    shadow_rect.x += 3
-    shadow_rect.y += 3
-    draw_rounded_rect(screen, shadow_rect, SHADOW_COLOR, 10)
+    shadow_rect.x += px(3)
+    shadow_rect.y += px(3)
+    draw_rounded_rect(surface, shadow_rect, SHADOW_COLOR, px(10))
     
     # Draw main dice
-    draw_rounded_rect(screen, dice_rect, WHITE, 10)
-    pygame.draw.rect(screen, BLACK, dice_rect, 2, border_radius=10)
+    draw_rounded_rect(surface, dice_rect, WHITE, px(10))
+    pygame.draw.rect(surface, BLACK, dice_rect, px(2), border_radius=px(10))
     
     if value > 0:
         # Calculate dot positions based on dice value
@@ -950,208 +1437,222 @@ def draw_dice(value):
             dot_x = int(dice_rect.x + pos_x * DICE_SIZE)
             dot_y = int(dice_rect.y + pos_y * DICE_SIZE)
             # Draw shadow
-            pygame.draw.circle(screen, SHADOW_COLOR, (dot_x + 1, dot_y + 1), dot_radius)
+            pygame.draw.circle(surface, SHADOW_COLOR, (dot_x + px(1), dot_y + px(1)), dot_radius)
             # Draw dot
-            pygame.draw.circle(screen, BLACK, (dot_x, dot_y), dot_radius)
-
-def roll_dice():
-    """Roll the dice and return a random number between 1 and 6"""
-    return random.randint(1, 6)
+            pygame.draw.circle(surface, BLACK, (dot_x, dot_y), dot_radius)
 
 def draw_card_stacks(screen):
     """Draw the accumulated card stacks on the left side of the board"""
     # Draw player info box
-    info_box = pygame.Rect(10, 10, INFO_BOX_WIDTH, INFO_BOX_HEIGHT)
-    draw_rounded_rect(screen, info_box, WHITE, 8)
-    pygame.draw.rect(screen, BLACK, info_box, 2, border_radius=8)
+    info_box = pygame.Rect(px(10), px(10), INFO_BOX_WIDTH, INFO_BOX_HEIGHT)
+    draw_rounded_rect(screen, info_box, WHITE, px(8))
+    pygame.draw.rect(screen, BLACK, info_box, px(2), border_radius=px(8))
     
-    label_font = pygame.font.Font(None, 20)  # Smaller font
-    y_offset = 20
+    label_font = get_font(None, LABEL_FONT_SIZE)  # Smaller font
+    y_offset = px(20)
     
-    for player in range(1, num_players + 1):
+    for player in range(1, game.num_players + 1):
         # Player header
         player_text = f"Player {player}:"
-        text = label_font.render(player_text, True, BLACK)
-        screen.blit(text, (20, y_offset))
+        text = render_text(label_font, player_text, BLACK)
+        screen.blit(text, (px(20), y_offset))
         
         # Card counts
         reflection_text = f"Self: {player_card_counts[player]['reflection']}"
-        text = label_font.render(reflection_text, True, BLACK)
-        screen.blit(text, (30, y_offset + 15))
+        text = render_text(label_font, reflection_text, BLACK)
+        screen.blit(text, (px(30), y_offset + px(15)))
         
         coping_text = f"Coping: {player_card_counts[player]['coping']}"
-        text = label_font.render(coping_text, True, BLACK)
-        screen.blit(text, (30, y_offset + 30))
+        text = render_text(label_font, coping_text, BLACK)
+        screen.blit(text, (px(30), y_offset + px(30)))
         
-        y_offset += 45
+        y_offset += px(45)
     
     # Draw card stacks with proper spacing and labels
-    stack_y = 120
+    stack_y = px(120)
     
-    for player in range(1, num_players + 1):
+    for player in range(1, game.num_players + 1):
         # Draw player label
-        player_label = label_font.render(f"Player {player}", True, BLACK)
-        player_rect = player_label.get_rect(x=20, y=stack_y)
+        player_label = render_text(label_font, f"Player {player}", BLACK)
+        player_rect = player_label.get_rect(x=px(20), y=stack_y)
         screen.blit(player_label, player_rect)
         
         # Draw reflection pile
-        reflection_y = stack_y + 25
-        reflection_label = label_font.render("Reflection", True, LIGHT_BLUE)
-        screen.blit(reflection_label, (20, reflection_y))
+        reflection_y = stack_y + px(25)
+        reflection_label = render_text(label_font, "Reflection", LIGHT_BLUE)
+        screen.blit(reflection_label, (px(20), reflection_y))
         
         # Draw reflection cards in a stack
         if len(collected_cards[player]['reflection']) > 0:
-            pile_rect = pygame.Rect(20, reflection_y + 20, 40, 60)
-            draw_rounded_rect(screen, pile_rect, LIGHT_BLUE, 5)
-            pygame.draw.rect(screen, BLACK, pile_rect, 1, border_radius=5)
+            pile_rect = pygame.Rect(px(20), reflection_y + px(20), px(40), px(60))
+            draw_rounded_rect(screen, pile_rect, LIGHT_BLUE, px(5))
+            pygame.draw.rect(screen, BLACK, pile_rect, px(1), border_radius=px(5))
             
             # Draw number of cards on the pile
             count = len(collected_cards[player]['reflection'])
             if count > 0:
-                count_text = label_font.render(str(count), True, BLACK)
+                count_text = render_text(label_font, str(count), BLACK)
                 count_rect = count_text.get_rect(center=pile_rect.center)
                 screen.blit(count_text, count_rect)
         
         # Draw coping pile
-        coping_y = reflection_y + 90
-        coping_label = label_font.render("Coping", True, GOLD)
-        screen.blit(coping_label, (20, coping_y))
+        coping_y = reflection_y + px(90)
+        coping_label = render_text(label_font, "Coping", GOLD)
+        screen.blit(coping_label, (px(20), coping_y))
         
         # Draw coping cards in a stack
         if len(collected_cards[player]['coping']) > 0:
-            pile_rect = pygame.Rect(20, coping_y + 20, 40, 60)
-            draw_rounded_rect(screen, pile_rect, GOLD, 5)
-            pygame.draw.rect(screen, BLACK, pile_rect, 1, border_radius=5)
+            pile_rect = pygame.Rect(px(20), coping_y + px(20), px(40), px(60))
+            draw_rounded_rect(screen, pile_rect, GOLD, px(5))
+            pygame.draw.rect(screen, BLACK, pile_rect, px(1), border_radius=px(5))
             
             # Draw number of cards on the pile
             count = len(collected_cards[player]['coping'])
             if count > 0:
-                count_text = label_font.render(str(count), True, BLACK)
+                count_text = render_text(label_font, str(count), BLACK)
                 count_rect = count_text.get_rect(center=pile_rect.center)
                 screen.blit(count_text, count_rect)
         
         # Move to next player's section
-        stack_y += 200
+        stack_y += px(200)
+
+def fly_card_to_stack(player, card_type):
+    """Send a collected card flying from the middle of the screen to the player's stack"""
+    offset_y = len(collected_cards[player][card_type]) * CARD_STACK_OFFSET
+    start_pos = (WIDTH // 2 - LARGE_CARD_SIZE // 2, HEIGHT // 2 - LARGE_CARD_SIZE // 2)
+    base_y = px(120) if card_type == 'reflection' else px(260)
+    end_pos = (px(20), base_y + offset_y)
+    animation_cards.append(MovingCard(card_type, start_pos, end_pos))
+    collected_cards[player][card_type].append(end_pos)
+
+def on_game_event(event, details):
+    """Play the sounds and start the animations for what just happened in the game"""
+    global centered_card, EXCHANGE_STATE, SELECTED_CARD, game_state
+    
+    if event == EVENT_ROLLED:
+        play_sound(dice_roll_sound)
+    
+    elif event == EVENT_CARD_DRAWN:
+        play_sound(boat_sand_sound if details['card_type'] == 'reflection' else monster_sound)
+        centered_card = CenteredCard(details['symbol'], details['card_type'])
+    
+    elif event == EVENT_CARD_FLIPPED:
+        play_sound(card_flip_sound)
+        centered_card.state = 'instructions'
+        centered_card.flipping = True
+    
+    elif event == EVENT_CARD_COLLECTED:
+        play_sound(collect_card_sound)
+        centered_card = None
+        fly_card_to_stack(details['player'], details['card_type'])
+    
+    elif event == EVENT_CARD_DISCARDED:
+        centered_card = None
+    
+    elif event == EVENT_BOATS_MET:
+        EXCHANGE_STATE = 'selecting'
+        centered_card = ExchangeInterface(player_card_counts)
+    
+    elif event == EVENT_CARD_EXCHANGED:
+        play_sound(card_flip_sound)
+        if details['taken']:
+            # The card leaves the other player's stack and flies to the current player's
+            stack = collected_cards[details['other_player']][details['card_type']]
+            if stack:
+                stack.pop()
+            fly_card_to_stack(details['player'], details['card_type'])
+        EXCHANGE_STATE = None
+        SELECTED_CARD = None
+        centered_card = None
+    
+    elif event == EVENT_WON:
+        play_sound(victory_sound)  # Play victory trumpets
+        game_state = GAME_STATE_WINNER
+    
+    elif event == EVENT_BATTLE_LOST:
+        collected_cards[details['player']] = {'reflection': [], 'coping': []}
+
+game.subscribe(on_game_event)
 
-def check_collisions():
-    """Check if current player's boat has landed on an island or octopus"""
-    global card_display_state, current_card_symbol, centered_card, waiting_for_card_interaction
-    current_pos = player1_pos if current_player == 1 else player2_pos
+class BoatMove:
+    """Sails a boat along its route over normal frames, one cell per move_delay"""
+    def __init__(self, player, steps):
+        self.player = player
+        self.route = game.routes[player]
+        self.start = game.positions[player]
+        self.steps = steps
+        self.progress = 0.0  # Cells sailed so far
+        self.previous_progress = 0.0
+        play_sound(boat_move_sound)
     
-    try:
-        # Check for island collision
-        if current_pos in island_positions:
-            if player_card_counts[current_player]['reflection'] < 3:
-                play_sound(boat_sand_sound)
-                current_card_symbol = random.choice(CARD_SYMBOLS)
-                card_display_state = 'symbol'
-                centered_card = CenteredCard(current_card_symbol, 'reflection')
-                waiting_for_card_interaction = True
-                return True, 'reflection'
-        
-        # Check for octopus collision
-        elif current_pos in octopus_positions:
-            if player_card_counts[current_player]['reflection'] >= 3:
-                play_sound(monster_sound)
-                current_card_symbol = random.choice(COPING_SYMBOLS)
-                card_display_state = 'symbol'
-                centered_card = CenteredCard(current_card_symbol, 'coping')
-                waiting_for_card_interaction = True
-                return True, 'coping'
-        
-        return False, None
-    except Exception as e:
-        print(f"Error in check_collisions: {e}")
-        return False, None
+    def update(self):
+        """Sail on by one fixed step, sounding each hop to the next cell"""
+        self.previous_progress = self.progress
+        reached = int(self.progress)
+        self.progress = min(self.steps, self.progress + 1000 / (move_delay * SIMULATION_HZ))
+        while reached < int(self.progress):
+            reached += 1
+            if reached < self.steps:
+                play_sound(boat_move_sound)
+    
+    def is_finished(self):
+        return self.progress >= self.steps
+    
+    def get_boat_center(self):
+        """Screen position of the boat between the two cells it is sailing between"""
+        progress = interpolate(self.previous_progress, self.progress)
+        hop = min(int(progress), self.steps - 1)
+        fraction = progress - hop
+        from_row, from_col = board.position(self.route.cell(self.route.advance(self.start, hop)))
+        to_row, to_col = board.position(self.route.cell(self.route.advance(self.start, hop + 1)))
+        if to_row != from_row:
+            # Wrapping onto another row is a hop, not a glide across the board
+            return get_hex_center(to_row, to_col) if fraction >= 0.5 else get_hex_center(from_row, from_col)
+        from_x, from_y = get_hex_center(from_row, from_col)
+        to_x, to_y = get_hex_center(to_row, to_col)
+        return from_x + (to_x - from_x) * fraction, from_y + (to_y - from_y) * fraction
+
+def get_boat_center(player):
+    """Screen position of a player's boat, following it while it sails"""
+    if boat_move and boat_move.player == player:
+        return boat_move.get_boat_center()
+    return get_hex_center(*get_player_cell(player))
 
 def move_boat(steps):
-    """Move the current player's boat"""
-    global player1_pos, player2_pos, waiting_for_card_interaction, card_display_state, current_player
-    
-    try:
-        current_pos = player1_pos.copy() if current_player == 1 else player2_pos.copy()
-        initial_steps = steps
-        
-        for step in range(steps):
-            play_sound(boat_move_sound)
-            
-            if current_player == 1:
-                # Player 1: Moving right and down
-                at_row_end = current_pos['col'] == COLS - 1
-                
-                if at_row_end:
-                    if current_pos['row'] < ROWS - 1:
-                        current_pos['row'] += 1
-                    else:
-                        current_pos['row'] = 0
-                    current_pos['col'] = 0
-                else:
-                    current_pos['col'] = min(COLS - 1, current_pos['col'] + 1)
-            else:
-                # Player 2: Moving left and up
-                at_row_end = current_pos['col'] == 0
-                
-                if at_row_end:
-                    if current_pos['row'] > 0:
-                        current_pos['row'] -= 1
-                    else:
-                        current_pos['row'] = ROWS - 1
-                    current_pos['col'] = COLS - 1
-                else:
-                    current_pos['col'] = max(0, current_pos['col'] - 1)
-            
-            # Update the correct player's position
-            if current_player == 1:
-                player1_pos = current_pos.copy()
-            else:
-                player2_pos = current_pos.copy()
-            
-            # Update display
-            screen.fill(WHITE)
-            draw_game_state()
-            pygame.display.flip()
-            pygame.time.delay(move_delay)
-        
-        # After movement is complete, check for collisions or boat meeting
-        if steps == initial_steps:
-            # Check for boats meeting first
-            if check_boats_meeting():
-                return True, 'exchange'
-            
-            # Then check for island/octopus collisions
-            collision_result = check_collisions()
-            if collision_result[0]:  # If there was a collision
-                return collision_result
-            
-            # If no collision or meeting, switch players (in 2-player mode)
-            if not collision_result[0] and num_players == 2:
-                current_player = 2 if current_player == 1 else 1
-            
-            return False, None
-        
-        return False, None
-    except Exception as e:
-        print(f"Error in move_boat: {e}")
-        return False, None
+    """Start sailing the current player's boat; the game moves it once it arrives"""
+    global boat_move
+    boat_move = BoatMove(game.current_player, steps)
+
+def update_boat_move():
+    """Advance the sailing boat by one fixed step and land it on arrival"""
+    global boat_move
+    if boat_move:
+        boat_move.update()
+        if boat_move.is_finished():
+            boat_move = None
+            game.move()  # Resolves the landing: a meeting, a card, or the next turn
+
+def get_close_button_rect():
+    """Get the screen rect of the close button"""
+    button_size = px(30)  # Smaller close button
+    margin = px(15)  # Increased margin from 8 to 15 to move it down from the very top
+    return pygame.Rect(WIDTH - button_size - margin, margin, button_size, button_size)
 
 def draw_close_button():
     """Draw an X button in the top-right corner"""
-    button_size = 30  # Smaller close button
-    margin = 15  # Increased margin from 8 to 15 to move it down from the very top
-    x = WIDTH - button_size - margin
-    y = margin
+    button_rect = get_close_button_rect()
+    x, y, button_size = button_rect.x, button_rect.y, button_rect.width
     
     # Draw button background
-    button_rect = pygame.Rect(x, y, button_size, button_size)
-    mouse_pos = pygame.mouse.get_pos()
+    mouse_pos = get_mouse_pos()
     color = CLOSE_BUTTON_HOVER if button_rect.collidepoint(mouse_pos) else CLOSE_BUTTON_COLOR
     
-    draw_rounded_rect(screen, button_rect, color, 8)
-    pygame.draw.rect(screen, BLACK, button_rect, 2, border_radius=8)
+    draw_rounded_rect(screen, button_rect, color, px(8))
+    pygame.draw.rect(screen, BLACK, button_rect, px(2), border_radius=px(8))
     
     # Draw X
-    padding = 8
-    line_width = 3
+    padding = px(8)
+    line_width = px(3)
     pygame.draw.line(screen, WHITE, 
                     (x + padding, y + padding),
                     (x + button_size - padding, y + button_size - padding),
@@ -1161,145 +1662,309 @@ def draw_close_button():
                     (x + padding, y + button_size - padding),
                     line_width)
     
-    return button_rect
-
-def draw_game_state():
-    global wave_offset, animation_time
-    
-    # Fill background with light green color
-    screen.fill(LIGHT_GREEN)
+    return dirty.mark(button_rect)
+
+class Layer:
+    """One scene layer: an off-screen surface re-rendered only when invalidated"""
+    def __init__(self, render, key=None, cached=True, opaque=False):
+        self.render = render  # render(surface); returning False means the layer is empty
+        self.key = key  # Optional function; the layer is invalidated whenever its value changes
+        self.cached = cached  # Uncached layers animate every frame and draw straight onto the compose target
+        self.opaque = opaque
+        self.surface = None
+        self.regions = []  # Content bounds of each non-empty tile, found when the layer is re-rendered
+        self.dirty = True
+        self.last_key = None
+        self.visible = True
+    
+    def invalidate(self):
+        """Re-render the layer before the next composite"""
+        self.dirty = True
+    
+    def refresh(self, size):
+        """Re-render the layer if it is invalidated; returns True if it was"""
+        if self.key is not None:
+            key = self.key()
+            if key != self.last_key:
+                self.last_key = key
+                self.dirty = True
+        if self.surface is None or self.surface.get_size() != size:
+            if self.opaque:
+                self.surface = pygame.Surface(size).convert()
+            else:
+                self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self.dirty = True
+        if not self.dirty:
+            return False
+        
+        if not self.opaque:
+            self.surface.fill((0, 0, 0, 0))
+        self.visible = self.render(self.surface) is not False
+        self.regions = [self.surface.get_rect()] if self.opaque else self.find_regions()
+        self.dirty = False
+        return True
     
-    # Update animation
+    def find_regions(self):
+        """Content bounds of the surface, one rect per non-empty tile"""
+        regions = []
+        width, height = self.surface.get_size()
+        for top in range(0, height, LAYER_TILE_SIZE):
+            for left in range(0, width, LAYER_TILE_SIZE):
+                tile = pygame.Rect(left, top, LAYER_TILE_SIZE, LAYER_TILE_SIZE).clip(self.surface.get_rect())
+                bounds = self.surface.subsurface(tile).get_bounding_rect()
+                if bounds:
+                    regions.append(bounds.move(left, top))
+        return regions
+
+class LayerCompositor:
+    """Named layers composited bottom to top onto a target surface"""
+    def __init__(self):
+        self.layers = OrderedDict()
+    
+    def add(self, name, render, key=None, cached=True, opaque=False):
+        """Add a layer on top of the existing ones"""
+        layer = Layer(render, key, cached, opaque)
+        self.layers[name] = layer
+        return layer
+    
+    def invalidate(self, *names):
+        """Invalidate the named layers, or every layer if none are given"""
+        for name in names or self.layers:
+            self.layers[name].invalidate()
+    
+    def compose(self, target):
+        """Refresh invalidated layers and composite them all onto target"""
+        size = target.get_size()
+        for layer in self.layers.values():
+            if not layer.cached:
+                layer.render(target)
+                continue
+            if layer.refresh(size):
+                dirty.mark_all()
+            if layer.visible:
+                target.blits([(layer.surface, region.topleft, region) for region in layer.regions], doreturn=False)
+
+def update_board_animation():
+    """Advance the board animations by one fixed step"""
+    global wave_offset, animation_time, previous_wave_offset, previous_animation_time
+    previous_wave_offset = wave_offset
+    previous_animation_time = animation_time
     wave_offset += WAVE_SPEED
     animation_time += 0.1
-    
-    # Draw hexagonal grid
+
+def draw_game_state():
+    # Composite the board screen, re-rendering only the layers that changed; the loop adds the close button
+    game_layers.compose(screen)
+
+# Board layer: the island/octopus blits and the sea bounds are laid out with it
+board_piece_blits = []
+board_bounds = None
+
+def get_board_layer_key():
+    """Key identifying everything that is baked into the board layer"""
+    return (board, board.version, quality.settings['shadows'])
+
+def render_board_layer(surface):
+    """Draw the background and the hexagon tiles, and lay out the pieces"""
+    global board_piece_blits, board_bounds
+    surface.fill(LIGHT_GREEN)
+    tile_rects = []
     for row in range(ROWS):
         for col in range(COLS):
             x, y = get_hex_center(row, col)
-            draw_hexagon(x, y, HEX_SIZE, BLUE)  # Keep hexagons blue for sea
-            
-            pos = {'row': row, 'col': col}
-            if pos in island_positions:
-                island_x = x - island_size // 2
-                island_y = y - island_size // 2
-                screen.blit(island_image, (island_x, island_y))
-            
-            if pos in octopus_positions:
-                octopus_x = x - octopus_size // 2
-                octopus_y = y - octopus_size // 2
-                screen.blit(octopus_image, (octopus_x, octopus_y))
+            draw_hexagon(x, y, HEX_SIZE, BLUE, surface, shadow=quality.settings['shadows'])  # Keep hexagons blue for sea
+            tile_rects.append(pygame.Rect(x - HEX_SIZE, y - HEX_SIZE, 2 * HEX_SIZE, 2 * HEX_SIZE))
+    
+    # The animated sea stays within the tiles, so this is what changes frame to frame
+    board_bounds = tile_rects[0].unionall(tile_rects[1:])
+    
+    # Islands and octopuses sit on top of the waves, so they are kept as one blit batch
+    board_piece_blits = []
+    for row, col, cell in board.occupied_cells():
+        x, y = get_hex_center(row, col)
+        if cell == ISLAND:
+            board_piece_blits.append((island_image, (x - island_size // 2, y - island_size // 2)))
+        else:
+            board_piece_blits.append((octopus_image, (x - octopus_size // 2, y - octopus_size // 2)))
+
+def render_sea_layer(surface):
+    """Draw the animated waves of every hexagon"""
+    wave_frame_count = len(get_wave_frames(HEX_SIZE - px(2), layers=quality.settings['wave_layers']))
+    for row in range(ROWS):
+        for col in range(COLS):
+            x, y = get_hex_center(row, col)
+            draw_waves(x, y, HEX_SIZE - px(2), get_wave_phase(row, col, wave_frame_count), surface)
+    dirty.mark(board_bounds)
+
+def render_pieces_layer(surface):
+    """Draw the islands, octopuses and the rocking boats"""
+    surface.blits(board_piece_blits, doreturn=False)
     
     # Draw boats with enhanced animation
-    boat1_x, boat1_y = get_hex_center(player1_pos['row'], player1_pos['col'])
-    draw_boat_with_animation(boat1_x, boat1_y, boat_image, boat1_offset)
-    
-    if num_players == 2:
-        boat2_x, boat2_y = get_hex_center(player2_pos['row'], player2_pos['col'])
-        draw_boat_with_animation(boat2_x, boat2_y, boat2_image, boat2_offset)
+    boat1_x, boat1_y = get_boat_center(1)
+    draw_boat_with_animation(boat1_x, boat1_y, boat_image, boat1_offset, surface)
     
+    if game.num_players == 2:
+        boat2_x, boat2_y = get_boat_center(2)
+        draw_boat_with_animation(boat2_x, boat2_y, boat2_image, boat2_offset, surface)
+
+def get_hud_layer_key():
+    """Key identifying everything the HUD shows"""
+    return (game.roll_value, game.current_player, game.num_players, battle_button.is_hovered, quality.tier,
+            tuple((counts['reflection'], counts['coping']) for counts in player_card_counts.values()),
+            tuple((len(cards['reflection']), len(cards['coping'])) for cards in collected_cards.values()))
+
+def render_hud_layer(surface):
+    """Draw the compass, dice, card stacks, turn indicator and battle button"""
     # Draw compass rose in bottom right
-    draw_compass_rose()
+    draw_compass_rose(surface)
     
     # Draw dice at the bottom center
-    draw_dice(current_roll)
+    draw_dice(game.roll_value, surface)
     
     # Draw card stacks on the left
-    draw_card_stacks(screen)
+    draw_card_stacks(surface)
     
     # Draw current player indicator aligned with dice
-    player_text = f"Player {current_player}'s Turn"
-    text = game_font.render(player_text, True, BLACK)
+    player_text = f"Player {game.current_player}'s Turn"
+    text = render_text(game_font, player_text, BLACK)
     # Position text at the same height as the dice, but on the right side
-    text_rect = text.get_rect(right=WIDTH - 20, centery=HEIGHT - DICE_SIZE - DICE_MARGIN - 40)
+    text_rect = text.get_rect(right=WIDTH - px(20), centery=HEIGHT - DICE_SIZE - DICE_MARGIN - px(40))
     
     # Draw background for player indicator
     bg_rect = text_rect.copy()
-    bg_rect.inflate_ip(20, 10)
-    draw_rounded_rect(screen, bg_rect, PARCHMENT_COLOR, 10)
-    pygame.draw.rect(screen, MAP_BORDER, bg_rect, 2, border_radius=10)
+    bg_rect.inflate_ip(px(20), px(10))
+    draw_rounded_rect(surface, bg_rect, PARCHMENT_COLOR, px(10))
+    pygame.draw.rect(surface, MAP_BORDER, bg_rect, px(2), border_radius=px(10))
     
-    screen.blit(text, text_rect)
+    surface.blit(text, text_rect)
     
-    # Draw close button in top right
-    draw_close_button()
-    
-    if game_state == GAME_STATE_WINNER:
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
-        
-        # Draw winner announcement
-        winner_text = f"Player {check_winner()} Wins!"
-        text = title_font.render(winner_text, True, COMPASS_GOLD)
-        text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
-        
-        # Draw decorative background for winner text
-        bg_rect = text_rect.copy()
-        bg_rect.inflate_ip(60, 40)
-        draw_rounded_rect(screen, bg_rect, MAP_BORDER, 15)
-        pygame.draw.rect(screen, COMPASS_GOLD, bg_rect, 4, border_radius=15)
-        
-        screen.blit(text, text_rect)
+    battle_button.draw(surface)
+
+def get_modal_layer_key():
+    """Key identifying the card or exchange interface on display"""
+    if not centered_card:
+        return None
+    return (centered_card, getattr(centered_card, 'state', None),
+            getattr(centered_card, 'selected_index', None))
+
+def render_modal_layer(surface):
+    """Draw the centered card or the exchange interface, if one is up"""
+    if not centered_card:
+        return False
+    centered_card.draw(surface)
+
+def render_flying_cards_layer(surface):
+    """Draw the cards moving to the stacks"""
+    for card in animation_cards:
+        card.draw(surface, get_font(None, LABEL_FONT_SIZE))
+
+def render_overlay_layer(surface):
+    """Draw the winner announcement over the board"""
+    if game_state != GAME_STATE_WINNER:
+        return False
+    
+    # Draw semi-transparent overlay
+    surface.fill((0, 0, 0, 128))
+    
+    # Draw winner announcement
+    winner_text = f"Player {game.winner} Wins!"
+    text = render_text(title_font, winner_text, COMPASS_GOLD)
+    text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
+    
+    # Draw decorative background for winner text
+    bg_rect = text_rect.copy()
+    bg_rect.inflate_ip(px(60), px(40))
+    draw_rounded_rect(surface, bg_rect, MAP_BORDER, px(15))
+    pygame.draw.rect(surface, COMPASS_GOLD, bg_rect, px(4), border_radius=px(15))
+    
+    surface.blit(text, text_rect)
+
+# Board screen layers, bottom to top
+game_layers = LayerCompositor()
+game_layers.add('board', render_board_layer, key=get_board_layer_key, opaque=True)
+game_layers.add('sea', render_sea_layer, cached=False)
+game_layers.add('pieces', render_pieces_layer, cached=False)
+game_layers.add('hud', render_hud_layer, key=get_hud_layer_key)
+game_layers.add('modal', render_modal_layer, key=get_modal_layer_key)
+game_layers.add('flying cards', render_flying_cards_layer, cached=False)
+game_layers.add('overlay', render_overlay_layer, key=lambda: game_state)
+
+# Menu artwork composed once, and the hover state shown on screen
+menu_layer = None
+menu_frame_key = None
 
 # Create a function to draw the menu
 def draw_menu():
+    """Draw the menu from its cached layer; returns False if the frame on screen is still current"""
+    global menu_layer, menu_frame_key
+    key = (get_close_button_rect().collidepoint(get_mouse_pos()), screen.get_size(), quality.tier)
+    if not MENU_NOISE_ANIMATED and not dirty.full and key == menu_frame_key:
+        return False
+    
+    if menu_layer is None or menu_frame_key is None or key[1:] != menu_frame_key[1:]:
+        compose_menu()
+        menu_layer = screen.copy()
+        dirty.mark_all()
+    else:
+        screen.blit(menu_layer, (0, 0))
+    
+    if MENU_NOISE_ANIMATED and quality.settings['menu_noise']:
+        screen.blit(get_noise_texture(WIDTH, HEIGHT), (0, 0))
+        dirty.mark_all()
+    
+    # Draw close button, the only part of the menu that reacts to hover
+    draw_close_button()
+    menu_frame_key = key
+    return True
+
+def compose_menu():
+    """Draw the static menu artwork onto the screen"""
     # Fill with parchment color
     screen.fill(PARCHMENT_COLOR)
     
     # Draw decorative border with gradient
-    border_width = 20
-    margin = 10
+    border_width = px(20)
+    margin = px(10)
     
     # Draw main border with gradient
-    gradient_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    for i in range(HEIGHT):
-        progress = i / HEIGHT
-        current_color = (
-            int(MAP_BORDER[0] + (COMPASS_GOLD[0] - MAP_BORDER[0]) * progress),
-            int(MAP_BORDER[1] + (COMPASS_GOLD[1] - MAP_BORDER[1]) * progress),
-            int(MAP_BORDER[2] + (COMPASS_GOLD[2] - MAP_BORDER[2]) * progress)
-        )
-        pygame.draw.line(gradient_surface, current_color, (margin, i), (WIDTH - margin, i))
-    
-    screen.blit(gradient_surface, (0, 0))
+    gradient_surface = get_gradient_surface((WIDTH - 2 * margin + 1, HEIGHT), (MAP_BORDER, COMPASS_GOLD))
+    screen.blit(gradient_surface, (margin, 0))
     
     # Draw corner decorations with glow effect
-    corner_size = 30
+    corner_size = px(30)
+    inset = px(5)
+    line_width = px(3)
     corners = [(margin, margin), (WIDTH-margin-corner_size, margin),
               (margin, HEIGHT-margin-corner_size), 
               (WIDTH-margin-corner_size, HEIGHT-margin-corner_size)]
     
     for x, y in corners:
-        glow_surface = pygame.Surface((corner_size + 10, corner_size + 10), pygame.SRCALPHA)
+        glow_surface = pygame.Surface((corner_size + 2 * inset, corner_size + 2 * inset), pygame.SRCALPHA)
         pygame.draw.rect(glow_surface, (*COMPASS_GOLD[:3], 100), 
-                        (0, 0, corner_size + 10, corner_size + 10), 3)
-        screen.blit(glow_surface, (x - 5, y - 5))
-        pygame.draw.rect(screen, MAP_BORDER, (x, y, corner_size, corner_size), 3)
-        pygame.draw.line(screen, COMPASS_GOLD, (x+5, y+5), 
-                        (x+corner_size-5, y+corner_size-5), 3)
-        pygame.draw.line(screen, COMPASS_GOLD, (x+corner_size-5, y+5),
-                        (x+5, y+corner_size-5), 3)
+                        (0, 0, corner_size + 2 * inset, corner_size + 2 * inset), line_width)
+        screen.blit(glow_surface, (x - inset, y - inset))
+        pygame.draw.rect(screen, MAP_BORDER, (x, y, corner_size, corner_size), line_width)
+        pygame.draw.line(screen, COMPASS_GOLD, (x+inset, y+inset), 
+                        (x+corner_size-inset, y+corner_size-inset), line_width)
+        pygame.draw.line(screen, COMPASS_GOLD, (x+corner_size-inset, y+inset),
+                        (x+inset, y+corner_size-inset), line_width)
     
     # Draw compass rose with glow
     draw_compass_rose()
     
-    # Draw close button
-    draw_close_button()
-    
     # Draw title with enhanced effect
-    title_shadow = title_font.render("Sea Journey", True, MAP_BORDER)
-    title_text = title_font.render("Sea Journey", True, COMPASS_GOLD)
+    title_shadow = render_text(title_font, "Sea Journey", MAP_BORDER)
+    title_text = render_text(title_font, "Sea Journey", COMPASS_GOLD)
     
-    shadow_rect = title_shadow.get_rect(centerx=WIDTH//2 + 4, centery=HEIGHT//4 + 4)
+    shadow_rect = title_shadow.get_rect(centerx=WIDTH//2 + px(4), centery=HEIGHT//4 + px(4))
     text_rect = title_text.get_rect(centerx=WIDTH//2, centery=HEIGHT//4)
     
     screen.blit(title_shadow, shadow_rect)
     screen.blit(title_text, text_rect)
     
     # Draw game explanation with enhanced styling
-    explanation_font = pygame.font.Font(None, 24)
+    explanation_font = get_font(None, EXPLANATION_FONT_SIZE)
     explanation_text = [
         "Welcome to Sea Journey!",
         "Collect reflection cards from islands and coping cards from octopuses.",
@@ -1309,43 +1974,35 @@ def draw_menu():
         "Press M to toggle music."
     ]
     
-    y_offset = HEIGHT//4 + 60
+    y_offset = HEIGHT//4 + px(60)
     for line in explanation_text:
         # Draw text shadow
-        shadow = explanation_font.render(line, True, (0, 0, 0, 100))
-        shadow_rect = shadow.get_rect(centerx=WIDTH//2 + 2, centery=y_offset + 2)
+        shadow = render_text(explanation_font, line, (0, 0, 0, 100))
+        shadow_rect = shadow.get_rect(centerx=WIDTH//2 + px(2), centery=y_offset + px(2))
         screen.blit(shadow, shadow_rect)
         
         # Draw main text
-        text = explanation_font.render(line, True, AGED_BLACK)
+        text = render_text(explanation_font, line, AGED_BLACK)
         text_rect = text.get_rect(centerx=WIDTH//2, centery=y_offset)
         screen.blit(text, text_rect)
-        y_offset += 25
+        y_offset += px(25)
     
     # Draw buttons with enhanced styling
-    button1_rect = pygame.Rect(WIDTH//2 - 150, HEIGHT//2 + 100, 300, 60)
-    button2_rect = pygame.Rect(WIDTH//2 - 150, HEIGHT//2 + 170, 300, 60)
+    button1_rect = pygame.Rect(WIDTH//2 - px(150), HEIGHT//2 + px(100), px(300), px(60))
+    button2_rect = pygame.Rect(WIDTH//2 - px(150), HEIGHT//2 + px(170), px(300), px(60))
     
+    glow = px(5)
     for rect in [button1_rect, button2_rect]:
         # Draw button glow
-        glow_surface = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
+        glow_surface = pygame.Surface((rect.width + 2 * glow, rect.height + 2 * glow), pygame.SRCALPHA)
         pygame.draw.rect(glow_surface, (*COMPASS_GOLD[:3], 100), 
-                        (0, 0, rect.width + 10, rect.height + 10), border_radius=15)
-        screen.blit(glow_surface, (rect.x - 5, rect.y - 5))
+                        (0, 0, rect.width + 2 * glow, rect.height + 2 * glow), border_radius=px(15))
+        screen.blit(glow_surface, (rect.x - glow, rect.y - glow))
         
         # Draw button background with gradient
-        gradient_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        for i in range(rect.height):
-            progress = i / rect.height
-            current_color = (
-                int(PARCHMENT_COLOR[0] + (COMPASS_GOLD[0] - PARCHMENT_COLOR[0]) * progress),
-                int(PARCHMENT_COLOR[1] + (COMPASS_GOLD[1] - PARCHMENT_COLOR[1]) * progress),
-                int(PARCHMENT_COLOR[2] + (COMPASS_GOLD[2] - PARCHMENT_COLOR[2]) * progress)
-            )
-            pygame.draw.line(gradient_surface, current_color, (0, i), (rect.width, i))
-        
+        gradient_surface = get_gradient_surface(rect.size, (PARCHMENT_COLOR, COMPASS_GOLD))
         screen.blit(gradient_surface, (rect.x, rect.y))
-        pygame.draw.rect(screen, MAP_BORDER, rect, 2, border_radius=10)
+        pygame.draw.rect(screen, MAP_BORDER, rect, px(2), border_radius=px(10))
     
     # Draw button text with shadow
     button_texts = ["1. Single Player", "2. Two Players"]
@@ -1353,157 +2010,46 @@ def draw_menu():
     
     for text, rect in zip(button_texts, button_rects):
         # Draw text shadow
-        shadow = game_font.render(text, True, (0, 0, 0, 100))
+        shadow = render_text(game_font, text, (0, 0, 0, 100))
         shadow_rect = shadow.get_rect(center=rect.center)
-        shadow_rect.x += 2
-        shadow_rect.y += 2
+        shadow_rect.x += px(2)
+        shadow_rect.y += px(2)
         screen.blit(shadow, shadow_rect)
         
         # Draw main text
-        text_surface = game_font.render(text, True, AGED_BLACK)
+        text_surface = render_text(game_font, text, AGED_BLACK)
         text_rect = text_surface.get_rect(center=rect.center)
         screen.blit(text_surface, text_rect)
     
-    # Add noise texture for aged look
-    noise = create_noise_texture(WIDTH, HEIGHT)
-    screen.blit(noise, (0, 0))
-    
-    pygame.display.flip()
-
-# Add this function to check for boats meeting
-def check_boats_meeting():
-    """Check if the boats are in the same position"""
-    if num_players == 2 and player1_pos == player2_pos:
-        return True
-    return False
-
-# Update the check_winner function to require 4 reflection and 4 coping cards
-def check_winner():
-    """Check if either player has won"""
-    for player in [1, 2]:
-        reflection_cards = player_card_counts[player]['reflection']
-        coping_cards = player_card_counts[player]['coping']
-        
-        # Player needs 4 reflection cards AND 4 coping cards to win
-        if reflection_cards >= 4 and coping_cards >= 4:
-            play_sound(victory_sound)  # Play victory trumpets
-            return player
-    return None
+    # Add noise texture for aged look (animated grain is added per frame by draw_menu)
+    if not MENU_NOISE_ANIMATED and quality.settings['menu_noise']:
+        screen.blit(get_noise_texture(WIDTH, HEIGHT), (0, 0))
 
-# Update the handle_card_interaction function
 def handle_card_interaction(event):
-    """Handle card interaction events"""
-    global waiting_for_card_interaction, card_display_state, current_card_symbol
-    global centered_card, can_roll, current_player, game_state, EXCHANGE_STATE, SELECTED_CARD
+    """Advance the card or the exchange on display; the game sends back what happened"""
+    global EXCHANGE_STATE, SELECTED_CARD
     
     try:
         if EXCHANGE_STATE == 'moving' and SELECTED_CARD:
-            play_sound(card_flip_sound)
-            other_player = 2 if current_player == 1 else 1
-            card_type = SELECTED_CARD['type']
-            
-            # Check if player has reached the card limit
-            if player_card_counts[current_player][card_type] >= (MAX_REFLECTION_CARDS if card_type == 'reflection' else MAX_COPING_CARDS):
-                # Reset states without adding card
-                EXCHANGE_STATE = None
-                SELECTED_CARD = None
-                waiting_for_card_interaction = False
-                can_roll = True
-                current_player = 2 if current_player == 1 else 1
-                return
-            
-            # Remove card from other player
-            if player_card_counts[other_player][card_type] > 0:
-                player_card_counts[other_player][card_type] -= 1
-                if len(collected_cards[other_player][card_type]) > 0:
-                    collected_cards[other_player][card_type].pop()
-                
-                # Add card to current player
-                player_card_counts[current_player][card_type] += 1
-                offset_y = len(collected_cards[current_player][card_type]) * CARD_STACK_OFFSET
-                start_pos = (WIDTH // 2 - LARGE_CARD_SIZE // 2, HEIGHT // 2 - LARGE_CARD_SIZE // 2)
-                base_y = 120 if card_type == 'reflection' else 260
-                end_pos = (20, base_y + offset_y)
-                new_card = MovingCard(card_type, start_pos, end_pos)
-                animation_cards.append(new_card)
-                collected_cards[current_player][card_type].append(end_pos)
-            
-            # Reset states
-            EXCHANGE_STATE = None
-            SELECTED_CARD = None
-            waiting_for_card_interaction = False
-            can_roll = True
-            
-            # Check for winner
-            winner = check_winner()
-            if winner:
-                game_state = GAME_STATE_WINNER
+            game.exchange(SELECTED_CARD['type'])
+        
+        elif isinstance(centered_card, ExchangeInterface):
+            # Handle exchange interface interaction
+            if centered_card.selected_index is not None:
+                SELECTED_CARD = centered_card.cards[centered_card.selected_index]
+                EXCHANGE_STATE = 'moving'
+            elif not centered_card.cards:
+                game.exchange(None)  # Nothing to take, so the meeting just passes the turn
+        
+        elif centered_card:
+            # Flip the card to its instructions, then collect it
+            if game.card['face'] == 'symbol':
+                game.flip_card()
             else:
-                current_player = 2 if current_player == 1 else 1
-            
-        elif waiting_for_card_interaction and centered_card:
-            if isinstance(centered_card, ExchangeInterface):
-                # Handle exchange interface interaction
-                if centered_card.selected_index is not None:
-                    SELECTED_CARD = centered_card.cards[centered_card.selected_index]
-                    EXCHANGE_STATE = 'moving'
-            else:
-                # Handle regular card interaction
-                if card_display_state == 'symbol':
-                    play_sound(card_flip_sound)
-                    card_display_state = 'instructions'
-                    centered_card.state = 'instructions'
-                    centered_card.flipping = True
-                
-                elif card_display_state == 'instructions':
-                    card_type = centered_card.card_type
-                    
-                    # Check if player has reached the card limit
-                    if player_card_counts[current_player][card_type] >= (MAX_REFLECTION_CARDS if card_type == 'reflection' else MAX_COPING_CARDS):
-                        # Reset states without adding card
-                        card_display_state = None
-                        current_card_symbol = None
-                        centered_card = None
-                        waiting_for_card_interaction = False
-                        can_roll = True
-                        if num_players == 2:
-                            current_player = 2 if current_player == 1 else 1
-                        return
-                    
-                    play_sound(collect_card_sound)
-                    
-                    # Add card to current player's pile
-                    player_card_counts[current_player][card_type] += 1
-                    offset_y = len(collected_cards[current_player][card_type]) * CARD_STACK_OFFSET
-                    start_pos = (WIDTH // 2 - LARGE_CARD_SIZE // 2, HEIGHT // 2 - LARGE_CARD_SIZE // 2)
-                    base_y = 120 if card_type == 'reflection' else 260
-                    end_pos = (20, base_y + offset_y)
-                    new_card = MovingCard(card_type, start_pos, end_pos)
-                    animation_cards.append(new_card)
-                    collected_cards[current_player][card_type].append(end_pos)
-                    
-                    # Reset states
-                    card_display_state = None
-                    current_card_symbol = None
-                    centered_card = None
-                    waiting_for_card_interaction = False
-                    can_roll = True
-                    
-                    # Check for winner
-                    winner = check_winner()
-                    if winner:
-                        game_state = GAME_STATE_WINNER
-                    elif num_players == 2:
-                        current_player = 2 if current_player == 1 else 1
+                game.resolve_card()
     
     except Exception as e:
         print(f"Error in handle_card_interaction: {e}")
-        # Reset to a safe state
-        waiting_for_card_interaction = False
-        card_display_state = None
-        current_card_symbol = None
-        centered_card = None
-        can_roll = True
 
 # Initialize game state variables
 game_state = GAME_STATE_MENU
@@ -1512,170 +2058,47 @@ running = True
 # Add battle-related variables
 battle_state = None
 battle_animation_time = 0
+previous_battle_animation_time = 0
 battle_result = None
 battle_messages = []
-BATTLE_STATE_INTRO = 'intro'
-BATTLE_STATE_FIGHTING = 'fighting'
-BATTLE_STATE_WIN = 'win'
-BATTLE_STATE_LOSE = 'lose'
-BOAT_BATTLE_SPEED = 5
-ROCK_SPEED = 4
-FLOWER_SPEED = 7
-MONSTER_HITS_TO_WIN = 20  # Increased from 10 to 20 hits
-BOAT_STARTING_HEALTH = 3
-
-class BattleState:
-    def __init__(self):
-        self.state = BATTLE_STATE_INTRO
-        self.boat_x = WIDTH * 0.2
-        self.boat_y = HEIGHT * 0.8
-        self.monster_x = WIDTH * 0.8
-        self.monster_y = HEIGHT * 0.3
-        self.monster_size = 200
-        self.monster_health = MONSTER_HITS_TO_WIN
-        self.boat_health = BOAT_STARTING_HEALTH
-        self.rocks = []
-        self.flowers = []
-        self.rock_spawn_timer = 0
-        self.monster_move_timer = 0
-        self.intro_timer = 0
-        self.monster_visible = True
-        self.monster_moving = False
-        self.monster_target_x = self.monster_x
-        self.boat_rect = pygame.Rect(self.boat_x - boat_size//2, 
-                                   self.boat_y - boat_size//2, 
-                                   boat_size, boat_size)
-        self.monster_rect = pygame.Rect(self.monster_x - self.monster_size//2, 
-                                      self.monster_y - self.monster_size//2,
-                                      self.monster_size, self.monster_size)
-
-    def update(self):
-        if self.state == BATTLE_STATE_INTRO:
-            self.intro_timer += 1
-            if self.intro_timer > 180:  # 3 seconds at 60 FPS
-                self.state = BATTLE_STATE_FIGHTING
-        
-        elif self.state == BATTLE_STATE_FIGHTING:
-            # Update boat position based on keyboard input
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                self.boat_x = max(boat_size//2, self.boat_x - BOAT_BATTLE_SPEED)
-            if keys[pygame.K_RIGHT]:
-                self.boat_x = min(WIDTH - boat_size//2, self.boat_x + BOAT_BATTLE_SPEED)
-            
-            # Update boat rect
-            self.boat_rect.x = self.boat_x - boat_size//2
-            self.boat_rect.y = self.boat_y - boat_size//2
-            
-            # Monster movement
-            if not self.monster_moving and random.random() < 0.02:  # 2% chance to start moving
-                self.monster_moving = True
-                self.monster_visible = False
-                self.monster_target_x = random.randint(int(WIDTH * 0.6), int(WIDTH * 0.9))
-                self.monster_y = HEIGHT * 0.3  # Reset height when moving
-            
-            if self.monster_moving:
-                self.monster_move_timer += 1
-                if self.monster_move_timer > 60:  # Show monster after 1 second
-                    self.monster_visible = True
-                    # Move towards target
-                    dx = self.monster_target_x - self.monster_x
-                    if abs(dx) < 2:
-                        self.monster_moving = False
-                        self.monster_move_timer = 0
-                    else:
-                        self.monster_x += dx * 0.1
-            
-            # Update monster rect
-            self.monster_rect.x = self.monster_x - self.monster_size//2
-            self.monster_rect.y = self.monster_y - self.monster_size//2
-            
-            # Spawn rocks with increasing frequency as monster gets smaller
-            spawn_rate = max(15, 45 - (MONSTER_HITS_TO_WIN - self.monster_health))  # More aggressive scaling
-            self.rock_spawn_timer += 1
-            if self.rock_spawn_timer > spawn_rate and self.monster_visible:
-                self.rock_spawn_timer = 0
-                num_rocks = min(5, 2 + (MONSTER_HITS_TO_WIN - self.monster_health) // 4)  # Increase rocks based on damage
-                for _ in range(num_rocks):  # Spawn multiple rocks
-                    rock_x = self.monster_x + random.randint(-50, 50)
-                    self.rocks.append(Rock(rock_x, self.monster_y + self.monster_size//2))
-            
-            # Update and check rocks
-            for rock in self.rocks[:]:
-                rock.update()
-                if rock.y > HEIGHT:
-                    self.rocks.remove(rock)
-                elif rock.rect.colliderect(self.boat_rect):
-                    self.rocks.remove(rock)
-                    self.boat_health -= 1
-                    if self.boat_health <= 0:
-                        self.state = BATTLE_STATE_LOSE
-            
-            # Update and check flowers
-            for flower in self.flowers[:]:
-                flower.update()
-                if flower.y < 0:
-                    self.flowers.remove(flower)
-                elif self.monster_visible and flower.rect.colliderect(self.monster_rect):
-                    self.flowers.remove(flower)
-                    self.monster_health -= 1
-                    # Make monster smaller but increase attack frequency
-                    self.monster_size = max(40, 200 - (MONSTER_HITS_TO_WIN - self.monster_health) * 8)
-                    if self.monster_health <= 0:
-                        self.state = BATTLE_STATE_WIN
-
-class Rock:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 30
-        self.height = 30
-        self.speed = ROCK_SPEED
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-    
-    def update(self):
-        self.y += self.speed
-        self.rect.y = self.y
+BATTLE_SEA_COLOR = (0, 45, 98)  # Dark sea behind the battle
+BATTLE_WAVE_AMPLITUDE = px(20)  # Height of the battle waves in pixels
+BATTLE_WAVE_FREQUENCY = 0.02 / RENDER_SCALE  # Wave phase change per screen column (0.02 per layout column)
+BATTLE_WAVE_SPEED = 0.05  # Wave phase change per unit of battle animation time
+BATTLE_BOAT_SIZE = int(35 * 0.8)  # The battle plays out in layout pixels, with the board's full-scale boat
+OCTOPUS_GLOW_STEP = 2  # Pulsing glow radii are rounded to this many pixels, matching its ring spacing
+OCTOPUS_SPRITE_CACHE_MAX_BYTES = 4 * 1024 * 1024  # Glows and body of the current monster size (about 3.5 MB at 200)
+
+def draw_rock(rock):
+    """Draw a critical-thought rock falling from the monster"""
+    pygame.draw.circle(screen, (139, 69, 19), 
+                     ((rock.x + rock.width/2) * RENDER_SCALE,
+                      (interpolate(rock.previous_y, rock.y) + rock.height/2) * RENDER_SCALE), 
+                     px(rock.width//2))
+
+def draw_flower(flower):
+    """Draw a compassion flower rising from the boat"""
+    # Draw flower petals
+    petal_color = (255, 192, 203)  # Pink
+    center_color = (255, 255, 0)   # Yellow
+    center = ((flower.x + flower.width/2) * RENDER_SCALE,
+              (interpolate(flower.previous_y, flower.y) + flower.height/2) * RENDER_SCALE)
     
-    def draw(self, screen):
-        pygame.draw.circle(screen, (139, 69, 19), 
-                         (self.x + self.width//2, self.y + self.height//2), 
-                         self.width//2)
-
-class CompassionFlower:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 20
-        self.height = 20
-        self.speed = FLOWER_SPEED
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-    
-    def update(self):
-        self.y -= self.speed
-        self.rect.y = self.y
+    for i in range(6):
+        angle = i * 60
+        x = center[0] + math.cos(math.radians(angle)) * px(8)
+        y = center[1] + math.sin(math.radians(angle)) * px(8)
+        pygame.draw.circle(screen, petal_color, (int(x), int(y)), px(6))
     
-    def draw(self, screen):
-        # Draw flower petals
-        petal_color = (255, 192, 203)  # Pink
-        center_color = (255, 255, 0)   # Yellow
-        center = (self.x + self.width//2, self.y + self.height//2)
-        
-        for i in range(6):
-            angle = i * 60
-            x = center[0] + math.cos(math.radians(angle)) * 8
-            y = center[1] + math.sin(math.radians(angle)) * 8
-            pygame.draw.circle(screen, petal_color, (int(x), int(y)), 6)
-        
-        # Draw flower center
-        pygame.draw.circle(screen, center_color, center, 5)
+    # Draw flower center
+    pygame.draw.circle(screen, center_color, center, px(5))
 
 class BattleButton:
     def __init__(self):
-        self.width = 200
-        self.height = 50
-        self.x = 20  # Changed from right side to left side
-        self.y = HEIGHT - self.height - 20  # Keep at bottom
+        self.width = px(200)
+        self.height = px(50)
+        self.x = px(20)  # Changed from right side to left side
+        self.y = HEIGHT - self.height - px(20)  # Keep at bottom
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.color = (220, 20, 60)  # Crimson red
         self.hover_color = (240, 128, 128)  # Light coral
@@ -1691,226 +2114,181 @@ class BattleButton:
         # Draw button with gradient and glow effect
         if self.is_hovered:
             # Draw glow
-            glow_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
+            glow = px(5)
+            glow_surface = pygame.Surface((self.width + 2 * glow, self.height + 2 * glow), pygame.SRCALPHA)
             pygame.draw.rect(glow_surface, (*color[:3], 100), 
-                           (0, 0, self.width + 10, self.height + 10), border_radius=15)
-            screen.blit(glow_surface, (self.x - 5, self.y - 5))
+                           (0, 0, self.width + 2 * glow, self.height + 2 * glow), border_radius=px(15))
+            screen.blit(glow_surface, (self.x - glow, self.y - glow))
         
-        # Draw button background with gradient
-        gradient_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        for i in range(self.height):
-            progress = i / self.height
-            current_color = (
-                int(color[0] + (255 - color[0]) * progress * 0.5),
-                int(color[1] + (255 - color[1]) * progress * 0.5),
-                int(color[2] + (255 - color[2]) * progress * 0.5)
-            )
-            pygame.draw.line(gradient_surface, current_color, (0, i), (self.width, i))
-        
-        # Apply gradient to button
-        button_rect = pygame.Rect(0, 0, self.width, self.height)
-        pygame.draw.rect(gradient_surface, color, button_rect, border_radius=10)
+        # Draw button background with gradient, halfway towards white
+        color_bottom = tuple(c + (255 - c) * 0.5 for c in color)
+        gradient_surface = get_gradient_surface((self.width, self.height), (color, color_bottom), px(10), 'button')
         screen.blit(gradient_surface, (self.x, self.y))
         
         # Draw border
-        pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=10)
+        pygame.draw.rect(screen, BLACK, self.rect, px(2), border_radius=px(10))
         
         # Draw text with shadow
-        text_surface = game_font.render(self.text, True, WHITE)
+        text_surface = render_text(game_font, self.text, WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         
         # Draw shadow
-        shadow_surface = game_font.render(self.text, True, (0, 0, 0, 100))
+        shadow_surface = render_text(game_font, self.text, (0, 0, 0, 100))
         shadow_rect = text_rect.copy()
-        shadow_rect.x += 2
-        shadow_rect.y += 2
+        shadow_rect.x += px(2)
+        shadow_rect.y += px(2)
         screen.blit(shadow_surface, shadow_rect)
         
         # Draw main text
         screen.blit(text_surface, text_rect)
 
+# Pre-rendered battle wave band keyed by screen size
+battle_sea_cache = {}
+
+def get_battle_sea_strip(width, height):
+    """Get the battle wave band, drawn one extra wave length wide so it can scroll"""
+    key = (width, height)
+    strip = battle_sea_cache.get(key)
+    if strip is None:
+        wave_height = height * 0.85
+        top = int(wave_height - BATTLE_WAVE_AMPLITUDE)
+        wave_length = math.ceil(2 * math.pi / BATTLE_WAVE_FREQUENCY)
+        strip = pygame.Surface((width + wave_length, height - top)).convert()
+        strip.fill(BATTLE_SEA_COLOR)
+        for i in range(strip.get_width()):
+            y = wave_height + math.sin(i * BATTLE_WAVE_FREQUENCY) * BATTLE_WAVE_AMPLITUDE - top
+            pygame.draw.line(strip, WAVE_COLOR, (i, y), (i, strip.get_height()))
+        battle_sea_cache[key] = strip
+    return strip
+
 def draw_battle_screen():
     """Draw the battle screen with the octopus monster and battle mechanics"""
-    global battle_state, game_state, player_card_counts, current_player, battle_animation_time
+    global battle_state
     
     if battle_state is None:
-        battle_state = BattleState()
+        battle_state = game.start_battle(LAYOUT_WIDTH, LAYOUT_HEIGHT, BATTLE_BOAT_SIZE)
     
-    # Update animation time
-    battle_animation_time += 0.1
+    # Animation time and positions, interpolated between fixed steps and scaled from layout to render pixels
+    anim_time = interpolate(previous_battle_animation_time, battle_animation_time)
+    monster_x = interpolate(battle_state.previous_monster_x, battle_state.monster_x) * RENDER_SCALE
+    monster_y = battle_state.monster_y * RENDER_SCALE
+    monster_size = px(battle_state.monster_size)
+    boat_x = interpolate(battle_state.previous_boat_x, battle_state.boat_x) * RENDER_SCALE
     
     # Fill background with dark sea color
-    screen.fill((0, 45, 98))
+    screen.fill(BATTLE_SEA_COLOR)
     
-    # Draw animated waves
-    wave_height = HEIGHT * 0.85
-    for i in range(WIDTH):
-        x = i
-        y = wave_height + math.sin(battle_animation_time * 0.05 + i * 0.02) * 20
-        pygame.draw.line(screen, WAVE_COLOR, (x, y), (x, HEIGHT))
+    # Draw animated waves by scrolling the pre-rendered band
+    strip = get_battle_sea_strip(WIDTH, HEIGHT)
+    wave_length = 2 * math.pi / BATTLE_WAVE_FREQUENCY
+    scroll = round(anim_time * BATTLE_WAVE_SPEED / BATTLE_WAVE_FREQUENCY % wave_length)
+    screen.blit(strip, (0, HEIGHT - strip.get_height()), (scroll, 0, WIDTH, strip.get_height()))
     
     # Draw battle state specific elements
     if battle_state.state == BATTLE_STATE_INTRO:
         # Draw emerging monster animation
-        emerge_progress = min(1.0, battle_state.intro_timer / 180)
-        monster_y = HEIGHT - (HEIGHT - battle_state.monster_y) * emerge_progress
+        emerge_progress = min(1.0, battle_state.intro_timer / BATTLE_INTRO_STEPS)
+        emerge_y = HEIGHT - (HEIGHT - monster_y) * emerge_progress
         
         # Draw monster (octopus)
-        draw_octopus(battle_state.monster_x, monster_y, battle_state.monster_size)
+        draw_octopus(monster_x, emerge_y, monster_size)
         
         # Draw intro text with enhanced readability
         # Create text background
-        text = title_font.render("Inner Voice Monster Appears!", True, WHITE)
+        text = render_text(title_font, "Inner Voice Monster Appears!", WHITE)
         text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//3))
         
         # Draw text background
         bg_rect = text_rect.copy()
-        bg_rect.inflate_ip(20, 10)
+        bg_rect.inflate_ip(px(20), px(10))
         pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
         
         # Draw text with glow
-        glow_surface = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-        glow_color = (255, 255, 255, 50)
-        glow_text = title_font.render("Inner Voice Monster Appears!", True, glow_color)
-        for offset in range(0, 10, 2):
-            screen.blit(glow_text, (text_rect.x - offset, text_rect.y))
-            screen.blit(glow_text, (text_rect.x + offset, text_rect.y))
-        screen.blit(text, text_rect)
+        draw_glow_text(screen, title_font, "Inner Voice Monster Appears!", WHITE, TITLE_GLOW, text_rect)
     
     elif battle_state.state == BATTLE_STATE_FIGHTING:
         # Draw monster if visible
         if battle_state.monster_visible:
-            draw_octopus(battle_state.monster_x, battle_state.monster_y, 
-                        battle_state.monster_size)
+            draw_octopus(monster_x, monster_y, monster_size)
             
             # Show "Critical Thoughts Attack" with enhanced readability
             if len(battle_state.rocks) > 0:
-                attack_text = game_font.render("Critical Thoughts Attack!", True, (255, 0, 0))
-                text_rect = attack_text.get_rect(centerx=WIDTH//2, y=50)
+                attack_text = render_text(game_font, "Critical Thoughts Attack!", (255, 0, 0))
+                text_rect = attack_text.get_rect(centerx=WIDTH//2, y=px(50))
                 
                 # Draw text background
                 bg_rect = text_rect.copy()
-                bg_rect.inflate_ip(20, 10)
+                bg_rect.inflate_ip(px(20), px(10))
                 pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
                 
                 # Add glow effect
-                glow_surface = pygame.Surface(attack_text.get_size(), pygame.SRCALPHA)
-                for i in range(10):
-                    alpha = int(150 * (1 - i/10))  # Increased alpha for better visibility
-                    color = (255, 0, 0, alpha)
-                    glow_text = game_font.render("Critical Thoughts Attack!", True, color)
-                    screen.blit(glow_text, (text_rect.x - i, text_rect.y))
-                screen.blit(attack_text, text_rect)
+                draw_glow_text(screen, game_font, "Critical Thoughts Attack!", (255, 0, 0), BANNER_GLOW, text_rect)
         
         # Draw rocks with enhanced effects
         for rock in battle_state.rocks:
-            rock.draw(screen)
+            draw_rock(rock)
         
         # Draw flowers
         for flower in battle_state.flowers:
-            flower.draw(screen)
-            # Show "Compassion Attack" with enhanced readability
-            if len(battle_state.flowers) > 0:
-                attack_text = game_font.render("Compassion Attack!", True, (255, 192, 203))
-                text_rect = attack_text.get_rect(centerx=WIDTH//2, bottom=HEIGHT-50)
-                
-                # Draw text background
-                bg_rect = text_rect.copy()
-                bg_rect.inflate_ip(20, 10)
-                pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-                
-                # Add glow effect
-                glow_surface = pygame.Surface(attack_text.get_size(), pygame.SRCALPHA)
-                for i in range(10):
-                    alpha = int(150 * (1 - i/10))  # Increased alpha for better visibility
-                    color = (255, 192, 203, alpha)
-                    glow_text = game_font.render("Compassion Attack!", True, color)
-                    screen.blit(glow_text, (text_rect.x - i, text_rect.y))
-                screen.blit(attack_text, text_rect)
+            draw_flower(flower)
+        
+        # Show "Compassion Attack" with enhanced readability, once however many flowers are out
+        if len(battle_state.flowers) > 0:
+            attack_text = render_text(game_font, "Compassion Attack!", (255, 192, 203))
+            text_rect = attack_text.get_rect(centerx=WIDTH//2, bottom=HEIGHT-px(50))
+            
+            # Draw text background
+            bg_rect = text_rect.copy()
+            bg_rect.inflate_ip(px(20), px(10))
+            pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
+            
+            # Add glow effect
+            draw_glow_text(screen, game_font, "Compassion Attack!", (255, 192, 203), BANNER_GLOW, text_rect)
         
         # Draw boat with wave effect
-        boat_y_offset = math.sin(battle_animation_time * 2) * 5
-        rotated_boat = pygame.transform.rotate(boat_image, 
-                                            math.sin(battle_animation_time) * 5)
-        boat_rect = rotated_boat.get_rect(center=(battle_state.boat_x, 
-                                                 battle_state.boat_y + boat_y_offset))
+        boat_y_offset = math.sin(anim_time * 2) * px(5)
+        rotated_boat = get_rotated_boat(boat_image, math.sin(anim_time) * BOAT_ROCK_ANGLE)
+        boat_rect = rotated_boat.get_rect(center=(boat_x, 
+                                                 battle_state.boat_y * RENDER_SCALE + boat_y_offset))
         screen.blit(rotated_boat, boat_rect)
         
         # Draw health bars
         draw_battle_ui(battle_state)
     
     elif battle_state.state == BATTLE_STATE_WIN:
-        text = title_font.render("You defeated the Inner Voice Monster!", True, GOLD)
+        text = render_text(title_font, "You defeated the Inner Voice Monster!", GOLD)
         text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
         screen.blit(text, text_rect)
         
-        text = game_font.render("Press ESC to continue your journey", True, WHITE)
-        text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2 + 60))
+        text = render_text(game_font, "Press ESC to continue your journey", WHITE)
+        text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2 + px(60)))
         screen.blit(text, text_rect)
-        
-        # Set game as won
-        game_state = GAME_STATE_WINNER
     
     elif battle_state.state == BATTLE_STATE_LOSE:
-        text = title_font.render("The Monster overwhelmed you...", True, RED)
+        text = render_text(title_font, "The Monster overwhelmed you...", RED)
         text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
         screen.blit(text, text_rect)
         
-        text = game_font.render("Press ESC to return to your journey", True, WHITE)
-        text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2 + 60))
+        text = render_text(game_font, "Press ESC to return to your journey", WHITE)
+        text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2 + px(60)))
         screen.blit(text, text_rect)
-        
-        # Reset player's cards
-        player_card_counts[current_player] = {'reflection': 0, 'coping': 0}
-        collected_cards[current_player] = {'reflection': [], 'coping': []}
 
-def draw_octopus(x, y, size):
-    """Draw the octopus monster with enhanced graphics"""
-    # Draw glowing effect
-    glow_radius = size * 0.6 + math.sin(battle_animation_time * 0.1) * 10
+# Static octopus parts keyed by ('glow', radius) and ('body', monster size, detail); tentacles are drawn live
+octopus_sprite_cache = SurfaceCache(OCTOPUS_SPRITE_CACHE_MAX_BYTES)
+
+def build_octopus_glow(glow_radius):
+    """Purple glow behind the octopus, fading towards its center"""
     glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-    for r in range(int(glow_radius), 0, -2):
+    for r in range(glow_radius, 0, -2):
         alpha = int(100 * (r / glow_radius))
         pygame.draw.circle(glow_surface, (128, 0, 128, alpha), 
                          (glow_radius, glow_radius), r)
-    screen.blit(glow_surface, (x - glow_radius, y - glow_radius))
+    return glow_surface.convert_alpha()
 
-    # Draw tentacles with gradient and wave effect
-    for i in range(8):  # Increased number of tentacles
-        angle = i * 45 + math.sin(battle_animation_time * 0.1) * 20
-        length = size * 1.2  # Longer tentacles
-        
-        # Create multiple segments for each tentacle
-        points = []
-        segments = 8  # More segments for smoother tentacles
-        for j in range(segments + 1):
-            progress = j / segments
-            segment_length = length * progress
-            wave_offset = math.sin(battle_animation_time * 0.2 + progress * 4) * (size * 0.2)
-            
-            segment_x = x + math.cos(math.radians(angle)) * segment_length
-            segment_y = y + math.sin(math.radians(angle)) * segment_length
-            
-            # Add wave motion
-            segment_x += math.cos(math.radians(angle + 90)) * wave_offset
-            segment_y += math.sin(math.radians(angle + 90)) * wave_offset
-            
-            points.append((segment_x, segment_y))
-        
-        # Draw tentacle with gradient
-        if len(points) >= 2:
-            for k in range(len(points) - 1):
-                progress = k / (len(points) - 1)
-                thickness = int((1 - progress) * size * 0.2)
-                color = (
-                    128 + int(progress * 40),
-                    0,
-                    128 + int(progress * 40),
-                )
-                pygame.draw.line(screen, color, points[k], points[k + 1], thickness)
-
-    # Draw body with gradient
+def build_octopus_body(size, detail=True):
+    """Octopus body with its eyes on one sprite; without detail the eyes don't glow"""
     body_radius = int(size * 0.5)
+    center = body_radius
     body_surface = pygame.Surface((body_radius * 2, body_radius * 2), pygame.SRCALPHA)
     for r in range(body_radius, 0, -1):
         progress = r / body_radius
@@ -1921,39 +2299,90 @@ def draw_octopus(x, y, size):
             255
         )
         pygame.draw.circle(body_surface, color, (body_radius, body_radius), r)
-    screen.blit(body_surface, (x - body_radius, y - body_radius))
 
-    # Draw eyes with glow
+    # Draw eyes with glow (the glows stay within the body)
     eye_size = size * 0.15
     eye_offset = size * 0.2
     
     # Draw eye glow
-    for eye_x in [x - eye_offset, x + eye_offset]:
-        glow_size = eye_size * 1.5
-        eye_glow = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
-        for r in range(int(glow_size), 0, -1):
-            alpha = int(100 * (r / glow_size))
-            pygame.draw.circle(eye_glow, (255, 0, 0, alpha), 
-                             (glow_size, glow_size), r)
-        screen.blit(eye_glow, (eye_x - glow_size, y - glow_size))
+    if detail:
+        for eye_x in [center - eye_offset, center + eye_offset]:
+            glow_size = eye_size * 1.5
+            eye_glow = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
+            for r in range(int(glow_size), 0, -1):
+                alpha = int(100 * (r / glow_size))
+                pygame.draw.circle(eye_glow, (255, 0, 0, alpha), 
+                                 (glow_size, glow_size), r)
+            body_surface.blit(eye_glow, (eye_x - glow_size, center - glow_size))
     
     # Draw main eyes
-    for eye_x in [x - eye_offset, x + eye_offset]:
-        pygame.draw.circle(screen, (255, 255, 255), (int(eye_x), int(y)), int(eye_size))
-        pygame.draw.circle(screen, (255, 0, 0), (int(eye_x), int(y)), int(eye_size * 0.6))
-        pygame.draw.circle(screen, (0, 0, 0), (int(eye_x), int(y)), int(eye_size * 0.3))
+    for eye_x in [center - eye_offset, center + eye_offset]:
+        pygame.draw.circle(body_surface, (255, 255, 255), (int(eye_x), int(center)), int(eye_size))
+        pygame.draw.circle(body_surface, (255, 0, 0), (int(eye_x), int(center)), int(eye_size * 0.6))
+        pygame.draw.circle(body_surface, (0, 0, 0), (int(eye_x), int(center)), int(eye_size * 0.3))
         # Add highlight
-        pygame.draw.circle(screen, (255, 255, 255), 
-                         (int(eye_x - eye_size * 0.2), int(y - eye_size * 0.2)), 
+        pygame.draw.circle(body_surface, (255, 255, 255), 
+                         (int(eye_x - eye_size * 0.2), int(center - eye_size * 0.2)), 
                          int(eye_size * 0.1))
+    
+    return body_surface.convert_alpha()
+
+def draw_octopus(x, y, size):
+    """Draw the octopus monster with enhanced graphics"""
+    anim_time = interpolate(previous_battle_animation_time, battle_animation_time)
+    detail = quality.settings['octopus_detail']
+    
+    # Draw glowing effect
+    if detail:
+        glow_radius = size * 0.6 + math.sin(anim_time * 0.1) * px(10)
+        glow_radius = max(OCTOPUS_GLOW_STEP, OCTOPUS_GLOW_STEP * round(glow_radius / OCTOPUS_GLOW_STEP))
+        glow = octopus_sprite_cache.get(('glow', glow_radius), lambda: build_octopus_glow(glow_radius))
+        screen.blit(glow, (x - glow_radius, y - glow_radius))
+
+    # Draw tentacles with gradient and wave effect; they move every frame, so they are drawn live
+    for i in range(8):  # Increased number of tentacles
+        angle = i * 45 + math.sin(anim_time * 0.1) * 20
+        length = size * 1.2  # Longer tentacles
+        
+        # Create multiple segments for each tentacle
+        points = []
+        segments = 8 if detail else 2  # More segments for smoother tentacles
+        for j in range(segments + 1):
+            progress = j / segments
+            segment_length = length * progress
+            wave_offset = math.sin(anim_time * 0.2 + progress * 4) * (size * 0.2)
+            
+            segment_x = x + math.cos(math.radians(angle)) * segment_length
+            segment_y = y + math.sin(math.radians(angle)) * segment_length
+            
+            # Add wave motion
+            segment_x += math.cos(math.radians(angle + 90)) * wave_offset
+            segment_y += math.sin(math.radians(angle + 90)) * wave_offset
+            
+            points.append((segment_x, segment_y))
+        
+        # Draw tentacle with gradient
+        for k in range(len(points) - 1):
+            progress = k / (len(points) - 1)
+            thickness = int((1 - progress) * size * 0.2)
+            color = (
+                128 + int(progress * 40),
+                0,
+                128 + int(progress * 40),
+            )
+            pygame.draw.line(screen, color, points[k], points[k + 1], thickness)
+
+    # Draw body and eyes
+    body = octopus_sprite_cache.get(('body', size, detail), lambda: build_octopus_body(size, detail))
+    screen.blit(body, body.get_rect(center=(int(x), int(y))))
 
 def draw_battle_ui(battle_state):
     """Draw the battle UI including health bars and instructions"""
     # Draw boat health
-    health_width = 200
-    health_height = 20
-    health_x = 20
-    health_y = 20
+    health_width = px(200)
+    health_height = px(20)
+    health_x = px(20)
+    health_y = px(20)
     
     pygame.draw.rect(screen, (64, 64, 64), (health_x, health_y, health_width, health_height))
     health_percent = battle_state.boat_health / BOAT_STARTING_HEALTH
@@ -1961,7 +2390,7 @@ def draw_battle_ui(battle_state):
                     (health_x, health_y, health_width * health_percent, health_height))
     
     # Draw monster health
-    monster_health_x = WIDTH - health_width - 20
+    monster_health_x = WIDTH - health_width - px(20)
     pygame.draw.rect(screen, (64, 64, 64), 
                     (monster_health_x, health_y, health_width, health_height))
     monster_health_percent = battle_state.monster_health / MONSTER_HITS_TO_WIN
@@ -1976,16 +2405,41 @@ def draw_battle_ui(battle_state):
         "ESC : Retreat"
     ]
     
-    y = HEIGHT - 100
+    y = HEIGHT - px(100)
     for instruction in instructions:
-        text = instruction_font.render(instruction, True, WHITE)
-        text_rect = text.get_rect(left=20, top=y)
+        text = render_text(instruction_font, instruction, WHITE)
+        text_rect = text.get_rect(left=px(20), top=y)
         screen.blit(text, text_rect)
-        y += 25
+        y += px(25)
+
+def update_simulation():
+    """Advance the game logic and animations by one fixed step"""
+    global battle_animation_time, previous_battle_animation_time
+    if game_state == GAME_STATE_BATTLE:
+        previous_battle_animation_time = battle_animation_time
+        battle_animation_time += 0.1
+        if battle_state:
+            keys = pygame.key.get_pressed()
+            game.battle_tick(keys[pygame.K_RIGHT] - keys[pygame.K_LEFT])
+    elif game_state != GAME_STATE_MENU:
+        update_board_animation()
+        update_boat_move()
+        if isinstance(centered_card, CenteredCard):
+            centered_card.update()
+        for card in animation_cards:
+            card.update()
 
 # Initialize battle button
 battle_button = BattleButton()
 
+# Warm render caches so the first frame doesn't stall
+warm_hex_tile_atlas()
+get_rotated_boat(boat_image, 0, shadow=True)
+get_rotated_boat(boat2_image, 0, shadow=True)
+get_rotated_boat(boat_image, 0)
+get_wave_frames(HEX_SIZE - px(2))
+get_noise_texture(WIDTH, HEIGHT)
+
 # Start background music when game starts
 if background_music is not None:
     background_music.play(-1)
@@ -1995,6 +2449,10 @@ while running:
     close_button_rect = None
     
     for event in pygame.event.get():
+        # Input can change anything on screen, so send the next frame in full
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED):
+            dirty.mark_all()
+        
         if event.type == pygame.QUIT:
             running = False
         
@@ -2002,22 +2460,23 @@ while running:
             if event.button == 1:  # Left click
                 # Get the current close button rect
                 close_button_rect = draw_close_button()
-                if close_button_rect and close_button_rect.collidepoint(event.pos):
+                pos = to_render_pos(event.pos)
+                if close_button_rect and close_button_rect.collidepoint(pos):
                     running = False
                     pygame.quit()
                     sys.exit()
                 
                 # Handle battle button click
-                if game_state == GAME_STATE_PLAYING and battle_button.rect.collidepoint(event.pos):
+                if game_state == GAME_STATE_PLAYING and battle_button.rect.collidepoint(pos):
                     game_state = GAME_STATE_BATTLE
                     battle_messages = ["The battle begins!",
-                                    f"You have {player_card_counts[current_player]['reflection']} reflection cards",
-                                    f"and {player_card_counts[current_player]['coping']} coping cards"]
+                                    f"You have {player_card_counts[game.current_player]['reflection']} reflection cards",
+                                    f"and {player_card_counts[game.current_player]['coping']} coping cards"]
                 
                 # Handle card selection in exchange state
                 if EXCHANGE_STATE == 'selecting' and isinstance(centered_card, ExchangeInterface):
                     for i, card in enumerate(centered_card.cards):
-                        if card['rect'].collidepoint(event.pos):
+                        if card['rect'].collidepoint(pos):
                             centered_card.selected_index = i
                             break
         
@@ -2028,67 +2487,58 @@ while running:
             if game_state == GAME_STATE_MENU:
                 if event.key == pygame.K_1:
                     play_sound(collect_card_sound)
-                    num_players = 1
+                    game.num_players = 1
                     game_state = GAME_STATE_PLAYING
                 elif event.key == pygame.K_2:
                     play_sound(collect_card_sound)
-                    num_players = 2
+                    game.num_players = 2
                     game_state = GAME_STATE_PLAYING
             
             elif game_state == GAME_STATE_PLAYING and event.key == pygame.K_SPACE:
-                if waiting_for_card_interaction or EXCHANGE_STATE == 'moving':
+                if centered_card:
                     handle_card_interaction(event)
-                elif can_roll:
-                    play_sound(dice_roll_sound)
-                    current_roll = roll_dice()
-                    can_roll = False
-                    waiting_for_card_interaction, card_type = move_boat(current_roll)
-                    
-                    if check_boats_meeting():
-                        waiting_for_card_interaction = True
-                        EXCHANGE_STATE = 'selecting'
-                        centered_card = ExchangeInterface(player_card_counts)
-                    elif waiting_for_card_interaction and current_card_symbol:
-                        centered_card = CenteredCard(current_card_symbol, card_type)
-                    else:
-                        can_roll = True
+                elif game.phase == PHASE_ROLL:
+                    move_boat(game.roll())  # Rolling is allowed again once the landing is resolved
             
             elif game_state == GAME_STATE_BATTLE:
                 if event.key == pygame.K_ESCAPE:
                     game_state = GAME_STATE_PLAYING
+                    game.end_battle()
                     battle_state = None
-                elif event.key == pygame.K_SPACE and battle_state and battle_state.state == BATTLE_STATE_FIGHTING:
+                elif event.key == pygame.K_SPACE:
                     # Launch compassion flower
-                    battle_state.flowers.append(CompassionFlower(battle_state.boat_x, battle_state.boat_y - boat_size//2))
+                    game.launch_flower()
+    
+    # Advance the game in fixed steps for the time that has passed
+    for step in range(frame_clock.tick()):
+        update_simulation()
+    
+    # Adjust the quality tier to the measured frame work; tiered caches rebuild from their keys
+    if quality.record(frame_clock.work_time):
+        dirty.mark_all()
     
     # Draw current game state
+    dirty.set_scene(game_state)
+    frame_changed = True
     if game_state == GAME_STATE_MENU:
-        draw_menu()
+        # An idle menu skips rendering and presenting altogether
+        frame_changed = draw_menu()
     elif game_state == GAME_STATE_BATTLE:
-        if battle_state:
-            battle_state.update()
         draw_battle_screen()
+        dirty.mark_all()
     else:
-        draw_game_state()
-        battle_button.update(pygame.mouse.get_pos())
-        battle_button.draw(screen)
-        
-        if waiting_for_card_interaction and centered_card:
-            centered_card.update()
-            centered_card.draw(screen)
+        battle_button.update(get_mouse_pos())
         
-        # Update and draw card animations
-        if animation_cards:
-            for card in animation_cards[:]:
-                card.update()
-                card.draw(screen, pygame.font.Font(None, 20))
-                if not card.moving:
-                    animation_cards.remove(card)
+        # Draw the board screen; its layers include the HUD, the card on display and moving cards
+        draw_game_state()
+        for card in animation_cards[:]:
+            if not card.moving:
+                animation_cards.remove(card)
     
     # Always draw the close button last so it's on top
-    close_button_rect = draw_close_button()
-    pygame.display.flip()
-    pygame.time.Clock().tick(60)
+    if frame_changed:
+        close_button_rect = draw_close_button()
+        dirty.present()
 
 pygame.quit()
 if background_music is not None:
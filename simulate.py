@@ -0,0 +1,247 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import (create_game, Rules, PHASE_ROLL, PHASE_MOVE, PHASE_CARD, PHASE_OVER,
+                    MAX_REFLECTION_CARDS, MAX_COPING_CARDS, WIN_REFLECTION_CARDS, WIN_COPING_CARDS,
+                    COPING_UNLOCK_REFLECTION)
+
+# Defaults match the board main.py plays on
+DEFAULT_ROWS = 9
+DEFAULT_COLS = 9
+DEFAULT_ISLANDS = 10
+DEFAULT_OCTOPUSES = 10
+DEFAULT_MAX_TURNS = 1000  # Rolls after which a game counts as stalled (one player games can never be won)
+DEFAULT_CHUNK_SIZE = 500  # Games per worker task; results only depend on the seed and this, not on the worker count
+
+def choose_exchange_card(game):
+    """Card type the current player takes when the boats meet: whatever they still lack to win, reflection first"""
+    rules = game.rules
+    mine = game.cards[game.current_player]
+    theirs = game.cards[game.other_player()]
+    wanted = []
+    if mine['reflection'] < rules.win_reflection_cards:
+        wanted.append('reflection')
+    if mine['coping'] < rules.win_coping_cards:
+        wanted.append('coping')
+    for card_type in wanted:
+        if theirs[card_type] > 0:
+            return card_type
+    return None
+
+def play_game(game, max_turns):
+    """Play a game out with the automatic policy until somebody wins or max_turns rolls have been taken"""
+    while game.phase != PHASE_OVER:
+        phase = game.phase
+        if phase == PHASE_ROLL:
+            if game.turns >= max_turns:
+                break
+            game.roll()
+        elif phase == PHASE_MOVE:
+            game.move()
+        elif phase == PHASE_CARD:
+            game.resolve_card()
+        else:
+            game.exchange(choose_exchange_card(game))
+    return game
+
+def new_stats():
+    """Empty statistics; merged with merge_stats so workers only ever send back counters"""
+    return {
+        'games': 0,
+        'finished': 0,
+        'wins': Counter(),  # Winner -> games
+        'turns_to_win': Counter(),  # Rolls -> finished games
+        'exchanges': Counter(),  # Boat meetings -> games
+        'reflection_cards': Counter(),  # Final reflection cards -> players
+        'coping_cards': Counter(),  # Final coping cards -> players
+    }
+
+def merge_stats(total, part):
+    total['games'] += part['games']
+    total['finished'] += part['finished']
+    for key in ('wins', 'turns_to_win', 'exchanges', 'reflection_cards', 'coping_cards'):
+        total[key].update(part[key])
+    return total
+
+def run_chunk(chunk_seed, games, settings):
+    """Play a batch of games from one seed stream and count up the results"""
+    rng = random.Random(chunk_seed)
+    rules = Rules(**settings['rules'])
+    stats = new_stats()
+    for _ in range(games):
+        game = create_game(settings['rows'], settings['cols'], settings['islands'], settings['octopuses'],
+                           seed=rng.getrandbits(64), num_players=settings['players'], rules=rules)
+        play_game(game, settings['max_turns'])
+        stats['games'] += 1
+        stats['exchanges'][game.exchanges] += 1
+        if game.winner:
+            stats['finished'] += 1
+            stats['wins'][game.winner] += 1
+            stats['turns_to_win'][game.turns] += 1
+        for player in range(1, settings['players'] + 1):
+            stats['reflection_cards'][game.cards[player]['reflection']] += 1
+            stats['coping_cards'][game.cards[player]['coping']] += 1
+    return stats
+
+def chunk_plan(seed, games, chunk_size):
+    """(chunk seed, games) for every worker task, drawn from one master seed"""
+    master = random.Random(seed)
+    plan = []
+    while games > 0:
+        size = min(chunk_size, games)
+        plan.append((master.getrandbits(64), size))
+        games -= size
+    return plan
+
+def iter_chunk_stats(plan, settings, workers):
+    """Yield each chunk's statistics as soon as it is done"""
+    if workers <= 1:
+        for chunk_seed, games in plan:
+            yield run_chunk(chunk_seed, games, settings)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_chunk, chunk_seed, games, settings) for chunk_seed, games in plan]
+        for future in as_completed(futures):
+            yield future.result()
+
+def histogram_percentile(histogram, fraction):
+    """Smallest value at or below which the given fraction of the counted samples fall"""
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= fraction * total:
+            return value
+
+def histogram_mean(histogram):
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    return sum(value * count for value, count in histogram.items()) / total
+
+def summarize(stats, settings, seconds):
+    """Statistics as plain data: settings, headline numbers and the full histograms"""
+    games = stats['games']
+    turns = stats['turns_to_win']
+    return {
+        'settings': settings,
+        'summary': {
+            'games': games,
+            'finished': stats['finished'],
+            'stalled': games - stats['finished'],
+            'win_rate': stats['finished'] / games if games else None,
+            'mean_turns_to_win': histogram_mean(turns),
+            'median_turns_to_win': histogram_percentile(turns, 0.5),
+            'p90_turns_to_win': histogram_percentile(turns, 0.9),
+            'mean_exchanges': histogram_mean(stats['exchanges']),
+            'games_with_exchange': games - stats['exchanges'][0],
+            'seconds': round(seconds, 3),
+            'games_per_minute': round(games * 60 / seconds) if seconds else None,
+        },
+        'histograms': {key: {str(value): count for value, count in sorted(stats[key].items())}
+                       for key in ('wins', 'turns_to_win', 'exchanges', 'reflection_cards', 'coping_cards')},
+    }
+
+def write_json(report, out):
+    json.dump(report, out, indent=2)
+    out.write('\n')
+
+def write_csv(report, out):
+    """One section,key,value row per setting, headline number and histogram bucket"""
+    writer = csv.writer(out)
+    writer.writerow(['section', 'key', 'value'])
+    for key, value in report['settings'].items():
+        if isinstance(value, dict):
+            for name, setting in value.items():
+                writer.writerow(['settings', f'{key}.{name}', setting])
+        else:
+            writer.writerow(['settings', key, value])
+    for key, value in report['summary'].items():
+        writer.writerow(['summary', key, value])
+    for section, histogram in report['histograms'].items():
+        for key, count in histogram.items():
+            writer.writerow([section, key, count])
+
+WRITERS = {'json': write_json, 'csv': write_csv}
+
+def build_parser(description="Play many headless games in parallel and report card and turn statistics"):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-n', '--games', type=int, default=10000, help="games to play")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help="worker processes (1 plays in this process)")
+    parser.add_argument('--seed', type=int, default=None, help="master seed; the same seed and chunk size give the same statistics")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="games per worker task")
+    parser.add_argument('--players', type=int, choices=(1, 2), default=2)
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--cols', type=int, default=DEFAULT_COLS)
+    parser.add_argument('--islands', type=int, default=DEFAULT_ISLANDS)
+    parser.add_argument('--octopuses', type=int, default=DEFAULT_OCTOPUSES)
+    parser.add_argument('--max-turns', type=int, default=DEFAULT_MAX_TURNS, help="rolls before a game counts as stalled")
+    parser.add_argument('--max-reflection-cards', type=int, default=MAX_REFLECTION_CARDS)
+    parser.add_argument('--max-coping-cards', type=int, default=MAX_COPING_CARDS)
+    parser.add_argument('--win-reflection-cards', type=int, default=WIN_REFLECTION_CARDS)
+    parser.add_argument('--win-coping-cards', type=int, default=WIN_COPING_CARDS)
+    parser.add_argument('--coping-unlock-reflection', type=int, default=COPING_UNLOCK_REFLECTION,
+                        help="reflection cards after which octopuses give coping cards instead of islands giving reflection")
+    parser.add_argument('-f', '--format', choices=sorted(WRITERS), default='json')
+    parser.add_argument('-o', '--output', default='-', help="file to write the statistics to ('-' for stdout)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="no progress on stderr")
+    return parser
+
+def settings_from_args(args):
+    """Plain, picklable simulation settings from parsed arguments, picking a master seed if none was given"""
+    seed = args.seed if args.seed is not None else random.getrandbits(32)
+    return {
+        'games': args.games,
+        'seed': seed,
+        'chunk_size': args.chunk_size,
+        'players': args.players,
+        'rows': args.rows,
+        'cols': args.cols,
+        'islands': args.islands,
+        'octopuses': args.octopuses,
+        'max_turns': args.max_turns,
+        'rules': {
+            'max_reflection_cards': args.max_reflection_cards,
+            'max_coping_cards': args.max_coping_cards,
+            'win_reflection_cards': args.win_reflection_cards,
+            'win_coping_cards': args.win_coping_cards,
+            'coping_unlock_reflection': args.coping_unlock_reflection,
+        },
+    }
+
+def write_report(report, output, file_format):
+    """Write a report to a file, or to stdout for '-'"""
+    if output == '-':
+        WRITERS[file_format](report, sys.stdout)
+    else:
+        with open(output, 'w', newline='') as out:
+            WRITERS[file_format](report, out)
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    settings = settings_from_args(args)
+
+    plan = chunk_plan(settings['seed'], args.games, max(1, args.chunk_size))
+    stats = new_stats()
+    start = time.perf_counter()
+    for part in iter_chunk_stats(plan, settings, args.workers):
+        merge_stats(stats, part)
+        if not args.quiet:
+            print(f"\r{stats['games']}/{args.games} games, {stats['finished']} won", end='', file=sys.stderr)
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    report = summarize(stats, settings, time.perf_counter() - start)
+    write_report(report, args.output, args.format)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from batch_sim import CROSS_CHECK_HISTOGRAMS, CROSS_CHECK_KS, ks_statistic, run_batches
+from simulate import chunk_plan, iter_chunk_stats, merge_stats, new_stats
+
+GAMES = 3000
+SEED = 1234
+
+def small_settings(**rules):
+    return {
+        'games': GAMES,
+        'seed': SEED,
+        'players': 2,
+        'rows': 6,
+        'cols': 7,
+        'islands': 6,
+        'octopuses': 6,
+        'max_turns': 400,
+        'rules': rules,
+    }
+
+def engine_stats(settings):
+    stats = new_stats()
+    for part in iter_chunk_stats(chunk_plan(settings['seed'], settings['games'], 500), settings, workers=1):
+        merge_stats(stats, part)
+    return stats
+
+@pytest.mark.parametrize('rules', [
+    {},
+    {'max_reflection_cards': 3, 'win_reflection_cards': 3, 'win_coping_cards': 3},
+])
+def test_batch_distributions_match_engine(rules):
+    settings = small_settings(**rules)
+    batch = run_batches(settings, batch_size=1000)
+    scalar = engine_stats(settings)
+
+    assert batch['games'] == scalar['games'] == GAMES
+    for key in CROSS_CHECK_HISTOGRAMS:
+        n, m = sum(batch[key].values()), sum(scalar[key].values())
+        limit = CROSS_CHECK_KS * ((n + m) / (n * m)) ** 0.5
+        assert ks_statistic(batch[key], scalar[key]) <= limit, key
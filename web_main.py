@@ -2,40 +2,32 @@ import asyncio
 import pygame
 import sys
 import os
+import main
 from main import *
 
 async def web_main():
     try:
-        # Declare globals
-        global game_state, running, battle_button, background_music
-        global current_player, can_roll, waiting_for_card_interaction
-        global centered_card, animation_cards, battle_state, battle_messages
-        global num_players, current_roll, current_card_symbol, EXCHANGE_STATE
+        # Game state lives in main, whose event handler and draw functions change it, so it is
+        # read and written there; the names copied by the star import would go stale
+        global running
         
         # Initialize Pygame
         pygame.init()
         print("Pygame initialized successfully")
         
         # Set up the display
-        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        screen = open_display()
         pygame.display.set_caption("Sea Journey - Inner Voice Battle")
         print(f"Display set up with size: {WIDTH}x{HEIGHT}")
         
         # Initialize game state variables
-        game_state = GAME_STATE_MENU
+        main.game_state = GAME_STATE_MENU
         running = True
-        battle_button = BattleButton()
-        current_player = 0
-        can_roll = True
-        waiting_for_card_interaction = False
-        centered_card = None
-        animation_cards = []
-        battle_state = None
-        battle_messages = []
-        num_players = 1
-        current_roll = 1
-        current_card_symbol = None
-        EXCHANGE_STATE = 'none'
+        main.centered_card = None
+        main.animation_cards = []
+        main.battle_state = None
+        main.battle_messages = []
+        main.EXCHANGE_STATE = 'none'
         
         print("Game variables initialized")
         
@@ -47,14 +39,17 @@ async def web_main():
         except Exception as e:
             print(f"Music error: {str(e)}")
         
-        clock = pygame.time.Clock()
-        
+        # frame_clock is main's session clock; interpolate() reads its alpha, so this loop's frames are blended too
         while running:
             try:
                 # Store the close button rect for click detection
                 close_button_rect = None
                 
                 for event in pygame.event.get():
+                    # Input can change anything on screen, so send the next frame in full
+                    if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED):
+                        dirty.mark_all()
+                    
                     if event.type == pygame.QUIT:
                         running = False
                     
@@ -62,98 +57,91 @@ async def web_main():
                         if event.button == 1:  # Left click
                             # Get the current close button rect
                             close_button_rect = draw_close_button()
-                            if close_button_rect and close_button_rect.collidepoint(event.pos):
+                            pos = to_render_pos(event.pos)
+                            if close_button_rect and close_button_rect.collidepoint(pos):
                                 running = False
                             
                             # Handle battle button click
-                            if game_state == GAME_STATE_PLAYING and battle_button.rect.collidepoint(event.pos):
-                                game_state = GAME_STATE_BATTLE
-                                battle_messages = ["The battle begins!",
-                                                f"You have {player_card_counts[current_player]['reflection']} reflection cards",
-                                                f"and {player_card_counts[current_player]['coping']} coping cards"]
+                            if main.game_state == GAME_STATE_PLAYING and main.battle_button.rect.collidepoint(pos):
+                                main.game_state = GAME_STATE_BATTLE
+                                main.battle_messages = ["The battle begins!",
+                                                f"You have {player_card_counts[game.current_player]['reflection']} reflection cards",
+                                                f"and {player_card_counts[game.current_player]['coping']} coping cards"]
                             
                             # Handle card selection in exchange state
-                            if EXCHANGE_STATE == 'selecting' and isinstance(centered_card, ExchangeInterface):
-                                for i, card in enumerate(centered_card.cards):
-                                    if card['rect'].collidepoint(event.pos):
-                                        centered_card.selected_index = i
+                            if main.EXCHANGE_STATE == 'selecting' and isinstance(main.centered_card, ExchangeInterface):
+                                for i, card in enumerate(main.centered_card.cards):
+                                    if card['rect'].collidepoint(pos):
+                                        main.centered_card.selected_index = i
                                         break
                     
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_m:  # Add music toggle with 'M' key
                             toggle_music()
                         
-                        if game_state == GAME_STATE_MENU:
+                        if main.game_state == GAME_STATE_MENU:
                             if event.key == pygame.K_1:
                                 play_sound(collect_card_sound)
-                                num_players = 1
-                                game_state = GAME_STATE_PLAYING
+                                game.num_players = 1
+                                main.game_state = GAME_STATE_PLAYING
                             elif event.key == pygame.K_2:
                                 play_sound(collect_card_sound)
-                                num_players = 2
-                                game_state = GAME_STATE_PLAYING
+                                game.num_players = 2
+                                main.game_state = GAME_STATE_PLAYING
                         
-                        elif game_state == GAME_STATE_PLAYING and event.key == pygame.K_SPACE:
-                            if waiting_for_card_interaction or EXCHANGE_STATE == 'moving':
+                        elif main.game_state == GAME_STATE_PLAYING and event.key == pygame.K_SPACE:
+                            if main.centered_card:
                                 handle_card_interaction(event)
-                            elif can_roll:
-                                play_sound(dice_roll_sound)
-                                current_roll = roll_dice()
-                                can_roll = False
-                                waiting_for_card_interaction, card_type = move_boat(current_roll)
-                                
-                                if check_boats_meeting():
-                                    waiting_for_card_interaction = True
-                                    EXCHANGE_STATE = 'selecting'
-                                    centered_card = ExchangeInterface(player_card_counts)
-                                elif waiting_for_card_interaction and current_card_symbol:
-                                    centered_card = CenteredCard(current_card_symbol, card_type)
-                                else:
-                                    can_roll = True
+                            elif game.phase == PHASE_ROLL:
+                                move_boat(game.roll())  # Rolling is allowed again once the landing is resolved
                         
-                        elif game_state == GAME_STATE_BATTLE:
+                        elif main.game_state == GAME_STATE_BATTLE:
                             if event.key == pygame.K_ESCAPE:
-                                game_state = GAME_STATE_PLAYING
-                                battle_state = None
-                            elif event.key == pygame.K_SPACE and battle_state and battle_state.state == BATTLE_STATE_FIGHTING:
+                                main.game_state = GAME_STATE_PLAYING
+                                game.end_battle()
+                                main.battle_state = None
+                            elif event.key == pygame.K_SPACE:
                                 # Launch compassion flower
-                                battle_state.flowers.append(CompassionFlower(battle_state.boat_x, battle_state.boat_y - boat_size//2))
+                                game.launch_flower()
+                
+                # Advance the game in fixed steps for the time that has passed
+                for step in range(frame_clock.tick()):
+                    update_simulation()
+                
+                # Adjust the quality tier to the measured frame work; tiered caches rebuild from their keys
+                if quality.record(frame_clock.work_time):
+                    dirty.mark_all()
                 
-                # Fill screen with background color
-                screen.fill((200, 200, 200))  # Light gray background
+                # Fill screen with background color (the menu paints its own cached frame)
+                if main.game_state != GAME_STATE_MENU:
+                    screen.fill((200, 200, 200))  # Light gray background
                 
                 # Draw current game state
-                if game_state == GAME_STATE_MENU:
-                    draw_menu()
-                    print("Drawing menu")
-                elif game_state == GAME_STATE_BATTLE:
-                    if battle_state:
-                        battle_state.update()
+                dirty.set_scene(main.game_state)
+                frame_changed = True
+                if main.game_state == GAME_STATE_MENU:
+                    # An idle menu skips rendering and presenting altogether
+                    frame_changed = draw_menu()
+                    if frame_changed:
+                        print("Drawing menu")
+                elif main.game_state == GAME_STATE_BATTLE:
                     draw_battle_screen()
+                    dirty.mark_all()
                     print("Drawing battle screen")
                 else:
+                    main.battle_button.update(get_mouse_pos())
+
+                    # Draw the board screen; its layers include the HUD, the card on display and moving cards
                     draw_game_state()
-                    battle_button.update(pygame.mouse.get_pos())
-                    battle_button.draw(screen)
                     print("Drawing game state")
-                    
-                    if waiting_for_card_interaction and centered_card:
-                        centered_card.update()
-                        centered_card.draw(screen)
-                    
-                    # Update and draw card animations
-                    if animation_cards:
-                        for card in animation_cards[:]:
-                            card.update()
-                            card.draw(screen, pygame.font.Font(None, 20))
-                            if not card.moving:
-                                animation_cards.remove(card)
+                    for card in main.animation_cards[:]:
+                        if not card.moving:
+                            main.animation_cards.remove(card)
                 
                 # Always draw the close button last so it's on top
-                close_button_rect = draw_close_button()
-                
-                pygame.display.flip()
-                clock.tick(60)  # Limit to 60 FPS
+                if frame_changed:
+                    close_button_rect = draw_close_button()
+                    dirty.present()
                 
                 await asyncio.sleep(0)  # Required for web compatibility
                 